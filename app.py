@@ -1,82 +1,169 @@
 # [Main] Flask 실행 파일 (라우팅 정의)
 # 파일 위치: app.py
 
-from flask import Flask, render_template, jsonify, request, send_file
-from modules import visualizer, static_data
+from flask import Flask, render_template, jsonify, request, Response
+from werkzeug.security import safe_join
+import config
+from modules import visualizer, static_data, startup_assets, http_cache, team_metrics, player_percentiles, render_cache
+from modules import pythagorean, chart_data, chart_output, head_to_head, metrics, render_service, player_search
+from modules import player_leaders
 
 app = Flask(__name__)
 
-# 앱 시작 시 그래프 및 표 이미지 생성
-visualizer.create_ranking_graph()
-visualizer.create_team_radar_charts()
-visualizer.create_waa_table_images()
-visualizer.create_match_record_images()
+# 앱 시작 시 그래프 및 표 이미지 생성 (프로세스 풀로 병렬 처리)
+# config.STARTUP_ASSET_MODE = 'lazy'이면 처음 요청될 때 생성
+startup_assets.build_startup_assets()
+
+# 선수 비교 그래프 / 형식별 차트 디스크 캐시 정리
+visualizer.sweep_comparison_cache()
+visualizer.sweep_chart_variant_cache()
+
+# 모든 템플릿에서 차트 렌더링 위치(서버 PNG / 브라우저)를 알 수 있도록 전달
+@app.context_processor
+def inject_chart_mode():
+    return {'client_charts': config.CLIENT_SIDE_CHARTS}
+
+# 요청 처리 시간 측정 시작 (라우트 이름 = endpoint, 없는 경로는 'not_found')
+@app.before_request
+def start_request_metrics():
+    metrics.begin_request(request.endpoint or 'not_found')
+
+# 요청 처리 시간 기록 + Server-Timing 헤더 (단계별 ms)
+@app.after_request
+def finish_request_metrics(response):
+    timing = metrics.end_request(request.method, response.status_code)
+    if timing is not None and config.METRICS_SERVER_TIMING:
+        response.headers['Server-Timing'] = metrics.server_timing(*timing)
+    return response
+
+def render_page(template_name, **context):
+    # render_template + 템플릿 렌더링 시간 기록 (단계 'template')
+    with metrics.phase('template'):
+        return render_template(template_name, **context)
+
+def _static_file_path():
+    filename = (request.view_args or {}).get('filename', '')
+    return filename, safe_join(app.static_folder, filename)
+
+# static 요청 전처리
+# 1) 요청된 시작 이미지가 아직 없으면 먼저 생성 (lazy 모드)
+# 2) 브라우저가 가진 파일과 내용이 같으면(ETag 일치) 파일을 열지 않고 304 응답
+@app.before_request
+def prepare_static_file():
+    if request.endpoint != 'static':
+        return None
+    filename, path = _static_file_path()
+    startup_assets.ensure_asset(filename)
+    if path and http_cache.is_not_modified(http_cache.file_etag(path)):
+        return http_cache.not_modified(http_cache.file_etag(path), http_cache.static_family(filename))
+    return None
+
+# static 응답에 파일 내용 기반 ETag와 경로 종류별 Cache-Control 설정
+@app.after_request
+def add_static_cache_headers(response):
+    if request.endpoint == 'static' and response.status_code == 200:
+        filename, path = _static_file_path()
+        etag = http_cache.file_etag(path) if path else None
+        http_cache.apply_headers(response, etag, http_cache.static_family(filename))
+    return response
 
 # 1. 메인 페이지
 @app.route('/')
 def index():
     ranking_list = static_data.get_team_rank_data_from_json()
-    return render_template('index.html', ranking_list=ranking_list)
+    return render_page('index.html', ranking_list=ranking_list)
 
 # 2. 팀 비교 분석 페이지 (팀 대 팀)
 @app.route('/analysis')
 def analysis():
     ranking_list = static_data.get_team_rank_data_from_json()
     team_names = [team['name'] for team in ranking_list]
-    return render_template('analysis.html', team_names=team_names)
+    return render_page('analysis.html', team_names=team_names)
 
 # 3. 선수 대 선수 비교 페이지 (화면 표시)
 @app.route('/player_compare')
 def player_compare_page(): # 함수 이름 변경 (중복 방지)
     team_list = static_data.get_team_rank_data_from_json()
     team_names = [team['name'] for team in team_list]
-    return render_template('player_compare.html', team_names=team_names)
+    return render_page('player_compare.html', team_names=team_names)
 
 # 4. 팀 상세 페이지
 @app.route('/team/<team_name>')
 def team_detail(team_name):
-    team_data = static_data.get_specific_team_data(team_name)
-    player_list = static_data.get_players_by_team(team_name)
+    with metrics.phase('index_lookup'):
+        team_data = static_data.get_specific_team_data(team_name)
+        player_list = static_data.get_players_by_team(team_name)
     
     pyth_result = None 
 
     if team_data:
-        lat = team_data.get('Latitude')
-        lon = team_data.get('Longitude')
-        stadium = team_data.get('Stadium', '홈구장')
-        if lat and lon:
-            visualizer.create_stadium_map(team_name, lat, lon, stadium)
-            
-        # 득점/실점 그래프
-        visualizer.create_team_runs_chart(team_name, team_data)
-
-        # 피타고리안 승률 그래프
-        pyth_result = visualizer.create_pythagorean_chart(team_name, team_data)
+        # 홈구장 지도는 /map/<team_name> 페이지가 좌표만으로 그림 (요청마다 folium 렌더링 없음)
+
+        # 기대 승률 분석 문구는 그래프와 같은 데이터로 바로 계산 (그래프 완료를 기다리지 않음)
+        series = chart_data.pythagorean_series(team_name, team_data)
+        pyth_result = (series['values'][0], series['analysis'], series['desc'])
+
+        # 브라우저 렌더링 모드에서는 /api/chart/... 데이터로 직접 그리므로 PNG는 만들지 않음
+        pending = set()
+        if not config.CLIENT_SIDE_CHARTS:
+            # 오각형 차트(lazy 모드에서는 여기서 처음 생성), 득점/실점 그래프, 피타고리안 승률 그래프
+            # 백그라운드에서 그리고, 대기 시간 안에 끝나지 않은 차트는 자리 표시 이미지로 응답
+            radar_file = f'image/radar/radar_{team_name}.png'
+            pending = render_service.render_assets({
+                radar_file: (startup_assets.ensure_asset, (radar_file,)),
+                f'image/team_chart/runs_chart_{team_name}.png': (visualizer.create_team_runs_chart, (team_name, team_data)),
+                f'image/team_chart/pythagorean_{team_name}.png': (visualizer.create_pythagorean_chart, (team_name, team_data)),
+            })
         
-        return render_template('team_detail.html', 
+        return render_page('team_detail.html', 
                                team=team_data, 
                                team_name=team_name, 
                                players=player_list,
-                               pyth_data=pyth_result)
+                               pyth_data=pyth_result,
+                               pending_charts=pending)
     else:
         return "팀 데이터를 찾을 수 없습니다.", 404
 
+# 4-1. 팀 홈구장 지도 (팀 페이지 iframe용)
+@app.route('/map/<team_name>')
+def stadium_map(team_name):
+    team_data = static_data.get_specific_team_data(team_name)
+    if not team_data or not team_data.get('Latitude') or not team_data.get('Longitude'):
+        return "지도 정보를 찾을 수 없습니다.", 404
+
+    lat = team_data['Latitude']
+    lon = team_data['Longitude']
+    stadium = team_data.get('Stadium', '홈구장')
+
+    # 좌표/구장 이름이 바뀔 때만 ETag가 바뀜
+    etag = render_cache.make_key('stadium_map', {'team': team_name, 'lat': lat, 'lon': lon, 'stadium': stadium})
+    if http_cache.is_not_modified(etag):
+        return http_cache.not_modified(etag, 'generated')
+
+    html = render_page('stadium_map.html', team_name=team_name, lat=lat, lon=lon, stadium=stadium)
+    return http_cache.conditional(Response(html, mimetype='text/html'), etag, 'generated')
+
 # 5. 선수 상세 페이지 (개인 프로필)
 @app.route('/player/<int:player_id>')
 def player_detail(player_id):
-    player_data = static_data.get_player_by_id(player_id)
+    with metrics.phase('index_lookup'):
+        player_data = static_data.get_player_by_id(player_id)
+        team_symbol = static_data.get_team_symbol(player_data['Team']) if player_data else ''
     
     if player_data:
-        team_symbol = static_data.get_team_symbol(player_data['Team'])
-        
-        # 그래프 3종 생성
-        visualizer.create_player_war_chart(player_data)
-        visualizer.create_player_offensive_chart(player_data)
-        visualizer.create_player_detail_chart(player_data)
+        # 그래프 3종 백그라운드 생성 (브라우저 렌더링 모드에서는 생략)
+        pending = set()
+        if not config.CLIENT_SIDE_CHARTS:
+            pending = render_service.render_assets({
+                f'image/player_chart/war_chart_{player_id}.png': (visualizer.create_player_war_chart, (player_data,)),
+                f'image/player_chart/offensive_chart_{player_id}.png': (visualizer.create_player_offensive_chart, (player_data,)),
+                f'image/player_chart/detail_chart_{player_id}.png': (visualizer.create_player_detail_chart, (player_data,)),
+            })
         
-        return render_template('player_detail.html', 
+        return render_page('player_detail.html', 
                                player=player_data, 
-                               team_symbol=team_symbol)
+                               team_symbol=team_symbol,
+                               pending_charts=pending)
     else:
         return "선수 정보를 찾을 수 없습니다.", 404
 
@@ -85,31 +172,349 @@ def player_detail(player_id):
 # [API] 특정 팀의 선수 목록 반환
 @app.route('/api/players/<team_name>')
 def get_players_json(team_name):
+    etag = http_cache.data_etag('players', team_name)
+    last_modified = http_cache.data_last_modified()
+    if http_cache.is_not_modified(etag):
+        return http_cache.not_modified(etag, 'api', last_modified)
+
     players = static_data.get_players_by_team(team_name)
     player_simple_list = [{'Id': p['Id'], 'Name': p['Name'], 'Pos': p['Pos.']} for p in players]
-    return jsonify(player_simple_list)
+    return http_cache.conditional(jsonify(player_simple_list), etag, 'api', last_modified)
 
 # [API] 특정 선수의 상세 정보 반환
 @app.route('/api/player/<int:player_id>')
 def get_player_detail_json(player_id):
+    etag = http_cache.data_etag('player', player_id)
+    last_modified = http_cache.data_last_modified()
+    if http_cache.is_not_modified(etag):
+        return http_cache.not_modified(etag, 'api', last_modified)
+
     player = static_data.get_player_by_id(player_id)
     if player:
         team_symbol = static_data.get_team_symbol(player['Team'])
         player['TeamSymbol'] = team_symbol
-        return jsonify(player)
+        return http_cache.conditional(jsonify(player), etag, 'api', last_modified)
     return jsonify({'error': 'Not found'}), 404
 
+# [API] 선수 스탯별 리그 백분위/순위 (?min_pa=최소 타석)
+@app.route('/api/player/<int:player_id>/percentiles')
+def get_player_percentiles_json(player_id):
+    min_pa = request.args.get('min_pa', type=int)
+    etag = http_cache.data_etag('player_percentiles', player_id, min_pa)
+    last_modified = http_cache.data_last_modified()
+    if http_cache.is_not_modified(etag):
+        return http_cache.not_modified(etag, 'api', last_modified)
+
+    player = static_data.get_player_by_id(player_id)
+    if not player:
+        return jsonify({'error': 'Not found'}), 404
+
+    engine = player_percentiles.get_player_percentiles(min_pa)
+    result = {
+        'Id': player_id,
+        'Name': player['Name'],
+        'min_pa': engine.min_pa,
+        'pool_size': engine.pool_size,
+        'stats': engine.player_report(player),
+    }
+    return http_cache.conditional(jsonify(result), etag, 'api', last_modified)
+
+# [API] 선수 검색 (?q=검색어&limit=&offset=, 이름 접두어/부분 문자열/초성, 출신교/지명 정보)
+@app.route('/api/search')
+def search_players_json():
+    query = request.args.get('q', '')
+    limit = request.args.get('limit', config.PLAYER_SEARCH_LIMIT, type=int)
+    limit = max(1, min(limit, config.PLAYER_SEARCH_MAX_LIMIT))
+    offset = max(0, request.args.get('offset', 0, type=int))
+    etag = http_cache.data_etag('search', query, limit, offset)
+    last_modified = http_cache.data_last_modified()
+    if http_cache.is_not_modified(etag):
+        return http_cache.not_modified(etag, 'api', last_modified)
+
+    with metrics.phase('index_lookup'):
+        total, results = player_search.get_player_search().search(query, limit, offset)
+    payload = {'query': query, 'total': total, 'offset': offset, 'results': results}
+    return http_cache.conditional(jsonify(payload), etag, 'api', last_modified)
+
+# [API] 리그 스탯 순위 (?stat=HR&n=20&offset=&min_pa=&pos=&order=desc|asc&ties=1)
+@app.route('/api/leaders')
+def get_leaders_json():
+    stat = request.args.get('stat', 'WAR')
+    n = max(1, min(request.args.get('n', config.PLAYER_LEADERS_LIMIT, type=int), config.PLAYER_LEADERS_MAX_LIMIT))
+    offset = max(0, request.args.get('offset', 0, type=int))
+    min_pa = request.args.get('min_pa', type=int)
+    pos = request.args.get('pos') or None
+    order = request.args.get('order', 'desc')
+    include_ties = request.args.get('ties', '0').lower() in ('1', 'true', 'yes')
+    if order not in ('desc', 'asc'):
+        return jsonify({'error': 'Invalid order'}), 400
+
+    etag = http_cache.data_etag('leaders', stat, n, offset, min_pa, pos, order, include_ties)
+    last_modified = http_cache.data_last_modified()
+    if http_cache.is_not_modified(etag):
+        return http_cache.not_modified(etag, 'api', last_modified)
+
+    with metrics.phase('index_lookup'):
+        if pos is not None and pos not in static_data.get_player_index().by_pos:
+            return jsonify({'error': 'Unknown position'}), 400
+        min_pa = player_leaders.resolve_min_pa(min_pa)
+        leaders = player_leaders.get_player_leaders()
+        page = leaders.page(stat, n, offset, order == 'desc', include_ties, min_pa, pos)
+    if page is None:
+        return jsonify({'error': 'Unknown stat', 'stats': list(leaders.stats)}), 400
+
+    total, results = page
+    next_offset = offset + len(results)
+    payload = {
+        'stat': stat,
+        'order': order,
+        'min_pa': min_pa,
+        'pos': pos,
+        'pool_size': leaders.pool_size(min_pa, pos),
+        'total': total,
+        'offset': offset,
+        'next_offset': next_offset if next_offset < total else None,
+        'leaders': results,
+    }
+    return http_cache.conditional(jsonify(payload), etag, 'api', last_modified)
+
+# [API] 팀 지표 (원래 값 + min-max / z-score / 백분위 정규화)
+@app.route('/api/team/<team_name>/metrics')
+def get_team_metrics_json(team_name):
+    etag = http_cache.data_etag('team_metrics', team_name)
+    last_modified = http_cache.data_last_modified()
+    if http_cache.is_not_modified(etag):
+        return http_cache.not_modified(etag, 'api', last_modified)
+
+    report = team_metrics.get_team_metrics().team_report(team_name)
+    if report is None:
+        return jsonify({'error': 'Not found'}), 404
+    return http_cache.conditional(jsonify({'team': team_name, 'metrics': report}), etag, 'api', last_modified)
+
+# [API] 전체 팀 피타고리안 기대 승률 (?exponent=1.83 | pythagenpat | fitted)
+@app.route('/api/pythagorean')
+def get_pythagorean_json():
+    return _pythagorean_response(None)
+
+# [API] 특정 팀 피타고리안 기대 승률
+@app.route('/api/team/<team_name>/pythagorean')
+def get_team_pythagorean_json(team_name):
+    return _pythagorean_response(team_name)
+
+def _pythagorean_response(team_name):
+    method = request.args.get('exponent')
+    try:
+        method = pythagorean.normalize_method(method)
+    except ValueError:
+        return jsonify({'error': 'Invalid exponent'}), 400
+
+    etag = http_cache.data_etag('pythagorean', team_name, method)
+    last_modified = http_cache.data_last_modified()
+    if http_cache.is_not_modified(etag):
+        return http_cache.not_modified(etag, 'api', last_modified)
+
+    table = pythagorean.get_pythagorean_table(method)
+    if team_name is None:
+        payload = {'method': method, 'teams': table.all()}
+    else:
+        payload = table.team(team_name)
+        if payload is None:
+            return jsonify({'error': 'Not found'}), 404
+        payload = dict(payload, method=method)
+    return http_cache.conditional(jsonify(payload), etag, 'api', last_modified)
+
+# [API] 리그 전체 상대 전적 행렬 (팀 x 상대팀 승/패/무/승률)
+@app.route('/api/h2h')
+def get_h2h_json():
+    etag = http_cache.data_etag('h2h')
+    last_modified = http_cache.data_last_modified()
+    if http_cache.is_not_modified(etag):
+        return http_cache.not_modified(etag, 'api', last_modified)
+    return http_cache.conditional(jsonify(head_to_head.get_head_to_head().to_dict()), etag, 'api', last_modified)
+
+# [API] 두 팀의 상대 전적 (a 기준 전적과 b 기준 전적)
+@app.route('/api/h2h/<team_a>/<team_b>')
+def get_h2h_pair_json(team_a, team_b):
+    etag = http_cache.data_etag('h2h', team_a, team_b)
+    last_modified = http_cache.data_last_modified()
+    if http_cache.is_not_modified(etag):
+        return http_cache.not_modified(etag, 'api', last_modified)
+
+    h2h = head_to_head.get_head_to_head()
+    record = h2h.pair(team_a, team_b)
+    if record is None:
+        return jsonify({'error': 'Not found'}), 404
+    payload = {'record': record, 'reverse': h2h.pair(team_b, team_a)}
+    return http_cache.conditional(jsonify(payload), etag, 'api', last_modified)
+
+# [API] 차트 데이터 (PNG 차트가 그리는 값과 같은 데이터, 브라우저 렌더링용)
+def _chart_response(etag_parts, build):
+    etag = http_cache.data_etag('chart', *etag_parts)
+    last_modified = http_cache.data_last_modified()
+    if http_cache.is_not_modified(etag):
+        return http_cache.not_modified(etag, 'api', last_modified)
+
+    series = build()
+    if series is None:
+        return jsonify({'error': 'Not found'}), 404
+    return http_cache.conditional(jsonify(series), etag, 'api', last_modified)
+
+def _team_chart(team_name, build):
+    team_data = static_data.get_specific_team_data(team_name)
+    return build(team_data) if team_data else None
+
+def _player_chart(player_id, build):
+    player = static_data.get_player_by_id(player_id)
+    return build(player) if player else None
+
+@app.route('/api/chart/ranking')
+def chart_ranking_json():
+    return _chart_response(['ranking'], chart_data.ranking_series)
+
+@app.route('/api/chart/h2h')
+def chart_h2h_json():
+    return _chart_response(['h2h'], chart_data.h2h_series)
+
+@app.route('/api/chart/radar/<team_name>')
+def chart_radar_json(team_name):
+    return _chart_response(['radar', team_name], lambda: chart_data.team_radar_series(team_name))
+
+@app.route('/api/chart/waa_table/<team_name>')
+def chart_waa_table_json(team_name):
+    return _chart_response(['waa_table', team_name], lambda: chart_data.waa_table_series(team_name))
+
+@app.route('/api/chart/record/<team_name>/<opp_name>')
+def chart_record_json(team_name, opp_name):
+    return _chart_response(['record', team_name, opp_name],
+                           lambda: chart_data.match_record_series(team_name, opp_name))
+
+@app.route('/api/chart/runs/<team_name>')
+def chart_runs_json(team_name):
+    return _chart_response(['runs', team_name],
+                           lambda: _team_chart(team_name, chart_data.team_runs_series))
+
+@app.route('/api/chart/pythagorean/<team_name>')
+def chart_pythagorean_json(team_name):
+    return _chart_response(['pythagorean', team_name],
+                           lambda: _team_chart(team_name, lambda t: chart_data.pythagorean_series(team_name, t)))
+
+@app.route('/api/chart/player_war/<int:player_id>')
+def chart_player_war_json(player_id):
+    return _chart_response(['player_war', player_id],
+                           lambda: _player_chart(player_id, chart_data.player_war_series))
+
+@app.route('/api/chart/player_offensive/<int:player_id>')
+def chart_player_offensive_json(player_id):
+    return _chart_response(['player_offensive', player_id],
+                           lambda: _player_chart(player_id, chart_data.player_offensive_series))
+
+@app.route('/api/chart/player_detail/<int:player_id>')
+def chart_player_detail_json(player_id):
+    return _chart_response(['player_detail', player_id],
+                           lambda: _player_chart(player_id, chart_data.player_detail_series))
+
+@app.route('/api/chart/compare/<int:p1_id>/<int:p2_id>')
+def chart_compare_json(p1_id, p2_id):
+    def build():
+        p1 = static_data.get_player_by_id(p1_id)
+        p2 = static_data.get_player_by_id(p2_id)
+        return chart_data.player_comparison_series(p1, p2) if p1 and p2 else None
+    # 순서와 관계없이 같은 데이터이므로 ETag도 같게
+    return _chart_response(['compare', min(p1_id, p2_id), max(p1_id, p2_id)], build)
+
 # [API] 선수 비교 그래프 이미지 반환
 @app.route('/plot/compare/<int:p1_id>/<int:p2_id>')
 def plot_comparison(p1_id, p2_id):
-    p1 = static_data.get_player_by_id(p1_id)
-    p2 = static_data.get_player_by_id(p2_id)
+    with metrics.phase('index_lookup'):
+        p1 = static_data.get_player_by_id(p1_id)
+        p2 = static_data.get_player_by_id(p2_id)
     
     if p1 and p2:
-        filename = visualizer.create_player_comparison_chart(p1, p2)
-        return send_file(f'static/image/comparison/{filename}', mimetype='image/png')
+        try:
+            fmt, profile, negotiated = _chart_image_request()
+        except ValueError:
+            return "Invalid format or profile", 400
+        if (fmt, profile) != ('png', config.CHART_DEFAULT_PROFILE):
+            series = chart_data.player_comparison_series(p1, p2)
+            return _chart_image_response('compare', series, fmt, profile, negotiated)
+
+        # ETag는 그래프 입력 값의 해시 (같으면 그리지 않고 304)
+        etag = visualizer.comparison_cache_key(p1, p2)
+        if http_cache.is_not_modified(etag):
+            response = http_cache.not_modified(etag, 'plot')
+        else:
+            # 디스크를 거치지 않고 메모리에서 그린 PNG를 바로 응답 (최근 쌍은 LRU 캐시)
+            png = visualizer.get_player_comparison_png(p1, p2)
+            response = http_cache.conditional(Response(png, mimetype='image/png'), etag, 'plot')
+        if negotiated:
+            response.vary.add('Accept')
+        return response
     else:
         return "Error", 404
 
+# [API] 형식/크기를 지정한 차트 이미지
+# 예: /plot/radar/LG?format=svg, /plot/player_war/10387?profile=retina
+# format이 없으면 Accept 헤더로 결정 (WebP를 받는 브라우저에는 WebP)
+@app.route('/plot/<chart>', defaults={'subject': ''})
+@app.route('/plot/<chart>/<path:subject>')
+def plot_chart(chart, subject):
+    series = chart_data.get_series(chart, *[a for a in subject.split('/') if a])
+    if series is None:
+        return "Error", 404
+    try:
+        fmt, profile, negotiated = _chart_image_request()
+    except ValueError:
+        return "Invalid format or profile", 400
+    return _chart_image_response(chart, series, fmt, profile, negotiated)
+
+def _chart_image_request():
+    # (형식, 프로필, Accept로 정했는지 여부). 지원하지 않는 값이면 ValueError
+    fmt = request.args.get('format')
+    negotiated = fmt is None
+    if negotiated:
+        fmt = chart_output.negotiate_format(request.accept_mimetypes)
+    return chart_output.resolve_format(fmt), chart_output.resolve_profile(request.args.get('profile')), negotiated
+
+def _chart_image_response(chart, series, fmt, profile, negotiated):
+    # ETag는 입력 값 + 형식 + 프로필의 해시 (같으면 그리지 않고 304)
+    etag = visualizer.chart_variant_key(chart, series, fmt, profile)
+    if http_cache.is_not_modified(etag):
+        response = http_cache.not_modified(etag, 'plot')
+    else:
+        data, _ = visualizer.get_chart_variant(chart, series, fmt, profile)
+        response = http_cache.conditional(Response(data, mimetype=chart_output.FORMATS[fmt]), etag, 'plot')
+    if negotiated:
+        response.vary.add('Accept')
+    return response
+
+# [API] 백그라운드 렌더링 중인 차트의 상태 (?file=static 기준 경로)
+# pending이면 202, 완료(ready)/실패(failed)면 200, 기록도 파일도 없으면 404
+@app.route('/api/render/status')
+def render_status():
+    filename = request.args.get('file', '')
+    path = safe_join(app.static_folder, filename) if filename else None
+    status = render_service.asset_status(filename, path)
+    code = {'pending': 202, 'missing': 404}.get(status, 200)
+    response = jsonify({'file': filename, 'status': status})
+    response.headers['Cache-Control'] = 'no-store'
+    return response, code
+
+# [운영] 요청/단계별 처리 시간, 캐시 적중, 차트 렌더링 횟수 (Prometheus 텍스트 형식)
+@app.route('/metrics')
+def metrics_endpoint():
+    if not config.METRICS_ENABLED:
+        return "Not found", 404
+    return Response(metrics.render_prometheus(), mimetype='text/plain; version=0.0.4')
+
+# [API] 선수 비교 그래프 캐시 통계
+@app.route('/api/cache/compare')
+def comparison_cache_stats():
+    return jsonify(visualizer.get_comparison_cache_stats())
+
+# [API] 형식/프로필별 차트 이미지 캐시 통계
+@app.route('/api/cache/charts')
+def chart_variant_cache_stats():
+    return jsonify(visualizer.get_chart_variant_cache_stats())
+
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,233 @@
+# [Bench] 프로세스 안에서 측정하는 벤치마크 항목 (데이터 조회, 차트 생성, 라우트 응답)
+# benchmarks/run.py가 임시 작업 폴더에 복사한 프로젝트 안에서 이 모듈을 실행합니다.
+# (작업 폴더의 생성 이미지/캐시를 지우고 다시 만들기 때문에 원본 폴더에서 직접 실행하지 않습니다.)
+#
+#   python -m benchmarks.cases --groups accessors,charts,routes --repeat 5 --cold-repeat 3 --output out.json
+#
+# - cold: 캐시를 모두 비운 직후 첫 호출 (데이터 스냅샷 재로드, 생성 이미지 삭제, 메모리 캐시 비움)
+# - warm: 같은 호출을 반복했을 때의 1회당 시간
+
+import argparse
+import gc
+import json
+import os
+import shutil
+import statistics
+import sys
+import time
+
+import config
+
+GROUPS = ('accessors', 'charts', 'routes')
+
+# warm 측정에서 표본 1개가 최소한 이 시간(초) 이상 걸리도록 반복 횟수를 늘립니다. (타이머 오차 감소)
+MIN_SAMPLE_TIME = 0.02
+MAX_LOOPS = 10000
+
+# 여러 장을 한 번에 그리는 함수는 오래 걸리므로 warm 표본을 1개만 측정
+BATCH_CHART_FUNCTIONS = {'create_team_radar_charts', 'create_waa_table_images', 'create_match_record_images'}
+
+# --- 캐시 초기화 ---
+
+def reset_generated_files(static_dir=None):
+    """static 폴더에서 생성된 파일(config.GENERATED_STATIC_PREFIXES)을 모두 지웁니다."""
+    static_dir = static_dir or os.path.join(config.BASE_DIR, 'static')
+    for prefix in config.GENERATED_STATIC_PREFIXES:
+        path = os.path.join(static_dir, prefix)
+        if prefix.endswith('/'):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.exists(path):
+            os.remove(path)
+
+def reset_caches():
+    """데이터 스냅샷, 렌더링 기록, 메모리 캐시, 생성 이미지를 모두 비웁니다. (cold 측정 직전)"""
+    from modules import static_data, render_cache, visualizer, startup_assets
+    with static_data._snapshot_lock:
+        static_data._snapshot = None
+    render_cache.forget()
+    visualizer._comparison_png_cache.clear()
+    visualizer._variant_memory_cache.clear()
+    with startup_assets._ready_lock:
+        startup_assets._ready.clear()
+    reset_generated_files()
+
+# --- 측정 ---
+
+def _time_once(fn):
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+def _summary(samples, loops=1):
+    ms = [s / loops * 1000 for s in samples]
+    return {
+        'median_ms': round(statistics.median(ms), 4),
+        'min_ms': round(min(ms), 4),
+        'max_ms': round(max(ms), 4),
+        'samples': len(ms),
+        'loops': loops,
+    }
+
+def measure_cold(fn, repeat):
+    """매번 reset_caches() 후 첫 호출 시간을 측정합니다."""
+    samples = []
+    for _ in range(repeat):
+        reset_caches()
+        samples.append(_time_once(fn))
+    return _summary(samples)
+
+def measure_warm(fn, repeat, single=False):
+    """
+    한 번 호출해 캐시를 채운 뒤, 표본마다 loops번 반복한 평균 시간을 측정합니다.
+    loops는 표본 1개가 MIN_SAMPLE_TIME 이상이 되도록 정합니다. single이면 표본 1개, loops 1
+    """
+    first = _time_once(fn)
+    if single:
+        return _summary([_time_once(fn)])
+    loops = 1
+    if first < MIN_SAMPLE_TIME:
+        loops = min(MAX_LOOPS, max(1, int(MIN_SAMPLE_TIME / max(first, 1e-7))))
+
+    def run_loops():
+        for _ in range(loops):
+            fn()
+    return _summary([_time_once(run_loops) for _ in range(repeat)], loops)
+
+# --- 측정 대상 ---
+
+def _sample_subjects():
+    # 측정에 사용할 팀/선수 (데이터 파일 순서상 첫 팀, 그 팀의 WAR 1위 선수 등)
+    from modules import static_data
+    teams = list(static_data.get_all_team_data())
+    team, opp = teams[0], teams[1]
+    players = static_data.get_players_by_team(team)
+    p1, p2 = players[0], players[1] if len(players) > 1 else players[0]
+    return {
+        'team': team, 'opp': opp,
+        'team_data': static_data.get_specific_team_data(team),
+        'p1': p1, 'p2': p2,
+        'position': p1.get('Pos.'), 'hand': p1.get('Hand'),
+    }
+
+def accessor_cases(s):
+    from modules import static_data as sd
+    return [
+        ('get_snapshot', sd.get_snapshot),
+        ('get_2025_season_data', sd.get_2025_season_data),
+        ('get_team_rank_data_from_json', sd.get_team_rank_data_from_json),
+        ('get_specific_team_data', lambda: sd.get_specific_team_data(s['team'])),
+        ('get_all_team_data', sd.get_all_team_data),
+        ('get_comparison_data', sd.get_comparison_data),
+        ('get_player_index', sd.get_player_index),
+        ('get_player_columns', sd.get_player_columns),
+        ('get_players_by_team', lambda: sd.get_players_by_team(s['team'])),
+        ('get_players_by_position', lambda: sd.get_players_by_position(s['position'])),
+        ('get_players_by_hand', lambda: sd.get_players_by_hand(s['hand'])),
+        ('get_player_by_id', lambda: sd.get_player_by_id(s['p1']['Id'])),
+        ('get_team_symbol', lambda: sd.get_team_symbol(s['team'])),
+    ]
+
+def chart_cases(s):
+    """visualizer의 모든 create_* 함수 (인자가 필요한 함수는 측정용 팀/선수로 호출)"""
+    from modules import visualizer
+    team, data = s['team'], s['team_data']
+    args = {
+        'create_team_radar_chart': (team,),
+        'create_waa_table_image': (team,),
+        'create_match_record_image': (team, s['opp']),
+        'create_player_war_chart': (s['p1'],),
+        'create_player_offensive_chart': (s['p1'],),
+        'create_player_detail_chart': (s['p1'],),
+        'create_stadium_map': (team, data.get('Latitude'), data.get('Longitude'), data.get('Stadium', '홈구장')),
+        'create_team_runs_chart': (team, data),
+        'create_pythagorean_chart': (team, data),
+        'create_player_comparison_chart': (s['p1'], s['p2']),
+    }
+    names = sorted(name for name in dir(visualizer) if name.startswith('create_'))
+    return [(name, (lambda fn=getattr(visualizer, name), a=args.get(name, ()): fn(*a)),
+             name in BATCH_CHART_FUNCTIONS)
+            for name in names]
+
+def route_urls(s):
+    """app.py의 모든 라우트를 한 번씩 부르는 URL 목록"""
+    team, opp = s['team'], s['opp']
+    p1, p2 = s['p1']['Id'], s['p2']['Id']
+    return [
+        '/', '/analysis', '/player_compare',
+        f'/team/{team}', f'/map/{team}', f'/player/{p1}',
+        f'/api/players/{team}', f'/api/player/{p1}', f'/api/player/{p1}/percentiles',
+        f'/api/team/{team}/metrics', '/api/pythagorean', f'/api/team/{team}/pythagorean',
+        '/api/h2h', f'/api/h2h/{team}/{opp}',
+        '/api/chart/ranking', '/api/chart/h2h', f'/api/chart/radar/{team}', f'/api/chart/waa_table/{team}',
+        f'/api/chart/record/{team}/{opp}', f'/api/chart/runs/{team}', f'/api/chart/pythagorean/{team}',
+        f'/api/chart/player_war/{p1}', f'/api/chart/player_offensive/{p1}', f'/api/chart/player_detail/{p1}',
+        f'/api/chart/compare/{p1}/{p2}',
+        f'/plot/compare/{p1}/{p2}', f'/plot/compare/{p1}/{p2}?format=webp&profile=retina',
+        '/plot/ranking', f'/plot/radar/{team}?format=svg',
+        '/api/cache/compare', '/api/cache/charts',
+        '/static/image/ranking_graph.png', f'/static/image/radar/radar_{team}.png',
+    ]
+
+def route_cases(s):
+    import app
+    client = app.app.test_client()
+
+    def request(url):
+        def fn():
+            response = client.get(url)
+            response.close()
+            if response.status_code >= 400:
+                raise RuntimeError(f"{url}: {response.status_code}")
+        return fn
+    return [(url, request(url)) for url in route_urls(s)]
+
+# --- 실행 ---
+
+def run_group(group, repeat, cold_repeat):
+    s = _sample_subjects()
+    if group == 'accessors':
+        cases = [(name, fn, False) for name, fn in accessor_cases(s)]
+    elif group == 'charts':
+        cases = chart_cases(s)
+    else:
+        cases = [(name, fn, False) for name, fn in route_cases(s)]
+
+    results = []
+    for name, fn, single in cases:
+        entry = {'group': group, 'name': name}
+        try:
+            entry['cold'] = measure_cold(fn, 1 if single else cold_repeat)
+            entry['warm'] = measure_warm(fn, repeat, single)
+        except Exception as e:
+            entry['error'] = f"{type(e).__name__}: {e}"
+        results.append(entry)
+        print(f"  {group}/{name}", file=sys.stderr)
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='프로세스 안 벤치마크 (benchmarks/run.py에서 호출)')
+    parser.add_argument('--groups', default=','.join(GROUPS))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--cold-repeat', type=int, default=3)
+    parser.add_argument('--output', required=True)
+    args = parser.parse_args(argv)
+
+    # 시작 이미지 생성(app import)은 startup 그룹에서 따로 측정하므로 여기서는 lazy 모드로 import
+    config.STARTUP_ASSET_MODE = 'lazy'
+    results = []
+    for group in args.groups.split(','):
+        if group not in GROUPS:
+            parser.error(f"알 수 없는 그룹입니다: {group}")
+        results += run_group(group, args.repeat, args.cold_repeat)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+# [Bench] 성능 측정 실행기
+# 프로젝트를 임시 작업 폴더에 복사한 뒤 그 안에서 측정하므로, 원본의 생성 이미지/캐시는 건드리지 않습니다.
+#
+#   python -m benchmarks.run                            # 전체 측정 -> instance/benchmarks/latest.json
+#   python -m benchmarks.run --quick                    # 반복 횟수를 줄인 빠른 측정
+#   python -m benchmarks.run --groups startup,routes    # 일부 그룹만 (startup, accessors, charts, routes)
+#   python -m benchmarks.run --save-baseline base.json  # 결과를 기준값으로 저장
+#   python -m benchmarks.run --baseline base.json       # 기준값과 비교, 느려진 항목이 있으면 종료 코드 1
+#
+# 측정 그룹
+# - startup: 새 프로세스에서 app.py import 시간
+#   (cold: 생성 이미지/바이너리 스냅샷이 없는 상태, warm: 바로 다음 실행)
+# - accessors: static_data 조회 함수
+# - charts: visualizer의 create_* 함수
+# - routes: Flask test client로 모든 라우트 요청
+# accessors/charts/routes의 cold/warm 정의는 benchmarks/cases.py 참고
+
+import argparse
+import compileall
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GROUPS = ('startup', 'accessors', 'charts', 'routes')
+
+# 작업 폴더로 복사할 항목
+PROJECT_FILES = ('app.py', 'config.py', 'modules', 'templates', 'static', 'benchmarks')
+
+# 기준값 비교: 중앙값이 (1 + threshold)배를 넘고, 차이가 min_delta_ms 이상이면 느려진 것으로 판단
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_MIN_DELTA_MS = 1.0
+
+STARTUP_SCRIPT = (
+    "import time; start = time.perf_counter(); import app; "
+    "print(time.perf_counter() - start)"
+)
+
+# --- 작업 폴더 ---
+
+def make_workspace():
+    """프로젝트를 임시 폴더에 복사하고, 생성 이미지와 바이너리 스냅샷을 지운 뒤 바이트코드를 미리 컴파일합니다."""
+    workspace = tempfile.mkdtemp(prefix='kbo-bench-')
+    ignore = shutil.ignore_patterns('__pycache__', '*.pyc')
+    for name in PROJECT_FILES:
+        src = os.path.join(BASE_DIR, name)
+        dst = os.path.join(workspace, name)
+        if os.path.isdir(src):
+            shutil.copytree(src, dst, ignore=ignore)
+        elif os.path.exists(src):
+            shutil.copy2(src, dst)
+    reset_workspace(workspace)
+    # cold 측정에 .py 컴파일 시간이 섞이지 않도록
+    compileall.compile_dir(workspace, quiet=1)
+    return workspace
+
+def reset_workspace(workspace):
+    """작업 폴더의 생성 이미지와 바이너리 스냅샷(instance/)을 지웁니다."""
+    _run_python(workspace, ['-c', 'from benchmarks.cases import reset_generated_files; reset_generated_files()'])
+    shutil.rmtree(os.path.join(workspace, 'instance'), ignore_errors=True)
+
+def _run_python(workspace, args):
+    # 진행 상황/오류(stderr)는 그대로 보여 주고, 측정 값(stdout)만 받습니다.
+    # (한글 폰트가 없는 환경의 글리프 경고는 숨김)
+    env = dict(os.environ, PYTHONWARNINGS='ignore::UserWarning')
+    result = subprocess.run([sys.executable, *args], cwd=workspace, env=env, stdout=subprocess.PIPE, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"벤치마크 프로세스 실패 (종료 코드 {result.returncode}): {' '.join(args)}")
+    return result.stdout
+
+# --- 측정 ---
+
+def _summary(samples):
+    ms = sorted(s * 1000 for s in samples)
+    mid = len(ms) // 2
+    median = ms[mid] if len(ms) % 2 else (ms[mid - 1] + ms[mid]) / 2
+    return {'median_ms': round(median, 4), 'min_ms': round(ms[0], 4), 'max_ms': round(ms[-1], 4),
+            'samples': len(ms), 'loops': 1}
+
+def run_startup(workspace, repeat):
+    """app.py import 시간 (cold: 빈 작업 폴더, warm: 이미지/스냅샷이 남아 있는 상태)"""
+    cold, warm = [], []
+    for _ in range(repeat):
+        reset_workspace(workspace)
+        cold.append(float(_run_python(workspace, ['-c', STARTUP_SCRIPT]).strip().splitlines()[-1]))
+        warm.append(float(_run_python(workspace, ['-c', STARTUP_SCRIPT]).strip().splitlines()[-1]))
+    return [{'group': 'startup', 'name': 'import app', 'cold': _summary(cold), 'warm': _summary(warm)}]
+
+def run_in_process(workspace, groups, repeat, cold_repeat):
+    out_path = os.path.join(workspace, 'bench_cases.json')
+    _run_python(workspace, ['-m', 'benchmarks.cases', '--groups', ','.join(groups),
+                            '--repeat', str(repeat), '--cold-repeat', str(cold_repeat), '--output', out_path])
+    with open(out_path, encoding='utf-8') as f:
+        return json.load(f)
+
+def _git_revision():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                                capture_output=True, text=True, timeout=10)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def run(groups, repeat, cold_repeat):
+    workspace = make_workspace()
+    try:
+        results = []
+        if 'startup' in groups:
+            print("startup 측정 중...", file=sys.stderr)
+            results += run_startup(workspace, cold_repeat)
+        in_process = [g for g in groups if g != 'startup']
+        if in_process:
+            print(f"{', '.join(in_process)} 측정 중...", file=sys.stderr)
+            results += run_in_process(workspace, in_process, repeat, cold_repeat)
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    return {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'repeat': repeat,
+            'cold_repeat': cold_repeat,
+        },
+        'results': results,
+    }
+
+# --- 출력 / 기준값 비교 ---
+
+def _index(report):
+    # (그룹, 이름, cold/warm) -> 중앙값(ms)
+    index = {}
+    for entry in report['results']:
+        for phase in ('cold', 'warm'):
+            if phase in entry:
+                index[(entry['group'], entry['name'], phase)] = entry[phase]['median_ms']
+    return index
+
+def print_report(report):
+    print(f"{'항목':<60} {'cold(ms)':>12} {'warm(ms)':>12}")
+    for entry in report['results']:
+        label = f"{entry['group']}/{entry['name']}"
+        if 'error' in entry:
+            print(f"{label:<60} 실패: {entry['error']}")
+            continue
+        print(f"{label:<60} {entry['cold']['median_ms']:>12.3f} {entry['warm']['median_ms']:>12.3f}")
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD, min_delta_ms=DEFAULT_MIN_DELTA_MS):
+    """
+    기준값과 비교해 느려진 항목 목록 [(그룹/이름/단계, 기준 ms, 현재 ms), ...]을 반환합니다.
+    차이가 기준(threshold, min_delta_ms)을 넘는 항목만 출력하고, 한쪽에만 있는 항목은 비교하지 않습니다.
+    """
+    current, base = _index(report), _index(baseline)
+    regressions = []
+    print(f"\n기준값 비교 (기준: {baseline['meta'].get('git_revision')}, {baseline['meta'].get('timestamp')})")
+    for key in sorted(current.keys() & base.keys()):
+        now, before = current[key], base[key]
+        if abs(now - before) < min_delta_ms:
+            continue
+        ratio = now / before if before else float('inf')
+        if ratio > 1 + threshold:
+            regressions.append(('/'.join(key), before, now))
+            mark = '느려짐'
+        elif ratio < 1 / (1 + threshold):
+            mark = '빨라짐'
+        else:
+            continue
+        print(f"{'/'.join(key):<66} {before:>10.3f} -> {now:>10.3f}  x{ratio:.2f} {mark}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='KBO 앱 성능 측정')
+    parser.add_argument('--groups', default=','.join(GROUPS), help='쉼표로 구분 (startup,accessors,charts,routes)')
+    parser.add_argument('--repeat', type=int, default=None, help='warm 표본 수 (기본 5, --quick이면 3)')
+    parser.add_argument('--cold-repeat', type=int, default=None, help='cold 표본 수 (기본 3, --quick이면 1)')
+    parser.add_argument('--quick', action='store_true', help='반복 횟수를 줄인 빠른 측정')
+    parser.add_argument('--output', default=os.path.join(BASE_DIR, 'instance', 'benchmarks', 'latest.json'))
+    parser.add_argument('--baseline', help='비교할 기준값 JSON')
+    parser.add_argument('--save-baseline', help='결과를 기준값으로 저장할 경로')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='느려짐 판단 비율 (기본 0.2 = 20%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS, help='느려짐으로 보는 최소 차이(ms)')
+    args = parser.parse_args(argv)
+
+    groups = [g for g in args.groups.split(',') if g]
+    unknown = [g for g in groups if g not in GROUPS]
+    if unknown:
+        parser.error(f"알 수 없는 그룹입니다: {', '.join(unknown)}")
+    repeat = args.repeat or (3 if args.quick else 5)
+    cold_repeat = args.cold_repeat or (1 if args.quick else 3)
+
+    report = run(groups, repeat, cold_repeat)
+    print_report(report)
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"\n느려진 항목 {len(regressions)}개")
+            return 1
+        print("\n느려진 항목 없음")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1 +1,111 @@
-# 설정 파일 (한글 폰트 경로, 상수 등)
\ No newline at end of file
+# 설정 파일 (한글 폰트 경로, 상수 등)
+import os
+
+# 프로젝트 루트 및 데이터 폴더 경로
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, 'static', 'data')
+
+# 데이터 파일 변경 여부(mtime/size)를 다시 확인하기까지의 최소 간격(초)
+# 0이면 매 호출마다 확인합니다.
+DATA_RELOAD_CHECK_INTERVAL = 1.0
+
+# 차트에 사용할 한글 폰트 경로 (None이면 시스템 폰트에서 자동 탐색)
+KOREAN_FONT_PATH = None
+
+# 자동 탐색 시 파일 경로에 포함되어 있으면 한글 폰트로 간주하는 키워드
+KOREAN_FONT_KEYWORDS = ('Nanum', 'Gothic', 'Malgun')
+
+# 앱 시작 시 이미지 생성에 사용할 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 실행)
+STARTUP_RENDER_WORKERS = None
+
+# 시작 이미지(순위 그래프, 레이더 차트, WAA 표, 상대 전적 표) 생성 방식
+# 'eager': 앱 시작 시 모두 생성 / 'lazy': 페이지나 static URL에서 처음 필요할 때 생성
+STARTUP_ASSET_MODE = 'eager'
+
+# /plot/compare 선수 비교 그래프 메모리 캐시 (PNG bytes, LRU)
+COMPARISON_MEMORY_CACHE_ITEMS = 256
+COMPARISON_MEMORY_CACHE_BYTES = 32 * 1024 * 1024
+
+# HTTP 캐시 정책 (Cache-Control) - 경로 종류별
+HTTP_CACHE_CONTROL = {
+    'static': 'public, max-age=86400',                # css, 로고 등 고정 파일
+    'generated': 'public, max-age=300, must-revalidate',  # 생성된 차트/표/지도
+    'plot': 'public, max-age=600, must-revalidate',   # /plot/compare
+    'api': 'public, max-age=60, must-revalidate',     # JSON API
+}
+
+# 생성된 파일로 취급하는 static 경로 (앞부분 일치)
+GENERATED_STATIC_PREFIXES = (
+    'image/ranking_graph.png', 'image/h2h_heatmap.png', 'image/radar/', 'image/table/', 'image/record/',
+    'image/team_chart/', 'image/player_chart/', 'image/comparison/', 'image/variants/', 'maps/',
+)
+
+# 선수 비교 그래프 디스크 캐시 (static/image/comparison)
+COMPARISON_DISK_CACHE_DIR = os.path.join(BASE_DIR, 'static', 'image', 'comparison')
+COMPARISON_DISK_CACHE_MAX_FILES = 2000
+COMPARISON_DISK_CACHE_MAX_BYTES = 64 * 1024 * 1024
+COMPARISON_DISK_CACHE_POLICY = 'lru'  # 'lru' 또는 'lfu'
+
+# 선수 백분위 계산 시 기본 최소 타석 수 (이보다 적은 선수는 비교 대상에서 제외)
+PLAYER_PERCENTILE_MIN_PA = 100
+PLAYER_PERCENTILE_CACHE_ITEMS = 8  # 스냅샷마다 보관할 최소 타석 값별 백분위 엔진 수 (?min_pa=)
+
+# 선수 검색 (/api/search?q=): 이름/초성 외에 부분 문자열로 검색할 필드 (출신교, 지명 정보)
+PLAYER_SEARCH_FIELDS = ('SchoolInfo', 'DraftInfo')
+PLAYER_SEARCH_LIMIT = 10      # 기본 결과 수
+PLAYER_SEARCH_MAX_LIMIT = 50  # ?limit= 최대값
+
+# 리그 스탯 순위 (/api/leaders?stat=): 기본 최소 타석 수, 기본/최대 결과 수
+PLAYER_LEADERS_MIN_PA = 100
+PLAYER_LEADERS_LIMIT = 10
+PLAYER_LEADERS_MAX_LIMIT = 100
+
+# 피타고리안 기대 승률 지수: 숫자(예: 1.83), 'pythagenpat'(득실점 환경에 따라 팀별 지수), 'fitted'(리그 데이터로 추정)
+PYTHAGOREAN_EXPONENT = 1.83
+
+# 차트 렌더링 위치: False면 서버에서 PNG를 그리고, True면 브라우저가 /api/chart/... JSON으로 직접 그림
+# (True여도 PNG 경로는 그대로 동작하므로 필요하면 언제든 되돌릴 수 있음)
+CLIENT_SIDE_CHARTS = False
+
+# 차트 이미지 출력 형식과 크기 프로필
+# 형식: 'png', 'webp'(둘 다 팔레트로 줄인 뒤 무손실 압축), 'svg'(벡터)
+# 시작 시 만드는 static 차트 파일은 항상 PNG + 기본 프로필이고,
+# /plot/<차트>/... 경로에서 ?format=, ?profile= 또는 Accept 헤더로 다른 형식을 받을 수 있음
+CHART_DEFAULT_FORMAT = 'png'
+CHART_PALETTE_COLORS = 256  # None이면 색을 줄이지 않음 (원본 RGBA)
+CHART_PROFILES = {
+    'thumbnail': {'dpi': 50},
+    'standard': {'dpi': 100},   # 기존 차트 크기
+    'retina': {'dpi': 200},
+}
+CHART_DEFAULT_PROFILE = 'standard'
+
+# 형식/프로필별 차트 이미지 캐시 (메모리 LRU + static/image/variants 디스크 캐시)
+CHART_VARIANT_MEMORY_CACHE_ITEMS = 256
+CHART_VARIANT_MEMORY_CACHE_BYTES = 32 * 1024 * 1024
+CHART_VARIANT_CACHE_DIR = os.path.join(BASE_DIR, 'static', 'image', 'variants')
+CHART_VARIANT_CACHE_MAX_FILES = 2000
+CHART_VARIANT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# 데이터 JSON을 컴파일한 바이너리 스냅샷 (python -m modules.compiled_data 로 생성)
+# 원본 JSON의 mtime/size가 스냅샷에 기록된 값과 같으면 JSON 대신 이 파일을 읽음
+COMPILED_DATA_PATH = os.path.join(BASE_DIR, 'instance', 'kbo_data.snapshot')
+COMPILED_DATA_ENABLED = True
+COMPILED_DATA_AUTO_BUILD = True  # JSON을 읽은 경우 스냅샷을 새로 저장
+COMPILED_DATA_MMAP = True        # 배열을 메모리 매핑 (읽기 시간만 줄어듦, 팀/선수 dict는 프로세스마다 생성)
+
+# 상세 페이지 차트 백그라운드 렌더링 (modules/render_service.py)
+# 요청은 RENDER_WAIT_BUDGET초까지만 기다리고, 그 뒤에는 자리 표시 이미지 + 브라우저 폴링
+RENDER_SERVICE_ENABLED = True
+RENDER_WORKERS = 2
+RENDER_WAIT_BUDGET = 0.15
+
+# 요청/단계별 처리 시간, 캐시 적중, 차트 렌더링 횟수 (/metrics, Prometheus 텍스트 형식)
+METRICS_ENABLED = True
+METRICS_SERVER_TIMING = True  # 응답에 Server-Timing 헤더(단계별 ms) 추가
+METRICS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # 히스토그램 구간(초)
+
+# 정적 사이트 내보내기 (python export_static.py)
+# 모든 페이지/차트 이미지/JSON API 응답을 파일로 저장해 일반 파일 서버나 CDN으로 서비스할 때 사용
+STATIC_EXPORT_DIR = os.path.join(BASE_DIR, 'build', 'site')
+STATIC_EXPORT_WORKERS = None  # 내보내기에 사용할 프로세스 수 (None이면 CPU 코어 수)
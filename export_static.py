@@ -0,0 +1,368 @@
+# [Main] 정적 사이트 내보내기
+# 파일 위치: export_static.py
+#
+# 모든 페이지, 페이지에 들어가는 차트 이미지, JSON API 응답을 파일로 저장합니다.
+# 경기가 있는 날처럼 요청이 몰릴 때 일반 파일 서버/CDN으로 서비스하기 위한 용도입니다.
+#
+#   python export_static.py                  # config.STATIC_EXPORT_DIR(build/site)로 내보내기
+#   python export_static.py --out /srv/kbo   # 다른 폴더로
+#   python export_static.py --workers 4      # 프로세스 수 (기본 config.STATIC_EXPORT_WORKERS)
+#   python export_static.py --force          # 입력이 같아도 모든 URL을 다시 생성
+#
+# 출력 구조 (URL -> 파일)
+#   /                      -> index.html
+#   /team/LG               -> team/LG/index.html
+#   /api/player/10187      -> api/player/10187/index.json
+#   /static/...            -> static/... (그대로)
+# 같은 경로가 페이지이면서 하위 경로의 부모이기도 하므로(/api/player/<id>, /api/player/<id>/percentiles)
+# 모든 응답을 폴더의 index 파일로 저장합니다. 파일 서버에서 index.json도 찾도록 설정해야 합니다.
+#   (nginx 예: try_files $uri $uri/index.html $uri/index.json =404;)
+#
+# 증분 생성
+# - URL마다 입력(데이터 중 그 URL이 사용하는 부분 + 코드/템플릿)의 해시를 .export-manifest.json에 기록하고,
+#   해시가 같고 파일이 남아 있으면 다시 요청하지 않습니다.
+# - 다시 생성해도 내용이 같은 파일은 덮어쓰지 않습니다. (mtime 유지 -> rsync/CDN 동기화 최소화)
+# - 더 이상 없는 URL(삭제된 선수 등)의 파일은 지웁니다.
+#
+# 두 선수 비교 그래프(/plot/compare/..., /api/chart/compare/...)는 조합 수가 너무 많아 내보내지 않습니다.
+# 선수 비교 화면을 쓰려면 이 경로만 Flask 서버로 전달하도록 파일 서버를 설정하세요.
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from urllib.parse import quote, unquote
+
+import config
+
+MANIFEST_NAME = '.export-manifest.json'
+MANIFEST_VERSION = 1
+
+# 입력 해시에 포함할 코드/템플릿 (바뀌면 모든 URL을 다시 생성)
+CODE_PATHS = ('app.py', 'config.py', 'export_static.py', 'modules', 'templates')
+
+# 데이터 입력 구분
+# - league: 팀 데이터 + 팀 간 전적 + 월별 순위 (리그 전체 정규화에 쓰이므로 한 묶음)
+# - players: 선수 데이터 전체 (백분위 등 리그 전체 비교)
+# - team:<팀>: 해당 팀 선수 목록
+LEAGUE = ('league',)
+PLAYERS = ('league', 'players')
+
+# HTML 안의 static 참조 (src="/static/..." / href="/static/...")
+STATIC_REF_PATTERN = re.compile(rb'(?:src|href)="(/static/[^"?#]+)')
+
+# 워커 프로세스의 test client
+_client = None
+
+# --- 내보낼 URL 목록 ---
+
+def collect_urls():
+    """
+    내보낼 (URL, 입력 구분 tuple) 목록을 반환합니다.
+    페이지, 시작/요청 시 생성 이미지, 데이터 JSON API, 차트 데이터 API를 모두 포함합니다.
+    """
+    from modules import static_data, startup_assets, visualizer
+
+    teams = list(static_data.get_all_team_data())
+    players = static_data.get_player_index().by_id
+    pairs = visualizer.get_match_record_pairs()
+
+    urls = [(url, LEAGUE) for url in (
+        '/', '/analysis', '/player_compare',
+        '/api/pythagorean', '/api/h2h', '/api/chart/ranking', '/api/chart/h2h',
+    )]
+    # 순위 그래프, 레이더 차트, WAA 표, 히트맵, 팀 쌍별 전적 표
+    # (/analysis는 스크립트에서 경로를 만들어 쓰므로 페이지 HTML에서 찾을 수 없음)
+    for task in startup_assets.get_startup_tasks() + startup_assets.get_on_demand_tasks():
+        urls.append(('/static/' + quote(task[3]), LEAGUE))
+
+    for team in teams:
+        urls += [
+            (f'/team/{team}', LEAGUE + (f'team:{team}',)),
+            (f'/map/{team}', LEAGUE),
+            (f'/api/players/{team}', (f'team:{team}',)),
+            (f'/api/team/{team}/metrics', LEAGUE),
+            (f'/api/team/{team}/pythagorean', LEAGUE),
+            (f'/api/chart/radar/{team}', LEAGUE),
+            (f'/api/chart/waa_table/{team}', LEAGUE),
+            (f'/api/chart/runs/{team}', LEAGUE),
+            (f'/api/chart/pythagorean/{team}', LEAGUE),
+        ]
+    for team, opp in pairs:
+        urls += [(f'/api/h2h/{team}/{opp}', LEAGUE), (f'/api/chart/record/{team}/{opp}', LEAGUE)]
+
+    for player_id in players:
+        urls += [(url, PLAYERS) for url in (
+            f'/player/{player_id}',
+            f'/api/player/{player_id}',
+            f'/api/player/{player_id}/percentiles',
+            f'/api/chart/player_war/{player_id}',
+            f'/api/chart/player_offensive/{player_id}',
+            f'/api/chart/player_detail/{player_id}',
+        )]
+    return urls
+
+# --- 입력 해시 ---
+
+def _sha1_json(value):
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def data_digests():
+    """입력 구분(league, players, team:<팀>)별 데이터 해시"""
+    from modules import static_data
+    snapshot = static_data.get_snapshot()
+    digests = {
+        'league': _sha1_json([snapshot.team_data, snapshot.comparison_data, snapshot.monthly_rankings]),
+        'players': _sha1_json(snapshot.player_data),
+    }
+    for team, players in snapshot.player_data.items():
+        digests[f'team:{team}'] = _sha1_json(players)
+    return digests
+
+def code_digest():
+    """CODE_PATHS 파일 내용의 해시 (__pycache__ 제외)"""
+    digest = hashlib.sha1()
+    for name in CODE_PATHS:
+        path = os.path.join(config.BASE_DIR, name)
+        if os.path.isfile(path):
+            files = [path]
+        else:
+            files = []
+            for root, dirs, file_names in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+                files += [os.path.join(root, f) for f in sorted(file_names) if not f.endswith('.pyc')]
+        for file_path in files:
+            digest.update(os.path.relpath(file_path, config.BASE_DIR).encode('utf-8') + b'\0')
+            with open(file_path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+def input_key(url, deps, digests, code):
+    parts = [code, url] + [f'{dep}={digests.get(dep)}' for dep in deps]
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+# --- 파일 쓰기 ---
+
+def output_path(url, mimetype):
+    """URL을 출력 폴더 기준 파일 경로로 바꿉니다. (맨 위 설명 참고)"""
+    path = unquote(url.split('?', 1)[0]).strip('/')
+    if path.startswith('static/'):
+        return path
+    name = 'index.json' if mimetype == 'application/json' else 'index.html'
+    return f'{path}/{name}' if path else name
+
+def write_if_changed(path, data):
+    """내용이 다를 때만 파일을 씁니다. 썼으면 True"""
+    from modules.file_utils import atomic_write_bytes
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+# --- 워커 프로세스 ---
+
+def _init_worker():
+    # 차트를 요청 스레드에서 바로 그리도록 (자리 표시 이미지 없이 완성된 페이지)
+    # 시작 이미지는 URL별 작업으로 나누어 그리므로 lazy 모드로 import
+    global _client
+    config.RENDER_SERVICE_ENABLED = False
+    config.STARTUP_ASSET_MODE = 'lazy'
+    import app
+    _client = app.app.test_client()
+
+def _generated_refs(html):
+    # 페이지가 참조하는 생성 이미지 URL (고정 static 파일은 mirror_static에서 복사)
+    refs = []
+    for match in STATIC_REF_PATTERN.finditer(html):
+        url = match.group(1).decode('utf-8')
+        if unquote(url[len('/static/'):]).startswith(config.GENERATED_STATIC_PREFIXES) and url not in refs:
+            refs.append(url)
+    return refs
+
+def _fetch(url):
+    response = _client.get(url)
+    try:
+        return response.status_code, response.mimetype, response.get_data()
+    finally:
+        response.close()
+
+def export_url(url, out_dir):
+    """
+    URL 1개(와 HTML이면 참조하는 생성 이미지)를 요청해 저장합니다. (워커 프로세스에서 실행)
+    (url, 오류 메시지 또는 None, 저장 대상 파일 목록, 실제로 쓴 파일 수)를 반환합니다.
+    """
+    try:
+        status, mimetype, body = _fetch(url)
+        if status != 200:
+            return url, f'HTTP {status}', [], 0
+        outputs = [(output_path(url, mimetype), body)]
+        if mimetype == 'text/html':
+            for ref in _generated_refs(body):
+                ref_status, ref_mimetype, ref_body = _fetch(ref)
+                if ref_status != 200:
+                    return url, f'{ref}: HTTP {ref_status}', [], 0
+                outputs.append((output_path(ref, ref_mimetype), ref_body))
+        written = sum(write_if_changed(os.path.join(out_dir, rel), data) for rel, data in outputs)
+        return url, None, [rel for rel, _ in outputs], written
+    except Exception as e:
+        return url, f'{type(e).__name__}: {e}', [], 0
+
+# --- 고정 static 파일 / 매니페스트 ---
+
+def mirror_static(out_dir):
+    """
+    생성 파일이 아닌 static 파일(css, js, 로고, 데이터)을 출력 폴더로 복사합니다.
+    (복사 대상 파일 목록, 실제로 쓴 파일 수)를 반환합니다.
+    """
+    static_dir = os.path.join(config.BASE_DIR, 'static')
+    files, written = [], 0
+    for root, dirs, file_names in os.walk(static_dir):
+        dirs.sort()
+        for file_name in sorted(file_names):
+            src = os.path.join(root, file_name)
+            rel = os.path.relpath(src, static_dir).replace(os.sep, '/')
+            if rel.startswith(config.GENERATED_STATIC_PREFIXES) or file_name.startswith('.tmp-'):
+                continue
+            with open(src, 'rb') as f:
+                data = f.read()
+            dst_rel = f'static/{rel}'
+            written += write_if_changed(os.path.join(out_dir, dst_rel), data)
+            files.append(dst_rel)
+    return files, written
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {'urls': {}, 'static': []}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {'urls': {}, 'static': []}
+    return manifest
+
+def save_manifest(out_dir, urls, static_files):
+    from modules.file_utils import atomic_write_bytes
+    manifest = {'version': MANIFEST_VERSION, 'urls': urls, 'static': static_files}
+    data = json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True).encode('utf-8')
+    atomic_write_bytes(os.path.join(out_dir, MANIFEST_NAME), data)
+
+def _manifest_files(manifest):
+    files = set(manifest.get('static', []))
+    for entry in manifest.get('urls', {}).values():
+        files.update(entry.get('files', []))
+    return files
+
+def remove_stale(out_dir, old_files, new_files):
+    """이전 내보내기에만 있던 파일을 지우고, 비게 된 폴더도 정리합니다. 지운 파일 수를 반환합니다."""
+    removed = 0
+    for rel in sorted(old_files - new_files):
+        path = os.path.join(out_dir, rel)
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            continue
+        parent = os.path.dirname(path)
+        while parent != out_dir and os.path.isdir(parent) and not os.listdir(parent):
+            os.rmdir(parent)
+            parent = os.path.dirname(parent)
+    return removed
+
+# --- 실행 ---
+
+def _resolve_workers(workers):
+    if workers is None:
+        workers = config.STATIC_EXPORT_WORKERS
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, int(workers))
+
+def export_site(out_dir=None, workers=None, force=False):
+    """
+    사이트 전체를 out_dir에 내보내고 통계 dict를 반환합니다.
+    입력 해시가 바뀐 URL만 워커 프로세스들에 나누어 다시 생성합니다.
+    """
+    out_dir = os.path.abspath(out_dir or config.STATIC_EXPORT_DIR)
+    workers = _resolve_workers(workers)
+    start = time.perf_counter()
+
+    # 부모 프로세스에서 app을 먼저 import해 두면 fork된 워커가 데이터 스냅샷을 그대로 물려받음
+    _init_worker()
+    digests, code = data_digests(), code_digest()
+    urls = collect_urls()
+
+    old_manifest = load_manifest(out_dir)
+    old_urls = old_manifest.get('urls', {})
+    new_urls = {}
+    jobs = []
+    for url, deps in urls:
+        key = input_key(url, deps, digests, code)
+        entry = old_urls.get(url)
+        if (not force and entry and entry.get('key') == key
+                and all(os.path.exists(os.path.join(out_dir, rel)) for rel in entry.get('files', []))):
+            new_urls[url] = entry
+        else:
+            jobs.append((url, key))
+
+    stats = {'urls': len(urls), 'skipped': len(urls) - len(jobs), 'exported': 0,
+             'files_written': 0, 'failed': 0, 'removed': 0}
+    print(f"정적 사이트 내보내기: URL {len(urls)}개 중 {len(jobs)}개 생성 "
+          f"({len(urls) - len(jobs)}개는 입력이 같아 건너뜀, 프로세스 {workers}개) -> {out_dir}")
+
+    keys = dict(jobs)
+
+    def record(result):
+        url, error, files, written = result
+        if error is not None:
+            stats['failed'] += 1
+            print(f"내보내기 실패 ({url}): {error}")
+        else:
+            stats['exported'] += 1
+            stats['files_written'] += written
+            new_urls[url] = {'key': keys[url], 'files': files}
+        done = stats['exported'] + stats['failed']
+        if done % 100 == 0:
+            print(f"  {done}/{len(jobs)}")
+
+    if workers == 1 or len(jobs) <= 1:
+        for url, _ in jobs:
+            record(export_url(url, out_dir))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [pool.submit(export_url, url, out_dir) for url, _ in jobs]
+            for future in as_completed(futures):
+                record(future.result())
+
+    static_files, static_written = mirror_static(out_dir)
+    stats['files_written'] += static_written
+
+    new_manifest = {'urls': new_urls, 'static': static_files}
+    stats['removed'] = remove_stale(out_dir, _manifest_files(old_manifest), _manifest_files(new_manifest))
+    save_manifest(out_dir, new_urls, static_files)
+
+    stats['seconds'] = round(time.perf_counter() - start, 2)
+    print(f"완료: 생성 {stats['exported']}, 건너뜀 {stats['skipped']}, 실패 {stats['failed']}, "
+          f"파일 변경 {stats['files_written']}, 삭제 {stats['removed']} ({stats['seconds']}초)")
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='KBO 사이트를 정적 파일로 내보내기')
+    parser.add_argument('--out', default=None, help='출력 폴더 (기본 config.STATIC_EXPORT_DIR)')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본 config.STATIC_EXPORT_WORKERS)')
+    parser.add_argument('--force', action='store_true', help='입력이 같아도 모든 URL을 다시 생성')
+    args = parser.parse_args(argv)
+    stats = export_site(args.out, args.workers, args.force)
+    return 1 if stats['failed'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
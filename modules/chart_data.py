@@ -0,0 +1,242 @@
+# [Model] 차트별 데이터 시리즈
+# 각 함수는 visualizer의 렌더러가 그리는 데이터를 그대로 반환합니다.
+# 서버 렌더링(PNG)과 브라우저 렌더링(/api/chart/... JSON)이 같은 함수를 사용합니다.
+
+import numpy as np
+
+import config
+from .static_data import get_2025_season_data, get_specific_team_data, get_player_by_id
+from .team_metrics import get_team_metrics, WAA_CATEGORIES
+from .player_percentiles import get_player_percentiles
+from .head_to_head import get_head_to_head
+from . import pythagorean
+
+# 팀별 고유 색상 (HTML 범례와 맞추기 위함)
+TEAM_COLORS = {
+    'KIA': '#EA0029', 'KT': '#000000', 'LG': '#C30452', 'NC': '#315288',
+    'SSG': '#CE0E2D', '두산': '#1A1748', '롯데': '#041E42', '삼성': '#074CA1',
+    '키움': '#570514', '한화': '#FC4E00'
+}
+
+WAA_LABELS = ['타격', '주루', '수비', '선발', '구원']
+
+OFFENSIVE_METRICS = ['wRC+', 'OPS', 'SLG', 'OBP', 'AVG']
+OFFENSIVE_LABELS = ['wRC+', 'OPS', '장타율', '출루율', '타율']
+
+DETAIL_METRICS = ['H', 'R', 'RBI', 'BB', 'SO', '2B', 'HR', '3B'] # 수치 크기순 정렬 추천
+DETAIL_LABELS = ['안타', '득점', '타점', '볼넷', '삼진', '2루타', '홈런', '3루타']
+
+COMPARISON_METRICS = ['AVG', 'HR', 'RBI', 'SB', 'H']
+COMPARISON_LABELS = ['타율', '홈런', '타점', '도루', '안타']
+
+def _team_row(team_data):
+    # team_data는 리스트 안에 딕셔너리가 있는 형태일 수 있으므로 첫 번째 요소 사용
+    return team_data if isinstance(team_data, dict) else team_data[0]
+
+# 메인페이지 - 순위 변동 그래프
+def ranking_series():
+    data = get_2025_season_data()
+    return {
+        'labels': data['labels'],
+        'teams': [{'name': name, 'color': TEAM_COLORS.get(name, '#333333'), 'rankings': rankings}
+                  for name, rankings in data['teams_data'].items()],
+    }
+
+# 팀페이지 - WAA 레이더 차트
+def team_radar_series(team_name):
+    """실제 값(raw)과 리그 min-max 정규화 값(normalized, 0~100). 팀이 없으면 None"""
+    categories = [f'{c}_WAA' for c in WAA_CATEGORIES]
+    metrics = get_team_metrics()
+    raw = metrics.row(team_name, categories)
+    if raw is None:
+        return None
+    return {
+        'team': team_name,
+        'categories': categories,
+        'labels': WAA_LABELS,
+        'raw': raw,
+        'normalized': metrics.row(team_name, categories, 'min_max'),
+    }
+
+# 팀 - 팀 비교페이지 : WAA 분석 표
+def waa_table_series(team_name):
+    metrics = get_team_metrics()
+    waa_values = metrics.row(team_name, [f'{c}_WAA' for c in WAA_CATEGORIES])
+    rank_values = metrics.row(team_name, [f'{c}_Rank' for c in WAA_CATEGORIES])
+    if waa_values is None:
+        return None
+    return {
+        'team': team_name,
+        'columns': ['부문', '기록', '순위'],
+        'rows': [[label, waa, int(rank)] for label, waa, rank in zip(WAA_LABELS, waa_values, rank_values)],
+    }
+
+# 팀 - 팀 비교페이지 : 1:1 상대 전적 (상대 전적 행렬에서 조회)
+def match_record_series(team_name, opp_name):
+    record = get_head_to_head().pair(team_name, opp_name)
+    if record is None:
+        return None
+
+    pct = record['PCT']
+    pct_str = f"{pct:.3f}" if pct is not None else "-"
+    return {
+        'team': team_name,
+        'opponent': opp_name,
+        'columns': ['대결', '승', '무', '패', '승률'],
+        'row': [f"vs {opp_name}", record['W'], record['D'], record['L'], pct_str],
+        'W': record['W'], 'D': record['D'], 'L': record['L'],
+        'PCT': pct,
+    }
+
+# 팀 - 팀 비교페이지 : 리그 전체 상대 전적 히트맵
+def h2h_series():
+    """팀 x 상대팀 승/패/무/승률 행렬 (기록이 없는 칸은 None)"""
+    return get_head_to_head().to_dict()
+
+# 팀페이지 - 득/실점 그래프
+def team_runs_series(team_data):
+    data = _team_row(team_data)
+    runs_scored = data.get('R/G', 0)
+    runs_allowed = data.get('-R/G', 0)
+    return {
+        'labels': ['평균 득점', '평균 실점'],
+        'values': [runs_scored, runs_allowed],
+        'colors': ['#5b7ece', '#ccc'], # 득점: 파랑(강조), 실점: 회색(비교)
+        'margin': round(runs_scored - runs_allowed, 2),
+    }
+
+# 팀페이지 - 피타고리안 기대 승률
+def pythagorean_series(team_name, team_data):
+    """
+    리그 데이터에 있는 팀이면 일괄 계산 결과를, 아니면 같은 지수 설정(config.PYTHAGOREAN_EXPONENT)으로
+    직접 계산한 값을 사용합니다. (/api/team/<팀>/pythagorean과 같은 값/분류)
+    """
+    data = _team_row(team_data)
+    R = data.get('R', 0)      # 총 득점
+    RA = data.get('-R', 0)    # 총 실점 (Runs Allowed)
+    actual_pct = data.get('PCT', 0) # 실제 승률
+
+    method = pythagorean.normalize_method(config.PYTHAGOREAN_EXPONENT)
+    table = pythagorean.get_pythagorean_table(method)
+    pyth = table.team(team_name)
+    if pyth is not None and (pyth['R'], pyth['RA'], pyth['PCT']) == (R, RA, actual_pct):
+        # 표시는 API와 같은 반올림 값, 분류는 반올림 전 값으로
+        expected_pct = pyth['expected_pct']
+        luck = table.raw(team_name)[1]
+    else:
+        if method == 'fitted' and table.teams:
+            exponent = table.exponent[0]  # 리그 공통 추정 지수
+        else:
+            exponent = pythagorean.resolve_exponent(
+                method, np.array([R], dtype=float), np.array([RA], dtype=float),
+                np.array([data.get('G', 0)], dtype=float), np.array([actual_pct], dtype=float))[0]
+        expected_pct = float(pythagorean.expected_pct(R, RA, exponent))
+        luck = actual_pct - expected_pct
+
+    code, analysis, desc = pythagorean.classify_luck(luck)
+    return {
+        'labels': ['기대 승률', '실제 승률'],
+        'values': [expected_pct, actual_pct],
+        'colors': ['#aaa', '#a50034'], # 기대(회색), 실제(팀컬러/붉은색)
+        'classification': code,
+        'analysis': analysis,
+        'desc': desc,
+    }
+
+# 선수 페이지 - WAR 도넛 그래프
+def player_war_series(player_data):
+    war = player_data.get('WAR', 0)
+    owar = player_data.get('oWAR', 0)
+    dwar = player_data.get('dWAR', 0)
+
+    # 음수가 있을 경우 시각화를 위해 절대값 사용, 둘 다 0이면 회색 원
+    if abs(owar) + abs(dwar) == 0:
+        sizes, colors, labels = [1], ['#e0e0e0'], ['']
+    else:
+        sizes = [abs(owar), abs(dwar)]
+        colors = ['#d9534f', '#5b7ece'] # 빨강(공격), 파랑(수비)
+        labels = ['공격', '수비']
+    return {'WAR': war, 'oWAR': owar, 'dWAR': dwar, 'sizes': sizes, 'colors': colors, 'labels': labels}
+
+# 선수 페이지 - 공격 효율성 가로 막대
+def player_offensive_series(player_data):
+    """값과 리그 백분위 비율(0~1, 막대 길이)"""
+    percentiles = get_player_percentiles()
+    values = [player_data.get(m, 0) for m in OFFENSIVE_METRICS]
+    ratios = []
+    for m, val in zip(OFFENSIVE_METRICS, values):
+        pct = percentiles.percentile(m, val)
+        ratios.append(pct / 100 if pct is not None else 0)
+    return {
+        'metrics': OFFENSIVE_METRICS,
+        'labels': OFFENSIVE_LABELS,
+        'values': values,
+        'ratios': ratios,
+        'colors': ['#5b7ece', '#d9534f', '#888', '#888', '#888'],
+    }
+
+# 선수 페이지 - 타격 세부 기록 선 그래프
+def player_detail_series(player_data):
+    return {
+        'metrics': DETAIL_METRICS,
+        'labels': DETAIL_LABELS,
+        'values': [player_data.get(m, 0) for m in DETAIL_METRICS],
+    }
+
+# 선수-선수 페이지 - 이중 막대 그래프
+def canonical_pair(p1_data, p2_data):
+    """A vs B와 B vs A를 같은 그래프로 취급 (Id가 작은 선수를 먼저 그림)"""
+    if p2_data['Id'] < p1_data['Id']:
+        return p2_data, p1_data
+    return p1_data, p2_data
+
+def player_comparison_series(p1_data, p2_data):
+    p1_data, p2_data = canonical_pair(p1_data, p2_data)
+    colors = ['#002561', '#a50034']
+    return {
+        'metrics': COMPARISON_METRICS,
+        'labels': COMPARISON_LABELS,
+        'players': [{'Id': p['Id'], 'Name': p['Name'], 'color': color,
+                     'values': [p.get(m, 0) for m in COMPARISON_METRICS]}
+                    for p, color in zip((p1_data, p2_data), colors)],
+    }
+
+# 차트 이름 -> (경로 인자 개수, 시리즈 함수)
+# 경로 인자는 문자열(팀 이름, 선수 Id)이며, 팀/선수 데이터 조회는 여기서 합니다.
+def _team_series(build):
+    def wrapper(team_name):
+        team_data = get_specific_team_data(team_name)
+        return build(team_name, team_data) if team_data else None
+    return wrapper
+
+def _player_series(build):
+    def wrapper(*player_ids):
+        players = [get_player_by_id(int(pid)) if pid.isdigit() else None for pid in player_ids]
+        return build(*players) if all(players) else None
+    return wrapper
+
+SERIES_BUILDERS = {
+    'ranking': (0, ranking_series),
+    'h2h': (0, h2h_series),
+    'radar': (1, team_radar_series),
+    'waa_table': (1, waa_table_series),
+    'record': (2, match_record_series),
+    'runs': (1, _team_series(lambda name, data: team_runs_series(data))),
+    'pythagorean': (1, _team_series(pythagorean_series)),
+    'player_war': (1, _player_series(player_war_series)),
+    'player_offensive': (1, _player_series(player_offensive_series)),
+    'player_detail': (1, _player_series(player_detail_series)),
+    'compare': (2, _player_series(player_comparison_series)),
+}
+
+def get_series(chart, *args):
+    """
+    차트 이름과 경로 인자로 시리즈를 만듭니다.
+    차트 이름이나 인자 개수가 맞지 않거나 팀/선수가 없으면 None
+    """
+    if chart not in SERIES_BUILDERS:
+        return None
+    arity, build = SERIES_BUILDERS[chart]
+    if len(args) != arity:
+        return None
+    return build(*args)
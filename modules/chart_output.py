@@ -0,0 +1,94 @@
+# [View] 차트 출력 형식(PNG/SVG/WebP)과 크기(DPI) 프로필
+# 렌더러는 Figure만 만들고, 실제 파일 형식과 해상도는 여기서 결정합니다.
+
+import io
+
+import config
+from . import metrics
+from .file_utils import atomic_write_bytes
+
+# 형식 -> MIME 타입
+FORMATS = {
+    'png': 'image/png',
+    'webp': 'image/webp',
+    'svg': 'image/svg+xml',
+}
+
+def resolve_format(fmt=None):
+    """형식 이름을 확인합니다. 없으면 기본 형식, 지원하지 않으면 ValueError"""
+    fmt = (fmt or config.CHART_DEFAULT_FORMAT).lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 이미지 형식입니다: {fmt}")
+    return fmt
+
+def resolve_profile(profile=None):
+    """프로필 이름을 확인합니다. 없으면 기본 프로필, 지원하지 않으면 ValueError"""
+    profile = profile or config.CHART_DEFAULT_PROFILE
+    if profile not in config.CHART_PROFILES:
+        raise ValueError(f"지원하지 않는 크기 프로필입니다: {profile}")
+    return profile
+
+def negotiate_format(accept_mimetypes):
+    """
+    요청의 Accept 헤더로 형식을 고릅니다. (브라우저가 WebP를 명시하면 WebP, 아니면 PNG)
+    SVG는 Accept에 명시된 경우에만 선택합니다.
+    """
+    best = accept_mimetypes.best_match([FORMATS['png'], FORMATS['webp'], FORMATS['svg']])
+    if best == FORMATS['svg'] and FORMATS['svg'] in accept_mimetypes.values():
+        return 'svg'
+    if best == FORMATS['webp']:
+        return 'webp'
+    return 'png'
+
+def _pillow_image(fig, dpi, savefig_kw):
+    from PIL import Image
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=dpi, **savefig_kw)
+    buf.seek(0)
+    img = Image.open(buf)
+    img.load()
+    return img
+
+def figure_bytes(fig, fmt='png', profile=None, metadata=None, **savefig_kw):
+    """
+    Figure를 지정한 형식과 프로필로 저장한 bytes를 반환합니다.
+    - png/webp: config.CHART_PALETTE_COLORS가 있으면 그 색 수의 팔레트로 줄인 뒤 무손실 압축
+      (차트는 색이 적어서 크기가 1/4 정도로 줄고, 선/글자가 번지지 않음)
+    - svg: 벡터 (프로필의 DPI와 관계없이 같은 크기)
+    metadata는 PNG tEXt 청크로 저장됩니다. (render_cache 키)
+    """
+    fmt = resolve_format(fmt)
+    dpi = config.CHART_PROFILES[resolve_profile(profile)]['dpi']
+
+    if fmt == 'svg':
+        buf = io.BytesIO()
+        fig.savefig(buf, format='svg', **savefig_kw)
+        return buf.getvalue()
+
+    if fmt == 'png' and not config.CHART_PALETTE_COLORS:
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=dpi, metadata=metadata, **savefig_kw)
+        return buf.getvalue()
+
+    from PIL import Image, PngImagePlugin
+    img = _pillow_image(fig, dpi, savefig_kw)
+    if config.CHART_PALETTE_COLORS:
+        img = img.quantize(config.CHART_PALETTE_COLORS, method=Image.Quantize.FASTOCTREE)
+
+    buf = io.BytesIO()
+    if fmt == 'webp':
+        img.convert('RGBA').save(buf, format='WEBP', lossless=True, method=6)
+    else:
+        pnginfo = PngImagePlugin.PngInfo()
+        for k, v in (metadata or {}).items():
+            pnginfo.add_text(k, v)
+        img.save(buf, format='PNG', optimize=True, pnginfo=pnginfo)
+    return buf.getvalue()
+
+def write_file(path, data):
+    """
+    그린 이미지 bytes를 path에 저장합니다.
+    임시 파일에 쓴 뒤 교체하므로, static 요청이 반쯤 쓰인 파일을 받는 일이 없습니다.
+    """
+    with metrics.phase('file_io'):
+        atomic_write_bytes(path, data)
@@ -0,0 +1,268 @@
+# [Model] 데이터 JSON을 열(column) 단위 바이너리 스냅샷으로 컴파일 / 로드
+# 선수/팀 데이터의 숫자 스탯은 NumPy 배열, 문자열은 중복 없는 문자열 표 + 번호 배열로 저장합니다.
+# 로드할 때 배열은 파일을 메모리 매핑(mmap)해서 읽으므로 JSON 파싱 시간이 줄어듭니다.
+# 단, 기존 조회 함수가 쓰는 팀/선수 dict는 files()가 프로세스마다 다시 만들기 때문에
+# 메모리는 줄지 않습니다. (워커끼리 공유되는 것은 열 배열(ColumnTable)뿐)
+#
+# 빌드: python -m modules.compiled_data
+#
+# 파일 구조
+#   MAGIC(8) | 헤더 길이(uint64, little endian) | 헤더(JSON, utf-8) | 0 채움 | 배열들 (각 배열은 8바이트 정렬)
+#   헤더: 형식 버전, 원본 파일 서명(mtime/size)과 내용 해시, 문자열 표, 열 정보(종류/dtype/위치)
+
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+import config
+from .file_utils import atomic_write_bytes
+
+MAGIC = b'KBOSNAP\x01'
+FORMAT_VERSION = 1
+
+# 열로 저장하는 데이터 (팀 -> 행 목록 구조)와 그대로 저장하는 작은 데이터
+TABLE_ATTRS = ('team_data', 'player_data')
+RAW_ATTRS = ('comparison_data', 'monthly_rankings')
+
+# --- 컴파일 ---
+
+def _column_kind(values):
+    # 'int' / 'float' / 'num'(정수와 실수 혼합) / 'str' / 'json'(그 외)
+    types = {type(v) for v in values}
+    if types == {int}:
+        return 'int'
+    if types == {float}:
+        return 'float'
+    if types == {int, float}:
+        return 'num'
+    if types == {str}:
+        return 'str'
+    return 'json'
+
+class _Writer:
+    def __init__(self):
+        self.chunks = []
+        self.offset = 0
+        self.strings = []
+        self.string_ids = {}
+
+    def add_array(self, arr):
+        arr = np.ascontiguousarray(arr)
+        pad = (-self.offset) % 8
+        if pad:
+            self.chunks.append(b'\0' * pad)
+            self.offset += pad
+        info = {'dtype': arr.dtype.str, 'offset': self.offset, 'count': int(arr.size)}
+        data = arr.tobytes()
+        self.chunks.append(data)
+        self.offset += len(data)
+        return info
+
+    def intern(self, s):
+        # 같은 문자열(팀 이름, 포지션, 투타 등)은 한 번만 저장
+        if s not in self.string_ids:
+            self.string_ids[s] = len(self.strings)
+            self.strings.append(s)
+        return self.string_ids[s]
+
+def _compile_table(writer, groups):
+    rows = [row for group_rows in groups.values() for row in group_rows]
+    spans, start = [], 0
+    for name, group_rows in groups.items():
+        spans.append([name, start, start + len(group_rows)])
+        start += len(group_rows)
+
+    keys = []
+    for row in rows:
+        for key in row:
+            if key not in keys:
+                keys.append(key)
+
+    columns = {}
+    for key in keys:
+        present = np.array([key in row for row in rows], dtype=np.uint8)
+        values = [row[key] for row in rows if key in row]
+        kind = _column_kind(values)
+        col = {'kind': kind}
+        if not present.all():
+            col['present'] = writer.add_array(present)
+
+        filled = [row.get(key) for row in rows]
+        if kind == 'int':
+            col['data'] = writer.add_array(np.array([v if v is not None else 0 for v in filled], dtype=np.int64))
+        elif kind in ('float', 'num'):
+            col['data'] = writer.add_array(np.array([v if v is not None else np.nan for v in filled], dtype=np.float64))
+            if kind == 'num':
+                col['is_int'] = writer.add_array(np.array([type(v) is int for v in filled], dtype=np.uint8))
+        elif kind == 'str':
+            col['data'] = writer.add_array(np.array([writer.intern(v) if v is not None else -1 for v in filled], dtype=np.int32))
+        else:
+            col['values'] = filled
+        columns[key] = col
+
+    return {'groups': spans, 'keys': keys, 'rows': len(rows), 'columns': columns}
+
+def compile_snapshot(files, signature, digest):
+    """
+    파싱한 데이터(files: 속성 이름 -> 값)를 바이너리 스냅샷 bytes로 만듭니다.
+    signature/digest는 원본 JSON 파일의 (mtime, size) 서명과 내용 해시입니다.
+    """
+    writer = _Writer()
+    tables = {attr: _compile_table(writer, files.get(attr, {})) for attr in TABLE_ATTRS}
+    header = {
+        'format': FORMAT_VERSION,
+        'digest': digest,
+        'signature': [list(s) for s in signature],
+        'strings': writer.strings,
+        'tables': tables,
+        'raw': {attr: files.get(attr, {}) for attr in RAW_ATTRS},
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    prefix = MAGIC + struct.pack('<Q', len(header_bytes)) + header_bytes
+    prefix += b'\0' * ((-len(prefix)) % 8)
+    return prefix + b''.join(writer.chunks)
+
+# --- 로드 ---
+
+class ColumnTable:
+    """
+    열 단위로 저장된 표 (팀 -> 행 목록) 입니다.
+    - columns: 키 -> 읽기 전용 NumPy 배열 (숫자 열은 값, 문자열 열은 strings 번호)
+    - groups: 팀 -> (시작 행, 끝 행)
+    rows()/groups_as_dicts()로 기존 JSON과 같은 dict 구조를 다시 만들 수 있습니다.
+    """
+    def __init__(self, spec, buffer, strings):
+        self.keys = tuple(spec['keys'])
+        self.size = spec['rows']
+        self.groups = {name: (start, stop) for name, start, stop in spec['groups']}
+        self.strings = strings
+        self.kinds = {}
+        self.columns = {}
+        self._present = {}
+        self._is_int = {}
+        for key, col in spec['columns'].items():
+            self.kinds[key] = col['kind']
+            if 'data' in col:
+                self.columns[key] = _view(buffer, col['data'])
+            else:
+                self.columns[key] = col['values']
+            if 'present' in col:
+                self._present[key] = _view(buffer, col['present'])
+            if 'is_int' in col:
+                self._is_int[key] = _view(buffer, col['is_int'])
+
+    def numeric(self, key):
+        """숫자 열을 float 배열로 반환합니다. (값이 없는 행은 nan) 숫자 열이 아니면 None"""
+        kind = self.kinds.get(key)
+        if kind not in ('int', 'float', 'num'):
+            return None
+        arr = self.columns[key].astype(np.float64)
+        if key in self._present:
+            arr[self._present[key] == 0] = np.nan
+        return arr
+
+    def _python_column(self, key):
+        kind = self.kinds[key]
+        data = self.columns[key]
+        if kind == 'str':
+            values = [self.strings[i] if i >= 0 else None for i in data.tolist()]
+        elif kind == 'num':
+            values = [int(v) if is_int else v for v, is_int in zip(data.tolist(), self._is_int[key].tolist())]
+        elif kind in ('int', 'float'):
+            values = data.tolist()
+        else:
+            values = list(data)
+        return values
+
+    def rows(self):
+        """모든 행을 원래 JSON과 같은 dict 목록으로 만듭니다."""
+        columns = [(key, self._python_column(key), self._present.get(key)) for key in self.keys]
+        rows = [{} for _ in range(self.size)]
+        for key, values, present in columns:
+            if present is None:
+                for row, v in zip(rows, values):
+                    row[key] = v
+            else:
+                for row, v, p in zip(rows, values, present.tolist()):
+                    if p:
+                        row[key] = v
+        return rows
+
+    def groups_as_dicts(self):
+        """{팀: [행 dict, ...]} (원래 JSON 구조)"""
+        rows = self.rows()
+        return {name: rows[start:stop] for name, (start, stop) in self.groups.items()}
+
+def _view(buffer, info):
+    return np.frombuffer(buffer, dtype=np.dtype(info['dtype']), count=info['count'], offset=info['offset'])
+
+class CompiledSnapshot:
+    """로드한 바이너리 스냅샷 (헤더 + 메모리 매핑된 배열)"""
+    def __init__(self, header, buffer):
+        self.digest = header['digest']
+        self.signature = tuple(tuple(s) for s in header['signature'])
+        strings = tuple(header['strings'])
+        self.tables = {attr: ColumnTable(spec, buffer, strings) for attr, spec in header['tables'].items()}
+        self.raw = header['raw']
+
+    def files(self):
+        """DataSnapshot에 넘길 {속성 이름: 원래 JSON 구조} dict (호출할 때마다 새 dict/list를 만듭니다)"""
+        files = {attr: table.groups_as_dicts() for attr, table in self.tables.items()}
+        files.update(self.raw)
+        return files
+
+def parse_compiled(buffer):
+    """바이너리 스냅샷 bytes(또는 mmap)를 CompiledSnapshot으로 만듭니다. 형식이 맞지 않으면 None"""
+    if len(buffer) < len(MAGIC) + 8 or buffer[:len(MAGIC)] != MAGIC:
+        return None
+    header_len, = struct.unpack_from('<Q', buffer, len(MAGIC))
+    start = len(MAGIC) + 8
+    try:
+        header = json.loads(bytes(buffer[start:start + header_len]).decode('utf-8'))
+    except ValueError:
+        return None
+    if header.get('format') != FORMAT_VERSION:
+        return None
+
+    # 배열 위치는 헤더 뒤 8바이트 정렬 지점 기준
+    data_start = start + header_len
+    data_start += (-data_start) % 8
+    return CompiledSnapshot(header, memoryview(buffer)[data_start:])
+
+def read_compiled(path=None, use_mmap=None):
+    """
+    바이너리 스냅샷 파일을 읽습니다. 파일이 없거나 형식이 맞지 않으면 None
+    use_mmap이 True면 배열을 파일에서 직접 매핑합니다. (기본: config.COMPILED_DATA_MMAP)
+    """
+    path = path or config.COMPILED_DATA_PATH
+    if use_mmap is None:
+        use_mmap = config.COMPILED_DATA_MMAP
+    try:
+        with open(path, 'rb') as f:
+            if use_mmap:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = f.read()
+    except (OSError, ValueError):
+        return None
+    return parse_compiled(buffer)
+
+def write_compiled_bytes(data, path=None):
+    """compile_snapshot() 결과를 원자적으로 저장합니다. (임시 파일 -> 교체)"""
+    path = path or config.COMPILED_DATA_PATH
+    atomic_write_bytes(path, data)
+    return path
+
+def write_compiled(files, signature, digest, path=None):
+    """파싱한 데이터를 바이너리 스냅샷 파일로 저장합니다."""
+    return write_compiled_bytes(compile_snapshot(files, signature, digest), path)
+
+if __name__ == '__main__':
+    # 원본 JSON을 읽어 바이너리 스냅샷을 만듭니다.
+    from .static_data import build_compiled_snapshot
+    out = build_compiled_snapshot()
+    if out:
+        print(f"바이너리 스냅샷 생성: {out} ({os.path.getsize(out) / 1024:.0f}KB)")
@@ -0,0 +1,209 @@
+# [Util] 크기 제한이 있는 디스크 이미지 캐시 (LRU / LFU 제거, 원자적 저장)
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 동작 (프로세스 안에서는 그대로 안전)
+    fcntl = None
+
+from . import metrics
+from .file_utils import atomic_write_bytes
+
+# 여러 프로세스가 폴더를 정리할 때 쓰는 잠금 파일
+LOCK_FILE_NAME = '.lock'
+
+# 이 시간(초)보다 오래된 임시 파일만 지웁니다. (다른 워커가 아직 쓰는 중일 수 있음)
+TMP_FILE_GRACE_SECONDS = 60
+
+class DiskCache:
+    """
+    key -> 파일 하나로 저장하는 캐시입니다.
+    파일 개수(max_files)나 전체 크기(max_bytes)를 넘으면 policy('lru' 또는 'lfu')에 따라 제거합니다.
+    용량은 저장할 때마다 폴더를 다시 읽어(잠금 파일로 프로세스 간 순서 보장) 실제 파일 기준으로 맞추므로,
+    여러 워커 프로세스가 같은 폴더를 써도 폴더 전체가 제한을 넘지 않습니다.
+    - lru: 파일 mtime이 마지막 사용 시각 (캐시 적중 시 mtime 갱신)
+    - lfu: 사용 횟수는 프로세스마다 따로 세고, 이 프로세스가 모르는 파일은 0회로 봅니다.
+    """
+    def __init__(self, directory, prefix='', suffix='.png', max_files=1000, max_bytes=None, policy='lru'):
+        if policy not in ('lru', 'lfu'):
+            raise ValueError(f"지원하지 않는 제거 정책입니다: {policy}")
+        self.directory = directory
+        self.prefix = prefix
+        self.suffix = suffix
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._entries = {}  # key -> [크기, 마지막 사용 시각, 사용 횟수]
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def path_for(self, key):
+        return os.path.join(self.directory, f"{self.prefix}{key}{self.suffix}")
+
+    def file_name(self, key):
+        return os.path.basename(self.path_for(key))
+
+    def _key_from_name(self, name):
+        if name.startswith(self.prefix) and name.endswith(self.suffix):
+            return name[len(self.prefix):len(name) - len(self.suffix)]
+        return None
+
+    @contextmanager
+    def _dir_lock(self):
+        # 같은 폴더를 쓰는 다른 프로세스(gunicorn 워커 등)와 정리 작업이 겹치지 않도록
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.directory, LOCK_FILE_NAME), 'a') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _scan(self):
+        # 폴더에 실제로 있는 캐시 파일 {key: [크기, mtime, 사용 횟수]} (다른 프로세스가 저장한 파일 포함)
+        # 이 캐시 형식이 아닌 파일의 경로 목록도 함께 반환합니다.
+        entries, others = {}, []
+        for entry in os.scandir(self.directory):
+            if entry.name == LOCK_FILE_NAME or not entry.is_file():
+                continue
+            key = self._key_from_name(entry.name)
+            if entry.name.startswith('.tmp-') or key is None or not key.isalnum():
+                others.append(entry)
+                continue
+            try:
+                st = entry.stat()
+            except OSError:  # 다른 프로세스가 방금 지운 파일
+                continue
+            entries[key] = [st.st_size, st.st_mtime, 0]
+        return entries, others
+
+    def _refresh_locked(self, entries):
+        # 폴더 기준 목록으로 교체 (이 프로세스가 센 사용 횟수는 유지)
+        for key, entry in entries.items():
+            old = self._entries.get(key)
+            if old:
+                entry[2] = old[2]
+        self._entries = entries
+        self._bytes = sum(e[0] for e in entries.values())
+
+    def sweep(self):
+        """
+        시작 시 폴더를 정리합니다.
+        오래된 임시 파일(TMP_FILE_GRACE_SECONDS 이상)과 이 캐시 형식이 아닌 파일(예전 compare_<a>_vs_<b>.png)을 지우고,
+        기존 파일을 캐시 목록에 다시 등록한 뒤 용량 제한을 적용합니다.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        removed = 0
+        with self._dir_lock():
+            entries, others = self._scan()
+            now = time.time()
+            for entry in others:
+                try:
+                    # 임시 파일은 다른 워커가 아직 쓰는 중일 수 있으므로 오래된 것만
+                    if entry.name.startswith('.tmp-') and now - entry.stat().st_mtime < TMP_FILE_GRACE_SECONDS:
+                        continue
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+
+            with self._lock:
+                self._refresh_locked(entries)
+                self._evict_locked()
+        return removed
+
+    def get(self, key):
+        """저장된 bytes를 반환합니다. 없으면 None"""
+        path = self.path_for(key)
+        try:
+            with metrics.phase('file_io'), open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+                entry = self._entries.pop(key, None)
+                if entry:
+                    self._bytes -= entry[0]
+            return None
+
+        # lru: 다른 프로세스도 알 수 있도록 파일 mtime을 마지막 사용 시각으로
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+            entry = self._entries.get(key)
+            if entry is None:
+                # 다른 프로세스가 저장한 파일
+                entry = self._entries[key] = [len(data), 0, 0]
+                self._bytes += len(data)
+            entry[1] = time.time()
+            entry[2] += 1
+        return data
+
+    def put(self, key, data):
+        """
+        bytes를 원자적으로 저장하고, 폴더의 실제 파일 기준으로 용량 제한을 적용합니다.
+        저장한 파일 경로를 반환합니다. 저장하지 못하면 OSError
+        """
+        path = self.path_for(key)
+        with metrics.phase('file_io'):
+            atomic_write_bytes(path, data)
+            with self._dir_lock():
+                entries, _ = self._scan()
+                with self._lock:
+                    count = self._entries[key][2] if key in self._entries else 0
+                    entries[key] = [len(data), time.time(), count + 1]
+                    self._refresh_locked(entries)
+                    self._evict_locked(keep=key)
+        return path
+
+    def _evict_locked(self, keep=None):
+        def over():
+            return (len(self._entries) > self.max_files or
+                    (self.max_bytes is not None and self._bytes > self.max_bytes))
+        if not over():
+            return
+
+        if self.policy == 'lfu':
+            order = sorted(self._entries, key=lambda k: (self._entries[k][2], self._entries[k][1]))
+        else:
+            order = sorted(self._entries, key=lambda k: self._entries[k][1])
+
+        for key in order:
+            if not over():
+                break
+            if key == keep:
+                continue
+            size = self._entries.pop(key)[0]
+            self._bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(self.path_for(key))
+            except OSError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'files': len(self._entries),
+                'bytes': self._bytes,
+                'max_files': self.max_files,
+                'max_bytes': self.max_bytes,
+                'policy': self.policy,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / total, 4) if total else 0.0,
+            }
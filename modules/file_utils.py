@@ -0,0 +1,25 @@
+# [Util] 파일 저장 도우미
+
+import os
+import tempfile
+
+def atomic_write_bytes(path, data):
+    """
+    같은 폴더의 임시 파일에 먼저 쓴 뒤 os.replace로 교체합니다.
+    다른 요청이 읽는 중에도 반쯤 쓰인 파일이 보이지 않습니다.
+    """
+    save_dir = os.path.dirname(path) or '.'
+    os.makedirs(save_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=save_dir, prefix='.tmp-', suffix=os.path.splitext(path)[1])
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp는 0600으로 만들므로, 웹 서버가 static 파일로 직접 읽을 수 있게 일반 파일 권한으로
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,65 @@
+# [View] 차트용 한글 폰트 등록 (프로세스당 1회)
+
+import os
+import threading
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.font_manager as fm
+
+import config
+
+KOREAN_FONT_NAME = 'KoreanFont'
+
+_lock = threading.Lock()
+_resolved = False
+_font_family = 'sans-serif'
+_font_path = None
+
+def _find_korean_font():
+    """
+    config.KOREAN_FONT_PATH가 지정되어 있으면 그 경로를 사용하고,
+    없으면 시스템 폰트 중 키워드(Nanum, Gothic, Malgun)가 포함된 첫 폰트를 찾습니다.
+    """
+    pinned = config.KOREAN_FONT_PATH
+    if pinned:
+        if os.path.exists(pinned):
+            return pinned
+        print(f"지정한 한글 폰트를 찾을 수 없습니다: {pinned}")
+
+    for font in fm.findSystemFonts(fontpaths=None, fontext='ttf'):
+        if any(keyword in font for keyword in config.KOREAN_FONT_KEYWORDS):
+            return font
+    return None
+
+def get_font_family():
+    """
+    한글 폰트를 한 번만 찾아서 fontManager에 등록하고, 차트에 사용할 font.family 이름을 반환합니다.
+    한글 폰트가 없으면 'sans-serif'를 반환합니다.
+    rcParams도 이때 한 번만 설정하며, 이후 렌더링 중에는 읽기만 합니다. (스레드 안전)
+    """
+    global _resolved, _font_family, _font_path
+    if _resolved:
+        return _font_family
+
+    with _lock:
+        if not _resolved:
+            _font_path = _find_korean_font()
+            if _font_path:
+                fe = fm.FontEntry(fname=_font_path, name=KOREAN_FONT_NAME)
+                fm.fontManager.ttflist.insert(0, fe)
+                _font_family = KOREAN_FONT_NAME
+            matplotlib.rcParams['font.family'] = _font_family
+            matplotlib.rcParams['axes.unicode_minus'] = False
+            _resolved = True
+    return _font_family
+
+def get_font_path():
+    """등록된 한글 폰트 파일 경로를 반환합니다. (없으면 None)"""
+    get_font_family()
+    return _font_path
+
+def apply_korean_font():
+    """
+    차트를 그리기 전에 호출합니다. 한글 폰트 등록과 rcParams 설정은 프로세스당 1회만 수행됩니다.
+    """
+    get_font_family()
@@ -0,0 +1,90 @@
+# [Model] 팀 간 상대 전적 행렬 (NumPy, 데이터 스냅샷마다 1회 계산)
+# kbo_team_comparison.json을 팀 x 상대팀 행렬(승/패/무/승률)로 한 번만 변환하고,
+# 이후 (팀, 상대팀) 조회는 인덱스 두 번으로 끝납니다.
+
+import numpy as np
+
+from .static_data import get_snapshot
+
+def _to_int(val):
+    try:
+        return int(val)
+    except (TypeError, ValueError):
+        return None
+
+def _to_float(val):
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return None
+
+class HeadToHead:
+    """
+    팀 x 상대팀 행렬을 담습니다. 행은 팀, 열은 상대팀이며 순서는 teams와 같습니다.
+    - W, L, D: 승/패/무 (int, 기록이 없거나 자기 자신이면 0)
+    - PCT: 승률 (기록이 없거나 자기 자신이면 nan)
+    - played: 기록이 있는 칸이면 True
+    """
+    def __init__(self, comparison_data):
+        self.teams = tuple(comparison_data)
+        self.team_index = {name: i for i, name in enumerate(self.teams)}
+        n = len(self.teams)
+
+        self.W = np.zeros((n, n), dtype=np.int16)
+        self.L = np.zeros((n, n), dtype=np.int16)
+        self.D = np.zeros((n, n), dtype=np.int16)
+        self.PCT = np.full((n, n), np.nan)
+        self.played = np.zeros((n, n), dtype=bool)
+
+        for team, records in comparison_data.items():
+            i = self.team_index[team]
+            for record in records:
+                j = self.team_index.get(record.get('Opponent'))
+                if j is None or i == j:
+                    continue
+                w, l, d = (_to_int(record.get(k)) for k in ('W', 'L', 'D'))
+                if None in (w, l, d):
+                    continue
+                self.W[i, j], self.L[i, j], self.D[i, j] = w, l, d
+                self.played[i, j] = True
+
+                # 승률이 문자열이거나 없으면 승/패로 계산
+                pct = _to_float(record.get('Winning_PCT'))
+                if pct is None and w + l > 0:
+                    pct = w / (w + l)
+                if pct is not None:
+                    self.PCT[i, j] = pct
+
+    def pair(self, team, opponent):
+        """team 기준 opponent 상대 전적 dict. 기록이 없으면 None"""
+        i = self.team_index.get(team)
+        j = self.team_index.get(opponent)
+        if i is None or j is None or not self.played[i, j]:
+            return None
+        pct = self.PCT[i, j]
+        return {
+            'team': team,
+            'opponent': opponent,
+            'W': int(self.W[i, j]),
+            'L': int(self.L[i, j]),
+            'D': int(self.D[i, j]),
+            'PCT': None if np.isnan(pct) else float(pct),
+        }
+
+    def to_dict(self):
+        """JSON 변환용 전체 행렬 (nan/기록 없음은 None)"""
+        def grid(matrix, cast):
+            return [[cast(matrix[i, j]) if self.played[i, j] else None
+                     for j in range(len(self.teams))]
+                    for i in range(len(self.teams))]
+        return {
+            'teams': list(self.teams),
+            'W': grid(self.W, int),
+            'L': grid(self.L, int),
+            'D': grid(self.D, int),
+            'PCT': grid(self.PCT, lambda v: None if np.isnan(v) else float(v)),
+        }
+
+def get_head_to_head():
+    """현재 데이터 스냅샷의 상대 전적 행렬을 반환합니다."""
+    return get_snapshot().derived('head_to_head', lambda snap: HeadToHead(snap.comparison_data))
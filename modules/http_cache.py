@@ -0,0 +1,85 @@
+# [HTTP] 조건부 요청 처리 (ETag / Last-Modified / Cache-Control)
+
+import hashlib
+import os
+import threading
+from datetime import datetime, timezone
+
+from flask import request, make_response
+
+import config
+from .static_data import get_snapshot
+
+_file_etags = {}  # 파일 경로 -> (mtime_ns, size, etag)
+_file_etags_lock = threading.Lock()
+
+def data_etag(*parts):
+    """
+    현재 데이터 스냅샷의 해시와 요청 구분 값(parts)으로 ETag를 만듭니다.
+    데이터 파일이 바뀌면 ETag도 바뀝니다.
+    """
+    payload = '\x1f'.join([get_snapshot().digest] + [str(p) for p in parts])
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def data_last_modified():
+    """데이터 파일 중 가장 최근 수정 시각"""
+    mtimes = [mtime for _, mtime, _ in get_snapshot().signature if mtime is not None]
+    if not mtimes:
+        return None
+    return datetime.fromtimestamp(max(mtimes) / 1e9, tz=timezone.utc)
+
+def file_etag(path):
+    """
+    파일 내용의 sha1을 ETag로 사용합니다. (mtime/size가 같으면 다시 계산하지 않음)
+    파일이 없으면 None
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    with _file_etags_lock:
+        cached = _file_etags.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    etag = digest.hexdigest()
+    with _file_etags_lock:
+        _file_etags[path] = (st.st_mtime_ns, st.st_size, etag)
+    return etag
+
+def static_family(filename):
+    """static 파일 경로가 생성된 파일인지 고정 파일인지 구분합니다."""
+    if filename.startswith(config.GENERATED_STATIC_PREFIXES):
+        return 'generated'
+    return 'static'
+
+def is_not_modified(etag):
+    """요청의 If-None-Match가 etag와 일치하면 True"""
+    return etag is not None and request.if_none_match.contains(etag)
+
+def not_modified(etag, family, last_modified=None):
+    """본문 없는 304 응답"""
+    response = make_response('', 304)
+    return apply_headers(response, etag, family, last_modified)
+
+def apply_headers(response, etag, family, last_modified=None):
+    """ETag, Last-Modified, Cache-Control 헤더를 설정합니다."""
+    if etag is not None:
+        response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    cache_control = config.HTTP_CACHE_CONTROL.get(family)
+    if cache_control:
+        response.headers['Cache-Control'] = cache_control
+    return response
+
+def conditional(response, etag, family, last_modified=None):
+    """
+    헤더를 설정하고, 요청의 조건(If-None-Match / If-Modified-Since)을 만족하면 304로 바꿉니다.
+    """
+    apply_headers(response, etag, family, last_modified)
+    return response.make_conditional(request)
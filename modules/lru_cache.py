@@ -0,0 +1,64 @@
+# [Util] 크기 제한이 있는 LRU 캐시 (스레드 안전, 적중/미스 통계)
+
+import threading
+from collections import OrderedDict
+
+class LRUCache:
+    """
+    최근에 사용한 항목을 남기고 오래된 항목부터 버리는 캐시입니다.
+    max_items(개수)와 max_bytes(값 크기 합계, bytes 값 기준) 중 하나라도 넘으면 제거합니다.
+    """
+    def __init__(self, max_items=128, max_bytes=None):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _size(value):
+        return len(value) if isinstance(value, (bytes, bytearray)) else 0
+
+    def get(self, key):
+        """값이 있으면 반환하고 가장 최근 항목으로 옮깁니다. 없으면 None"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            if key in self._data:
+                self._bytes -= self._size(self._data.pop(key))
+            self._data[key] = value
+            self._bytes += self._size(value)
+            while self._data and (len(self._data) > self.max_items or
+                                  (self.max_bytes is not None and self._bytes > self.max_bytes)):
+                _, old = self._data.popitem(last=False)
+                self._bytes -= self._size(old)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'items': len(self._data),
+                'bytes': self._bytes,
+                'max_items': self.max_items,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / total, 4) if total else 0.0,
+            }
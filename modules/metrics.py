@@ -0,0 +1,220 @@
+# [Util] 요청 처리 시간 / 단계별 시간 / 캐시 적중 / 차트 렌더링 횟수 측정
+# /metrics에서 Prometheus 텍스트 형식으로 내보냅니다. (값은 프로세스마다 따로 쌓입니다)
+#
+# 단계(phase) 이름
+#   data_load     데이터 파일/바이너리 스냅샷 로드 (static_data)
+#   index_lookup  팀/선수 조회
+#   render_<차트> 차트 한 장 그리기 (render_runs, render_pythagorean, render_compare ...)
+#   render_wait   요청 스레드가 백그라운드 렌더링을 기다린 시간 (render_service)
+#   template      Jinja 템플릿 렌더링
+#   file_io       생성 이미지/캐시 파일 읽기/쓰기
+# 단계는 겹칠 수 있습니다. (예: 첫 index_lookup 안에서 data_load가 일어남)
+# 백그라운드 렌더링 스레드의 단계는 작업을 넣은 요청의 route로 기록합니다.
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+import config
+
+# 이름 -> (종류, 설명)
+METRICS = {
+    'kbo_request_duration_seconds': ('histogram', '라우트별 요청 처리 시간'),
+    'kbo_request_phase_seconds': ('histogram', '라우트별 단계 처리 시간 (요청 밖에서 일어난 단계는 route="background")'),
+    'kbo_chart_render_seconds': ('histogram', '차트 종류별 렌더링 시간'),
+    'kbo_chart_renders_total': ('counter', '차트 종류별 렌더링 횟수'),
+    'kbo_render_deferred_total': ('counter', '대기 시간 안에 끝나지 않아 자리 표시 이미지로 응답한 차트 수'),
+    'kbo_cache_hits_total': ('counter', '캐시 적중 횟수'),
+    'kbo_cache_misses_total': ('counter', '캐시 미스 횟수'),
+    'kbo_cache_evictions_total': ('counter', '캐시에서 밀려난 항목 수'),
+    'kbo_cache_entries': ('gauge', '캐시 항목 수'),
+    'kbo_cache_bytes': ('gauge', '캐시 크기 (bytes)'),
+}
+
+_lock = threading.Lock()
+_counters = {}    # 이름 -> {라벨 tuple: 값}
+_histograms = {}  # 이름 -> {라벨 tuple: [버킷별 개수..., +Inf 개수, 합계]}
+_caches = {}      # 캐시 이름 -> stats() 함수
+_local = threading.local()  # 현재 스레드가 처리 중인 요청 (route, 시작 시각, 단계별 시간)
+
+def _labels(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+def inc(name, value=1, **labels):
+    """카운터를 value만큼 올립니다."""
+    if not config.METRICS_ENABLED:
+        return
+    key = _labels(labels)
+    with _lock:
+        series = _counters.setdefault(name, {})
+        series[key] = series.get(key, 0) + value
+
+def observe(name, seconds, **labels):
+    """히스토그램에 값(초)을 기록합니다."""
+    if not config.METRICS_ENABLED:
+        return
+    buckets = config.METRICS_BUCKETS
+    key = _labels(labels)
+    with _lock:
+        series = _histograms.setdefault(name, {})
+        counts = series.get(key)
+        if counts is None:
+            counts = series[key] = [0] * (len(buckets) + 1) + [0.0]
+        counts[bisect.bisect_left(buckets, seconds)] += 1
+        counts[-1] += seconds
+
+def register_cache(name, stats):
+    """
+    캐시 통계 함수를 등록합니다. stats()는 hits/misses/evictions와
+    items(또는 files), bytes 값을 가진 dict를 반환해야 합니다. (LRUCache/DiskCache.stats 형식)
+    """
+    with _lock:
+        _caches[name] = stats
+
+# --- 요청 / 단계 ---
+
+def begin_request(route):
+    """요청 처리를 시작할 때 호출합니다. (app.before_request)"""
+    _local.route = route
+    _local.start = time.perf_counter()
+    _local.phases = {}
+
+def end_request(method, status):
+    """
+    요청 처리 시간을 기록하고 (전체 시간, {단계: 시간})을 반환합니다.
+    begin_request() 없이 호출되면 None
+    """
+    start = getattr(_local, 'start', None)
+    if start is None:
+        return None
+    elapsed = time.perf_counter() - start
+    route = _local.route or 'unknown'
+    phases = _local.phases
+    _local.start = _local.route = _local.phases = None
+    observe('kbo_request_duration_seconds', elapsed, route=route, method=method, status=status)
+    return elapsed, phases
+
+def current_route():
+    """현재 스레드가 처리 중인 요청의 route (요청 밖이면 None)"""
+    return getattr(_local, 'route', None)
+
+@contextmanager
+def route_label(route):
+    """
+    요청 대신 다른 스레드에서 실행하는 작업(render_service)의 단계를 그 요청의 route로 기록합니다.
+    요청 처리 시간/Server-Timing에는 더하지 않습니다.
+    """
+    previous = getattr(_local, 'route', None)
+    _local.route = route
+    try:
+        yield
+    finally:
+        _local.route = previous
+
+@contextmanager
+def phase(name):
+    """with 블록의 시간을 단계 name으로 기록합니다. 같은 요청에서 같은 단계가 여러 번이면 합산"""
+    if not config.METRICS_ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        phases = getattr(_local, 'phases', None)
+        if phases is not None:
+            phases[name] = phases.get(name, 0.0) + elapsed
+        observe('kbo_request_phase_seconds', elapsed,
+                route=getattr(_local, 'route', None) or 'background', phase=name)
+
+@contextmanager
+def render_timer(chart):
+    """차트 한 장을 그리는 시간 (단계 render_<chart> + 차트별 렌더링 시간/횟수)"""
+    start = time.perf_counter()
+    with phase(f'render_{chart}'):
+        yield
+    observe('kbo_chart_render_seconds', time.perf_counter() - start, chart=chart)
+    inc('kbo_chart_renders_total', chart=chart)
+
+def server_timing(total, phases):
+    """Server-Timing 헤더 값 (브라우저 개발자 도구에서 단계별 시간 확인용, 단위 ms)"""
+    parts = [f'{name};dur={seconds * 1000:.1f}' for name, seconds in phases.items()]
+    parts.append(f'total;dur={total * 1000:.1f}')
+    return ', '.join(parts)
+
+# --- Prometheus 텍스트 형식 ---
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+def _format_value(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+def _cache_samples():
+    # 캐시 통계를 수집 시점에 읽어 (이름, 라벨, 값) 목록으로 변환
+    with _lock:
+        caches = list(_caches.items())
+    samples = []
+    for cache_name, stats in caches:
+        try:
+            s = stats()
+        except Exception as e:
+            print(f"캐시 통계 수집 실패 ({cache_name}): {e}")
+            continue
+        labels = (('cache', cache_name),)
+        samples += [
+            ('kbo_cache_hits_total', labels, s.get('hits', 0)),
+            ('kbo_cache_misses_total', labels, s.get('misses', 0)),
+            ('kbo_cache_evictions_total', labels, s.get('evictions', 0)),
+            ('kbo_cache_entries', labels, s.get('items', s.get('files', 0))),
+            ('kbo_cache_bytes', labels, s.get('bytes', 0)),
+        ]
+    return samples
+
+def render_prometheus():
+    """모든 지표를 Prometheus 텍스트 형식(0.0.4)으로 반환합니다."""
+    buckets = config.METRICS_BUCKETS
+    with _lock:
+        counters = {name: dict(series) for name, series in _counters.items()}
+        histograms = {name: {k: list(v) for k, v in series.items()} for name, series in _histograms.items()}
+
+    gauges = {}
+    for name, labels, value in _cache_samples():
+        target = counters if METRICS[name][0] == 'counter' else gauges
+        target.setdefault(name, {})[labels] = value
+
+    lines = []
+    for name, (kind, help_text) in METRICS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        if kind == 'histogram':
+            for labels, counts in sorted(histograms.get(name, {}).items()):
+                cumulative = 0
+                for le, count in zip(buckets, counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{_format_labels(labels, [("le", repr(float(le)))])} {cumulative}')
+                cumulative += counts[len(buckets)]
+                lines.append(f'{name}_bucket{_format_labels(labels, [("le", "+Inf")])} {cumulative}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(counts[-1])}')
+                lines.append(f'{name}_count{_format_labels(labels)} {cumulative}')
+        else:
+            series = (counters if kind == 'counter' else gauges).get(name, {})
+            for labels, value in sorted(series.items()):
+                lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+def reset():
+    """기록한 값을 모두 지웁니다. (등록한 캐시는 유지)"""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
@@ -0,0 +1,115 @@
+# [Model] 리그 스탯 순위표 (스탯별 정렬 배열, 데이터 스냅샷마다 1회 생성)
+
+import numpy as np
+
+import config
+from .player_percentiles import NON_STAT_KEYS, MAX_MIN_PA
+from .static_data import get_snapshot
+
+class PlayerLeaders:
+    """
+    모든 선수의 스탯별 순위표를 데이터 스냅샷마다 한 번만 정렬해 둡니다.
+    순위표는 (정렬된 행 번호, 정렬된 값) 배열이며 내림차순/오름차순을 모두 갖고 있습니다.
+    최소 타석(min_pa)/포지션(pos) 조건은 조회할 때 정렬된 배열에 마스크를 씌워 적용하므로
+    요청마다 정렬하지 않고, 조건 조합마다 순위표를 따로 만들어 두지도 않습니다.
+    - 동률은 같은 순위이고 다음 순위는 건너뜁니다. (1, 2, 2, 4)
+    - 동률 안에서는 WAR 내림차순 -> Id 순서
+    - 값이 없는 선수는 그 스탯 순위표에서 빠집니다.
+    """
+    def __init__(self, table, rows):
+        self._rows = rows
+        self._boards = {}  # (스탯, 내림차순 여부) -> (행 번호, 값)
+
+        if table is None or not rows:
+            self.stats = ()
+            self._pa = np.zeros(0)
+            self._pos = np.zeros(0, dtype=object)
+            return
+
+        pa = table.numeric('PA')
+        self._pa = pa if pa is not None else np.full(len(rows), np.nan)
+        self._pos = np.array([r.get('Pos.') for r in rows], dtype=object)
+
+        war = table.numeric('WAR')
+        war = np.nan_to_num(war, nan=-99.0) if war is not None else np.zeros(len(rows))
+        ids = table.numeric('Id')
+        ids = ids if ids is not None else np.arange(len(rows), dtype=float)
+
+        stats = []
+        for key in table.keys:
+            values = table.numeric(key) if key not in NON_STAT_KEYS else None
+            if values is None:
+                continue
+            idx = np.flatnonzero(~np.isnan(values))
+            if idx.size == 0:
+                continue
+            stats.append(key)
+            for descending in (True, False):
+                primary = -values[idx] if descending else values[idx]
+                order = idx[np.lexsort((ids[idx], -war[idx], primary))]
+                self._boards[(key, descending)] = (order, values[order])
+        self.stats = tuple(stats)
+
+    def _pool_mask(self, min_pa, pos):
+        # 행 번호 -> 조건을 만족하는지 (타석 기록이 없는 선수는 제외)
+        with np.errstate(invalid='ignore'):
+            mask = self._pa >= min_pa
+        if pos is not None:
+            mask &= self._pos == pos
+        return mask
+
+    def pool_size(self, min_pa=0, pos=None):
+        """조건을 만족하는 선수 수"""
+        return int(self._pool_mask(min_pa, pos).sum())
+
+    def page(self, stat, n=10, offset=0, descending=True, include_ties=False, min_pa=0, pos=None):
+        """
+        (조건을 만족하는 순위표 선수 수, [{rank, tied, Id, Name, Team, Pos, PA, value}, ...])를 반환합니다.
+        include_ties면 마지막 행과 동률인 선수까지 이어서 포함합니다.
+        없는 스탯이면 None
+        """
+        board = self._boards.get((stat, descending))
+        if board is None:
+            return None
+        order, values = board
+        keep = self._pool_mask(min_pa, pos)[order]
+        order, values = order[keep], values[keep]
+        total = int(order.size)
+        start = min(offset, total)
+        stop = min(start + n, total)
+        if include_ties:
+            while start < stop < total and values[stop] == values[stop - 1]:
+                stop += 1
+
+        # 순위 = 더 좋은 값을 가진 선수 수 + 1 (반환할 행만 계산)
+        ranked = -values if descending else values
+        ranks = np.searchsorted(ranked, ranked[start:stop], side='left') + 1
+
+        results = []
+        for i, rank in zip(range(start, stop), ranks.tolist()):
+            p = self._rows[order[i]]
+            tied = (i > 0 and values[i - 1] == values[i]) or (i + 1 < total and values[i + 1] == values[i])
+            results.append({
+                'rank': rank,
+                'tied': bool(tied),
+                'Id': p['Id'],
+                'Name': p['Name'],
+                'Team': p.get('Team'),
+                'Pos': p.get('Pos.'),
+                'PA': p.get('PA'),
+                'value': p.get(stat),
+            })
+        return total, results
+
+def resolve_min_pa(min_pa=None):
+    """생략하면 config.PLAYER_LEADERS_MIN_PA, 0 ~ MAX_MIN_PA 범위로 제한"""
+    if min_pa is None:
+        min_pa = config.PLAYER_LEADERS_MIN_PA
+    return max(0, min(int(min_pa), MAX_MIN_PA))
+
+def get_player_leaders():
+    """현재 데이터 스냅샷의 순위표를 반환합니다."""
+    def build(snap):
+        rows = [p for players in snap.player_data.values() for p in players]
+        return PlayerLeaders(snap.columns.get('player_data'), rows)
+    return get_snapshot().derived('player_leaders', build)
@@ -0,0 +1,101 @@
+# [Model] 리그 전체 선수 스탯 백분위 (NumPy, 데이터 스냅샷마다 1회 계산)
+
+import numpy as np
+
+import config
+from .lru_cache import LRUCache
+from .static_data import get_snapshot
+
+# 숫자지만 비교 대상이 아닌 키
+NON_STAT_KEYS = {'Id', 'Year'}
+
+# min_pa 값마다 엔진을 따로 만들기 때문에 허용 범위를 제한합니다. (한 시즌 최대 타석 수준)
+MAX_MIN_PA = 700
+
+class PlayerPercentiles:
+    """
+    최소 타석(min_pa) 이상인 선수들의 스탯별 정렬 배열을 미리 만들어 두고,
+    백분위/순위를 이진 탐색(O(log n))으로 계산합니다.
+    선수 데이터의 열 단위 표(compiled_data.ColumnTable)에서 바로 만듭니다.
+    """
+    def __init__(self, table, min_pa=0):
+        self.min_pa = min_pa
+        self._sorted = {}
+        pa = table.numeric('PA') if table is not None else None
+        if pa is None:
+            self.pool_size = 0
+            self.stats = ()
+            return
+
+        with np.errstate(invalid='ignore'):
+            pool = pa >= min_pa  # 타석 기록이 없는 선수(nan)는 제외
+        self.pool_size = int(pool.sum())
+
+        stats = []
+        for key in table.keys:
+            values = table.numeric(key) if key not in NON_STAT_KEYS else None
+            if values is None:
+                continue
+            values = values[pool & ~np.isnan(values)]
+            if values.size:
+                stats.append(key)
+                self._sorted[key] = np.sort(values)
+        self.stats = tuple(stats)
+
+    def percentile(self, stat, value):
+        """value가 리그에서 몇 백분위인지 (0~100, 동률은 절반만 아래로 계산). 계산할 수 없으면 None"""
+        arr = self._sorted.get(stat)
+        value = _number(value)
+        if arr is None or arr.size == 0 or value is None:
+            return None
+        left = np.searchsorted(arr, value, side='left')
+        right = np.searchsorted(arr, value, side='right')
+        return float((left + (right - left) / 2) / arr.size * 100)
+
+    def rank(self, stat, value):
+        """value보다 큰 값을 가진 선수 수 + 1 (높을수록 좋은 스탯 기준 순위). 계산할 수 없으면 None"""
+        arr = self._sorted.get(stat)
+        value = _number(value)
+        if arr is None or arr.size == 0 or value is None:
+            return None
+        return int(arr.size - np.searchsorted(arr, value, side='right') + 1)
+
+    def player_report(self, player, stats=None):
+        """선수 한 명의 스탯별 값, 백분위, 순위"""
+        report = {}
+        for stat in (self.stats if stats is None else stats):
+            value = player.get(stat)
+            pct = self.percentile(stat, value)
+            report[stat] = {
+                'value': value,
+                'percentile': round(pct, 1) if pct is not None else None,
+                'rank': self.rank(stat, value),
+                'of': int(self._sorted[stat].size) if stat in self._sorted else 0,
+            }
+        return report
+
+def _number(val):
+    if isinstance(val, bool):
+        return None
+    if isinstance(val, (int, float)):
+        return float(val)
+    return None
+
+def get_player_percentiles(min_pa=None):
+    """
+    현재 데이터 스냅샷의 백분위 엔진을 반환합니다.
+    min_pa를 생략하면 config.PLAYER_PERCENTILE_MIN_PA를 사용합니다.
+    min_pa 값별 엔진은 스냅샷마다 최근 config.PLAYER_PERCENTILE_CACHE_ITEMS개만 보관합니다.
+    """
+    if min_pa is None:
+        min_pa = config.PLAYER_PERCENTILE_MIN_PA
+    min_pa = max(0, min(int(min_pa), MAX_MIN_PA))
+
+    snapshot = get_snapshot()
+    engines = snapshot.derived('player_percentiles',
+                               lambda snap: LRUCache(max_items=config.PLAYER_PERCENTILE_CACHE_ITEMS))
+    engine = engines.get(min_pa)
+    if engine is None:
+        engine = PlayerPercentiles(snapshot.columns.get('player_data'), min_pa)
+        engines.put(min_pa, engine)
+    return engine
@@ -0,0 +1,101 @@
+# [Model] 선수 이름 검색 인덱스 (접두어 / 부분 문자열 / 초성, 데이터 스냅샷마다 1회 생성)
+
+import unicodedata
+
+import config
+from .static_data import get_snapshot
+
+# 한글 음절의 초성 (유니코드 순서, 한글 호환 자모)
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+SYLLABLES_PER_CHOSUNG = 21 * 28
+
+# 일치 종류 (작을수록 먼저 표시)
+MATCH_TYPES = ('exact', 'prefix', 'chosung_prefix', 'substring', 'chosung_substring', 'info')
+
+# 검색어 최대 길이 (이보다 긴 부분 문자열은 색인하지 않음)
+MAX_QUERY_LENGTH = 20
+
+def normalize(text):
+    """NFC 정규화 + 소문자 + 공백 제거"""
+    return ''.join(unicodedata.normalize('NFC', str(text or '')).lower().split())
+
+def to_chosung(text):
+    """한글 음절을 초성으로 바꿉니다. (예: '김선빈' -> 'ㄱㅅㅂ', 한글이 아닌 글자는 그대로)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_FIRST <= code <= HANGUL_LAST:
+            out.append(CHOSUNG[(code - HANGUL_FIRST) // SYLLABLES_PER_CHOSUNG])
+        else:
+            out.append(ch)
+    return ''.join(out)
+
+def _substrings(text):
+    # (부분 문자열, 접두어 여부)
+    for start in range(len(text)):
+        for end in range(start + 1, min(len(text), start + MAX_QUERY_LENGTH) + 1):
+            yield text[start:end], start == 0
+
+def _war(player):
+    try:
+        return float(player.get('WAR', -99))
+    except (TypeError, ValueError):
+        return -99.0
+
+class PlayerSearch:
+    """
+    검색어 -> 결과 목록을 미리 만들어 둔 검색 인덱스입니다.
+    이름(Name)과 이름 초성의 모든 부분 문자열, config.PLAYER_SEARCH_FIELDS(출신교, 지명 정보)의
+    부분 문자열을 색인하고, 결과는 (일치 종류, WAR 내림차순) 순서로 미리 정렬합니다.
+    검색은 dict 조회 1번 + 필요한 개수만큼 자르기이므로 선수 수와 관계없습니다.
+    """
+    def __init__(self, player_data, fields=()):
+        players = sorted((p for team in player_data.values() for p in team), key=_war, reverse=True)
+        self._players = tuple(players)
+
+        best = {}  # 검색어 -> {선수 순서: 일치 종류 번호}
+
+        def add(key, order, tier):
+            matches = best.setdefault(key, {})
+            if tier < matches.get(order, len(MATCH_TYPES)):
+                matches[order] = tier
+
+        for order, p in enumerate(players):
+            name = normalize(p.get('Name'))
+            for key, is_prefix in _substrings(name):
+                add(key, order, 0 if key == name else 1 if is_prefix else 3)
+            for key, is_prefix in _substrings(to_chosung(name)):
+                add(key, order, 2 if is_prefix else 4)
+            for field in fields:
+                for key, _ in _substrings(normalize(p.get(field))):
+                    add(key, order, 5)
+
+        # 결과는 (일치 종류, 순서) 정렬된 (선수 순서, 일치 종류) tuple
+        self._index = {
+            key: tuple(sorted(matches.items(), key=lambda item: (item[1], item[0])))
+            for key, matches in best.items()
+        }
+
+    def search(self, query, limit=10, offset=0):
+        """
+        (전체 일치 수, [{Id, Name, Team, Pos, match}, ...])를 반환합니다.
+        검색어는 공백/대소문자를 무시하며, 초성만 입력하면 이름 초성과 비교합니다. (예: 'ㄱㅅㅂ' -> 김선빈)
+        """
+        matches = self._index.get(normalize(query), ())
+        results = []
+        for order, tier in matches[offset:offset + limit]:
+            p = self._players[order]
+            results.append({
+                'Id': p['Id'],
+                'Name': p['Name'],
+                'Team': p.get('Team'),
+                'Pos': p.get('Pos.'),
+                'match': MATCH_TYPES[tier],
+            })
+        return len(matches), results
+
+def get_player_search():
+    """현재 데이터 스냅샷의 선수 검색 인덱스를 반환합니다."""
+    return get_snapshot().derived('player_search',
+                                  lambda snap: PlayerSearch(snap.player_data, config.PLAYER_SEARCH_FIELDS))
@@ -0,0 +1,140 @@
+# [Model] 피타고리안 기대 승률 (리그 전체 일괄 계산, 데이터 스냅샷마다 1회)
+
+import numpy as np
+
+import config
+from .static_data import get_snapshot
+
+DEFAULT_EXPONENT = 1.83
+PYTHAGENPAT_POWER = 0.287
+
+# 운/불운 분류 기준 (실제 승률 - 기대 승률)
+LUCK_LEVELS = [
+    # (하한, 코드, 분석, 설명)
+    (0.02, 'very_lucky', "운이 매우 좋음 (접전 승리 다수)",
+     "실력보다 더 좋은 성적을 거뒀습니다. 불펜이 강하거나 운이 따랐을 가능성이 높습니다."),
+    (0.0, 'lucky', "약간의 행운", "기대치보다 조금 더 많이 이겼습니다."),
+    (-0.02, 'neutral', "정직한 성적", "득실점 능력만큼 딱 그만큼의 성적을 거뒀습니다."),
+    (None, 'unlucky', "불운 (성적 반등 가능성)",
+     "전력에 비해 승리를 챙기지 못했습니다. 다음 시즌엔 성적이 오를 가능성이 큽니다."),
+]
+
+def classify_luck(diff):
+    """
+    실제 승률 - 기대 승률 차이로 운/불운을 분류하여 (코드, 분석, 설명)을 반환합니다.
+    """
+    for lower, code, analysis, desc in LUCK_LEVELS:
+        if lower is None or diff > lower:
+            return code, analysis, desc
+
+def expected_pct(runs, runs_allowed, exponent=DEFAULT_EXPONENT):
+    """
+    R^x / (R^x + RA^x). 배열도 받을 수 있으며, 득점+실점이 0이면 0을 반환합니다.
+    """
+    runs = np.asarray(runs, dtype=float)
+    runs_allowed = np.asarray(runs_allowed, dtype=float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rx = runs ** exponent
+        result = rx / (rx + runs_allowed ** exponent)
+    return np.where(runs + runs_allowed == 0, 0.0, result)
+
+def resolve_exponent(method, runs, runs_allowed, games, pct):
+    """
+    method에 따라 팀별 지수 배열을 반환합니다.
+    - 숫자: 모든 팀에 같은 지수
+    - 'pythagenpat': ((R + RA) / G) ^ 0.287
+    - 'fitted': log(W/L) = x * log(R/RA)를 최소제곱으로 풀어 리그 공통 지수 추정
+    """
+    n = len(runs)
+    if method == 'pythagenpat':
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x = ((runs + runs_allowed) / games) ** PYTHAGENPAT_POWER
+        return np.where(np.isfinite(x), x, DEFAULT_EXPONENT)
+    if method == 'fitted':
+        with np.errstate(invalid='ignore', divide='ignore'):
+            a = np.log(runs / runs_allowed)
+            b = np.log(pct / (1 - pct))
+        valid = np.isfinite(a) & np.isfinite(b)
+        denom = np.sum(a[valid] ** 2)
+        x = np.sum(a[valid] * b[valid]) / denom if denom > 0 else DEFAULT_EXPONENT
+        return np.full(n, x)
+    return np.full(n, float(method))
+
+class PythagoreanTable:
+    """
+    모든 팀의 기대 승률, 운(실제 - 기대), 분류를 한 번에 계산해 둔 표입니다.
+    """
+    def __init__(self, team_data, method=DEFAULT_EXPONENT):
+        self.method = method
+        self.teams = tuple(name for name, rows in team_data.items() if rows)
+        rows = [team_data[name][0] for name in self.teams]
+
+        self.runs = np.array([r.get('R', 0) for r in rows], dtype=float)
+        self.runs_allowed = np.array([r.get('-R', 0) for r in rows], dtype=float)
+        self.games = np.array([r.get('G', 0) for r in rows], dtype=float)
+        self.pct = np.array([r.get('PCT', 0) for r in rows], dtype=float)
+
+        self.exponent = resolve_exponent(method, self.runs, self.runs_allowed, self.games, self.pct)
+        self.expected = expected_pct(self.runs, self.runs_allowed, self.exponent)
+        self.luck = self.pct - self.expected
+        self.expected_wins = self.expected * np.array(
+            [r.get('W', 0) + r.get('L', 0) for r in rows], dtype=float)
+
+        self._index = {name: i for i, name in enumerate(self.teams)}
+        self._results = [self._result(i) for i in range(len(self.teams))]
+
+    def _result(self, i):
+        code, analysis, desc = classify_luck(float(self.luck[i]))
+        return {
+            'team': self.teams[i],
+            'R': int(self.runs[i]),
+            'RA': int(self.runs_allowed[i]),
+            'PCT': float(self.pct[i]),
+            'exponent': round(float(self.exponent[i]), 4),
+            'expected_pct': round(float(self.expected[i]), 4),
+            'expected_wins': round(float(self.expected_wins[i]), 1),
+            'luck': round(float(self.luck[i]), 4),
+            'classification': code,
+            'analysis': analysis,
+            'desc': desc,
+        }
+
+    def team(self, team_name):
+        """팀 한 개의 결과 dict (없으면 None)"""
+        i = self._index.get(team_name)
+        return self._results[i] if i is not None else None
+
+    def raw(self, team_name):
+        """반올림하지 않은 (기대 승률, 운) (없으면 None). team()의 분류도 이 값으로 계산합니다."""
+        i = self._index.get(team_name)
+        if i is None:
+            return None
+        return float(self.expected[i]), float(self.luck[i])
+
+    def all(self):
+        """모든 팀 결과 (운이 좋은 순)"""
+        return sorted(self._results, key=lambda r: r['luck'], reverse=True)
+
+def normalize_method(method):
+    """'1.83' 같은 문자열은 숫자로 바꾸고, 지원하지 않는 값이면 ValueError"""
+    if method is None:
+        method = config.PYTHAGOREAN_EXPONENT
+    if method in ('pythagenpat', 'fitted'):
+        return method
+    value = float(method)
+    if not 0 < value < 10:
+        raise ValueError(f"지수 범위를 벗어났습니다: {method}")
+    return value
+
+def get_pythagorean_table(method=None):
+    """
+    현재 데이터 스냅샷의 피타고리안 표를 반환합니다.
+    설정된 지수와 'pythagenpat' / 'fitted'는 스냅샷마다 1회만 계산하고,
+    그 밖의 임의 지수는 캐시하지 않고 바로 계산합니다.
+    """
+    method = normalize_method(method)
+    snapshot = get_snapshot()
+    if method in ('pythagenpat', 'fitted') or method == normalize_method(config.PYTHAGOREAN_EXPONENT):
+        return snapshot.derived(('pythagorean', method),
+                                lambda snap: PythagoreanTable(snap.team_data, method))
+    return PythagoreanTable(snapshot.team_data, method)
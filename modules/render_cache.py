@@ -0,0 +1,88 @@
+# [View] 차트 렌더링 캐시 (입력 데이터 해시 기반)
+# 차트 종류 + 차트가 실제로 사용하는 입력 값으로 키를 만들고,
+# 같은 키로 이미 그려진 파일이 있으면 다시 그리지 않습니다.
+
+import hashlib
+import json
+import os
+import threading
+
+from . import metrics
+
+# 차트 그리는 코드가 바뀌면 이 값을 올려서 기존 이미지를 모두 무효화합니다.
+RENDER_VERSION = 2
+
+# PNG 메타데이터(tEXt)에 키를 저장할 때 사용하는 이름
+PNG_KEY_FIELD = 'RenderKey'
+
+_lock = threading.Lock()
+_keys = {}  # 파일 경로 -> 마지막으로 그린 입력 키
+_hits = 0
+_misses = 0
+
+def make_key(chart_type, fields):
+    """
+    차트 종류와 입력 값(dict)으로 내용 기반 키(sha1)를 만듭니다.
+    """
+    payload = json.dumps([RENDER_VERSION, chart_type, fields],
+                         sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def _read_png_key(path):
+    # 프로세스가 재시작된 경우를 위해 PNG에 저장해 둔 키를 읽습니다.
+    try:
+        from PIL import Image
+        with Image.open(path) as img:
+            return img.text.get(PNG_KEY_FIELD)
+    except Exception:
+        return None
+
+def is_fresh(path, key):
+    """
+    path의 파일이 같은 입력 키로 그려진 것이면 True를 반환합니다.
+    """
+    global _hits, _misses
+    fresh = _check(path, key)
+    with _lock:
+        if fresh:
+            _hits += 1
+        else:
+            _misses += 1
+    return fresh
+
+def _check(path, key):
+    if not os.path.exists(path):
+        return False
+
+    with _lock:
+        cached = _keys.get(path)
+    if cached is None and path.endswith('.png'):
+        cached = _read_png_key(path)
+        if cached is not None:
+            with _lock:
+                _keys[path] = cached
+    return cached == key
+
+def remember(path, key):
+    """path를 key로 그렸다는 사실을 기록합니다."""
+    with _lock:
+        _keys[path] = key
+
+def forget(path=None):
+    """기록을 지웁니다. path가 없으면 전체를 지웁니다."""
+    with _lock:
+        if path is None:
+            _keys.clear()
+        else:
+            _keys.pop(path, None)
+
+def stats():
+    """그리기를 건너뛴 횟수(hits)와 다시 그린 횟수(misses)"""
+    with _lock:
+        return {'items': len(_keys), 'hits': _hits, 'misses': _misses}
+
+metrics.register_cache('render_key', stats)
+
+def png_metadata(key):
+    """savefig(metadata=...)에 넘길 PNG 메타데이터를 반환합니다."""
+    return {PNG_KEY_FIELD: key}
@@ -0,0 +1,105 @@
+# [Service] 상세 페이지 차트 백그라운드 렌더링 (스레드 풀 + 작업 큐)
+# 요청 스레드는 차트 작업을 넣고 config.RENDER_WAIT_BUDGET 초까지만 기다립니다.
+# 그 안에 끝나지 않은 차트는 자리 표시 이미지로 응답하고,
+# 브라우저가 /api/render/status로 완료를 확인한 뒤 실제 이미지로 바꿉니다.
+# 같은 파일에 대한 작업이 진행 중이면 새로 넣지 않고 기존 작업을 기다립니다.
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import config
+from . import metrics
+
+class RenderService:
+    """
+    static 기준 파일 경로(예: 'image/team_chart/runs_chart_LG.png')를 키로 하는 렌더링 작업 큐입니다.
+    - submit: 같은 키의 작업이 진행 중이면 그 Future를 반환 (중복 렌더링 없음)
+    - status: 'pending'(진행 중) / 'failed'(마지막 작업 실패) / None(기록 없음)
+    """
+    def __init__(self, workers):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='render')
+        self._lock = threading.Lock()
+        self._jobs = {}    # 키 -> 진행 중인 Future
+        self._failed = {}  # 키 -> 마지막 실패 메시지
+
+    def submit(self, key, fn, *args):
+        with self._lock:
+            future = self._jobs.get(key)
+            if future is not None:
+                return future
+            self._failed.pop(key, None)
+            future = self._jobs[key] = self._pool.submit(_run_job, metrics.current_route(), fn, args)
+        future.add_done_callback(lambda f: self._finish(key, f))
+        return future
+
+    def _finish(self, key, future):
+        error = future.exception()
+        with self._lock:
+            if self._jobs.get(key) is future:
+                del self._jobs[key]
+            if error is not None:
+                self._failed[key] = f"{type(error).__name__}: {error}"
+        if error is not None:
+            print(f"차트 렌더링 실패 ({key}): {error}")
+
+    def status(self, key):
+        with self._lock:
+            if key in self._jobs:
+                return 'pending'
+            if key in self._failed:
+                return 'failed'
+        return None
+
+    def render(self, jobs, budget):
+        """
+        jobs({키: (함수, 인자 tuple)})를 모두 넣고 budget초까지 기다립니다.
+        시간 안에 끝나지 않은 키의 집합을 반환합니다.
+        """
+        futures = {key: self.submit(key, fn, *args) for key, (fn, args) in jobs.items()}
+        with metrics.phase('render_wait'):
+            _, not_done = wait(futures.values(), timeout=budget)
+        pending = {key for key, future in futures.items() if future in not_done}
+        if pending:
+            metrics.inc('kbo_render_deferred_total', len(pending))
+        return pending
+
+def _run_job(route, fn, args):
+    # 작업을 넣은 요청의 route로 단계 시간 기록 (route="background"가 되지 않도록)
+    with metrics.route_label(route):
+        return fn(*args)
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_render_service():
+    """이 프로세스의 렌더링 서비스 (처음 사용할 때 스레드 풀 생성)"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = RenderService(config.RENDER_WORKERS)
+    return _service
+
+def render_assets(jobs, budget=None):
+    """
+    페이지에 필요한 차트를 그리고, 대기 시간 안에 끝나지 않은 static 파일 경로의 집합을 반환합니다.
+    config.RENDER_SERVICE_ENABLED가 False면 요청 스레드에서 바로 그립니다. (항상 빈 집합)
+    """
+    if not config.RENDER_SERVICE_ENABLED:
+        for fn, args in jobs.values():
+            fn(*args)
+        return set()
+    if budget is None:
+        budget = config.RENDER_WAIT_BUDGET
+    return get_render_service().render(jobs, budget)
+
+def asset_status(filename, path):
+    """
+    static 파일의 렌더링 상태: 'pending' / 'failed' / 'ready'(파일 있음) / 'missing'
+    path는 filename의 실제 파일 경로입니다.
+    """
+    status = get_render_service().status(filename) if config.RENDER_SERVICE_ENABLED else None
+    if status is not None:
+        return status
+    return 'ready' if path and os.path.exists(path) else 'missing'
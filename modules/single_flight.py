@@ -0,0 +1,50 @@
+# [Util] 같은 키에 대한 동시 작업을 하나로 합치기 (single-flight)
+
+import threading
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    같은 key로 동시에 들어온 요청 중 첫 번째만 fn()을 실행하고,
+    나머지는 그 결과(또는 예외)를 기다렸다가 그대로 돌려받습니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def in_flight(self, key):
+        """key에 대한 작업이 진행 중이면 True"""
+        with self._lock:
+            return key in self._calls
@@ -0,0 +1,157 @@
+# [Startup] 앱 시작 시 그래프/표 이미지 일괄 생성 (프로세스 풀 병렬 처리)
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import config
+from . import visualizer
+from .fonts import get_font_family
+from .single_flight import SingleFlight
+from .static_data import get_all_team_data, get_snapshot
+
+# 배치 이름 -> 출력용 라벨
+BATCH_LABELS = {
+    'ranking': '순위 변동 그래프',
+    'radar': '팀 오각형 차트',
+    'table': '팀 분석 표',
+    'h2h': '상대 전적 히트맵',
+}
+
+# 이 프로세스에서 이미 생성한 파일 -> 생성할 때의 데이터 스냅샷 해시, 동시 요청 합치기
+# (데이터가 바뀌어 해시가 달라지면 다음 요청에서 다시 생성)
+_ready = {}
+_ready_lock = threading.Lock()
+_flight = SingleFlight()
+
+def get_startup_tasks():
+    """
+    시작 시 생성할 이미지 목록을 (배치 이름, visualizer 함수 이름, 인자, static 기준 파일 경로)
+    형태로 반환합니다. 그림 1장당 작업 1개입니다.
+    (팀 쌍별 상대 전적 표 90장 대신 리그 전체 히트맵 1장만 그립니다.)
+    """
+    tasks = [('ranking', 'create_ranking_graph', (), 'image/ranking_graph.png')]
+    team_names = list(get_all_team_data())
+    tasks += [('radar', 'create_team_radar_chart', (team,), f'image/radar/radar_{team}.png')
+              for team in team_names]
+    tasks += [('table', 'create_waa_table_image', (team,), f'image/table/table_{team}.png')
+              for team in team_names]
+    tasks += [('h2h', 'create_h2h_heatmap', (), 'image/h2h_heatmap.png')]
+    return tasks
+
+def get_on_demand_tasks():
+    """
+    시작 시에는 그리지 않고 처음 요청될 때만 그리는 이미지 목록 (형식은 get_startup_tasks와 같음)
+    - 팀 쌍별 상대 전적 표 (/analysis에서 선택한 두 팀만 필요)
+    """
+    return [('record', 'create_match_record_image', (team, opp), f'image/record/record_{team}_vs_{opp}.png')
+            for team, opp in visualizer.get_match_record_pairs()]
+
+def _get_asset_tasks():
+    # static 파일 경로 -> 작업 (데이터 스냅샷마다 1회 생성)
+    return get_snapshot().derived('startup_asset_tasks',
+                                  lambda snap: {task[3]: task for task in get_startup_tasks() + get_on_demand_tasks()})
+
+def ensure_asset(filename):
+    """
+    static 기준 파일 경로(예: 'image/radar/radar_LG.png')가 시작 이미지나 요청 시 생성 이미지라면,
+    이 프로세스에서 현재 데이터로 아직 생성하지 않은 경우 지금 생성합니다.
+    같은 파일에 대한 동시 요청은 한 번의 렌더링으로 합쳐집니다.
+    둘 다 아니면 False를 반환합니다.
+    """
+    task = _get_asset_tasks().get(filename)
+    if task is None:
+        return False
+    digest = get_snapshot().digest
+    if _ready.get(filename) == digest:
+        return True
+
+    def render():
+        if _ready.get(filename) == digest:
+            return
+        _, func_name, args, _ = task
+        _run_task(func_name, args)
+        with _ready_lock:
+            _ready[filename] = digest
+
+    _flight.do((filename, digest), render)
+    return True
+
+def _run_task(func_name, args):
+    # 작업 프로세스에서 실행됩니다. 그리는 데 걸린 시간(초)을 반환합니다.
+    start = time.perf_counter()
+    getattr(visualizer, func_name)(*args)
+    return time.perf_counter() - start
+
+def _resolve_workers(workers):
+    if workers is None:
+        workers = config.STARTUP_RENDER_WORKERS
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, int(workers))
+
+def build_startup_assets(workers=None):
+    """
+    시작 시 필요한 이미지(순위 그래프, 레이더 차트, WAA 표, 상대 전적 히트맵)를
+    프로세스 풀에 작업 단위로 나누어 생성하고, 배치별 소요 시간을 출력합니다.
+    배치별 통계 dict를 반환합니다.
+    """
+    # spawn 방식의 작업 프로세스가 app.py를 다시 import하는 경우 중복 실행 방지
+    if multiprocessing.parent_process() is not None:
+        return {}
+
+    # lazy 모드에서는 시작 시 아무것도 그리지 않음 (ensure_asset에서 필요할 때 생성)
+    if config.STARTUP_ASSET_MODE == 'lazy':
+        print("시작 이미지 생성 생략 (lazy 모드: 처음 요청될 때 생성)")
+        return {}
+
+    workers = _resolve_workers(workers)
+    digest = get_snapshot().digest
+    tasks = get_startup_tasks()
+    stats = {batch: {'count': 0, 'failed': 0, 'render_time': 0.0, 'done_at': 0.0} for batch in BATCH_LABELS}
+
+    # 폰트 탐색은 부모 프로세스에서 한 번만 (fork된 작업 프로세스가 그대로 물려받음)
+    get_font_family()
+
+    started = time.perf_counter()
+
+    def record(task, elapsed=None, error=None):
+        batch, func_name, _, filename = task
+        stat = stats[batch]
+        stat['count'] += 1
+        stat['done_at'] = time.perf_counter() - started
+        if error is not None:
+            stat['failed'] += 1
+            print(f"이미지 생성 실패 ({func_name}): {error}")
+        else:
+            stat['render_time'] += elapsed
+            with _ready_lock:
+                _ready[filename] = digest
+
+    if workers == 1:
+        for task in tasks:
+            try:
+                record(task, _run_task(task[1], task[2]))
+            except Exception as e:
+                record(task, error=e)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            futures = {pool.submit(_run_task, task[1], task[2]): task for task in tasks}
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    record(task, future.result())
+                except Exception as e:
+                    record(task, error=e)
+
+    total = time.perf_counter() - started
+    print(f"시작 이미지 생성 완료: {len(tasks)}개, 프로세스 {workers}개, {total:.2f}초")
+    for batch, stat in stats.items():
+        if stat['count'] == 0:
+            continue
+        avg = stat['render_time'] / max(stat['count'] - stat['failed'], 1)
+        print(f"  - {BATCH_LABELS[batch]}: {stat['count']}개 (실패 {stat['failed']}), "
+              f"렌더 합계 {stat['render_time']:.2f}초, 평균 {avg:.3f}초, 완료 시점 {stat['done_at']:.2f}초")
+    return stats
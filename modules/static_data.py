@@ -1,5 +1,167 @@
 import json
 import os
+import threading
+import time
+import hashlib
+
+import config
+from . import compiled_data, metrics
+
+# --- 공용 데이터 스냅샷 (프로세스당 1회 로드, 파일 변경 시에만 재로드) ---
+
+# 스냅샷에 포함되는 JSON 파일 목록 (속성 이름: 파일 이름)
+DATA_FILES = {
+    'team_data': 'kbo_team_data.json',
+    'player_data': 'kbo_player_data.json',
+    'comparison_data': 'kbo_team_comparison.json',
+    'monthly_rankings': 'kbo_team_monthly_rankings.json',
+}
+
+class DataSnapshot:
+    """
+    네 개의 JSON 파일을 한 번에 읽어 둔 읽기 전용 스냅샷입니다.
+    version은 재로드될 때마다 1씩 증가하고, digest는 파일 내용의 해시입니다.
+    columns는 선수/팀 데이터의 열 단위 표입니다. (속성 이름 -> compiled_data.ColumnTable)
+    바이너리 스냅샷을 만들지 않은 경우에는 처음 사용할 때 만듭니다.
+    source는 'compiled'(바이너리 스냅샷에서 로드) 또는 'json'입니다.
+    """
+    __slots__ = ('team_data', 'player_data', 'comparison_data', 'monthly_rankings',
+                 'signature', 'digest', 'version', '_columns', 'source', '_derived', '_derived_lock')
+
+    def __init__(self, files, signature, digest, version, columns=None, source='json'):
+        for attr in DATA_FILES:
+            object.__setattr__(self, attr, files.get(attr, {}))
+        object.__setattr__(self, 'signature', signature)
+        object.__setattr__(self, 'digest', digest)
+        object.__setattr__(self, 'version', version)
+        object.__setattr__(self, '_columns', columns)
+        object.__setattr__(self, 'source', source)
+        object.__setattr__(self, '_derived', {})
+        # builder 안에서 다른 파생 값을 요청할 수 있으므로 재진입 가능한 잠금 사용
+        # (예: 시작 이미지 목록 -> 상대 전적 행렬)
+        object.__setattr__(self, '_derived_lock', threading.RLock())
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DataSnapshot은 수정할 수 없습니다.")
+
+    @property
+    def columns(self):
+        if self._columns is not None:
+            return self._columns
+        return self.derived('columns', _build_columns)
+
+    def derived(self, key, builder):
+        """
+        스냅샷에서 파생되는 값(인덱스, 통계 등)을 key별로 한 번만 계산해 보관합니다.
+        builder는 스냅샷을 인자로 받는 함수입니다.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        with self._derived_lock:
+            if key not in self._derived:
+                self._derived[key] = builder(self)
+            return self._derived[key]
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+_last_check = 0.0
+
+def _data_path(file_name):
+    return os.path.join(config.DATA_DIR, file_name)
+
+def _file_signature():
+    """각 데이터 파일의 (mtime, size)를 모아 변경 여부 판단에 사용합니다."""
+    signature = []
+    for file_name in DATA_FILES.values():
+        try:
+            st = os.stat(_data_path(file_name))
+            signature.append((file_name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append((file_name, None, None))
+    return tuple(signature)
+
+def _read_json_files():
+    # (파싱한 데이터, 내용 해시, 모든 파일을 읽었는지 여부)
+    files = {}
+    ok = True
+    digest = hashlib.sha1()
+    for attr, file_name in DATA_FILES.items():
+        file_path = _data_path(file_name)
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            digest.update(raw)
+            files[attr] = json.loads(raw.decode('utf-8'))
+        except FileNotFoundError:
+            ok = False
+            print(f"오류: {file_path} 파일을 찾을 수 없습니다.")
+        except Exception as e:
+            ok = False
+            print(f"데이터 로드 중 오류 발생 ({file_name}): {e}")
+    return files, digest.hexdigest(), ok
+
+def _build_columns(snapshot):
+    # JSON에서 읽은 스냅샷의 열 단위 표 (바이너리 형식으로 컴파일한 뒤 그대로 해석)
+    files = {attr: getattr(snapshot, attr) for attr in DATA_FILES}
+    data = compiled_data.compile_snapshot(files, snapshot.signature, snapshot.digest)
+    return compiled_data.parse_compiled(data).tables
+
+def _load_snapshot(signature, version):
+    # 1) 원본 JSON과 서명(mtime/size)이 같은 바이너리 스냅샷이 있으면 JSON을 읽지 않음
+    if config.COMPILED_DATA_ENABLED:
+        compiled = compiled_data.read_compiled()
+        if compiled is not None and compiled.signature == tuple(tuple(s) for s in signature):
+            return DataSnapshot(compiled.files(), signature, compiled.digest, version,
+                                compiled.tables, source='compiled')
+
+    # 2) JSON을 읽고, 가능하면 다음 로드를 위해 바이너리 스냅샷 저장
+    #    (바이너리 스냅샷을 쓰지 않으면 컴파일하지 않고, 열 단위 표는 처음 필요할 때 생성)
+    files, digest, ok = _read_json_files()
+    columns = None
+    if config.COMPILED_DATA_ENABLED and config.COMPILED_DATA_AUTO_BUILD and ok:
+        data = compiled_data.compile_snapshot(files, signature, digest)
+        try:
+            compiled_data.write_compiled_bytes(data)
+        except OSError as e:
+            print(f"바이너리 스냅샷 저장 실패: {e}")
+        columns = compiled_data.parse_compiled(data).tables
+    return DataSnapshot(files, signature, digest, version, columns, source='json')
+
+def build_compiled_snapshot(path=None):
+    """
+    원본 JSON을 읽어 바이너리 스냅샷 파일을 만들고 경로를 반환합니다. (python -m modules.compiled_data)
+    읽지 못한 파일이 있으면 만들지 않고 None을 반환합니다.
+    """
+    files, digest, ok = _read_json_files()
+    if not ok:
+        return None
+    return compiled_data.write_compiled(files, _file_signature(), digest, path)
+
+def get_snapshot():
+    """
+    현재 데이터 스냅샷을 반환합니다.
+    파일의 mtime/size가 바뀐 경우에만 다시 읽어 새 스냅샷으로 교체합니다.
+    """
+    global _snapshot, _last_check
+    snapshot = _snapshot
+    now = time.monotonic()
+    if snapshot is not None and now - _last_check < config.DATA_RELOAD_CHECK_INTERVAL:
+        return snapshot
+
+    with _snapshot_lock:
+        snapshot = _snapshot
+        if snapshot is not None and now - _last_check < config.DATA_RELOAD_CHECK_INTERVAL:
+            return snapshot
+        signature = _file_signature()
+        if snapshot is None or snapshot.signature != signature:
+            version = snapshot.version + 1 if snapshot is not None else 1
+            with metrics.phase('data_load'):
+                snapshot = _load_snapshot(signature, version)
+            _snapshot = snapshot
+        _last_check = time.monotonic()
+        return snapshot
 
 #메인페이미 팀 순위 변동
 def get_2025_season_data():
@@ -22,172 +184,141 @@ def get_2025_season_data():
 #메인페이지 팀랭크
 def get_team_rank_data_from_json():
     """
-    static/data/kbo_team_data.json 파일을 읽어서
+    static/data/kbo_team_data.json 데이터에서
     순위표에 필요한 정보(Rank, W, L, D, PCT)만 추출하여 반환합니다.
     """
-    # 1. JSON 파일의 절대 경로 찾기
-    # 현재 실행 중인 파일(app.py가 있는 루트) 기준 static/data 폴더 안을 찾습니다.
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # modules 상위 폴더(루트)
-    file_path = os.path.join(base_dir, 'static', 'data', 'kbo_team_data.json')
+    data = get_snapshot().team_data
 
     ranking_list = []
+    # JSON 구조가 "팀명": [ {정보} ] 형태이므로 리스트의 첫 번째 요소 접근
+    for team_name, stats_list in data.items():
+        if stats_list:
+            stat = stats_list[0]
+            ranking_list.append({
+                'name': team_name,
+                'rank': stat.get('Rank'),
+                'w': stat.get('W'),
+                'l': stat.get('L'),
+                'd': stat.get('D'),
+                'pct': stat.get('PCT')
+            })
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # 2. 데이터 파싱 및 필터링
-        for team_name, stats_list in data.items():
-            # JSON 구조가 "팀명": [ {정보} ] 형태이므로 리스트의 첫 번째 요소 접근
-            if stats_list:
-                stat = stats_list[0]
-                ranking_list.append({
-                    'name': team_name,
-                    'rank': stat.get('Rank'),
-                    'w': stat.get('W'),
-                    'l': stat.get('L'),
-                    'd': stat.get('D'),
-                    'pct': stat.get('PCT')
-                })
-        
-        # 3. 순위(Rank) 기준으로 오름차순 정렬 (1위 -> 10위)
-        ranking_list.sort(key=lambda x: x['rank'])
-
-    except FileNotFoundError:
-        print(f"오류: {file_path} 파일을 찾을 수 없습니다.")
-        return []
-    except Exception as e:
-        print(f"데이터 로드 중 오류 발생: {e}")
-        return []
-
+    # 순위(Rank) 기준으로 오름차순 정렬 (1위 -> 10위)
+    ranking_list.sort(key=lambda x: x['rank'])
     return ranking_list
 
 # 팀페이지
 def get_specific_team_data(team_name):
     """
     팀 이름(예: 'LG', 'Samsung')을 받아서 해당 팀의 상세 정보를 반환합니다.
+    스냅샷은 공유되므로 호출한 쪽에서 수정해도 되도록 사본을 반환합니다.
     """
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    file_path = os.path.join(base_dir, 'static', 'data', 'kbo_team_data.json')
+    data = get_snapshot().team_data
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        # team_name에 해당하는 데이터가 있는지 확인
-        if team_name in data:
-            # JSON 구조가 "LG": [{정보}] 형태이므로 리스트의 첫 번째 요소([0]) 반환
-            return data[team_name][0]
-        else:
-            return None # 해당 팀 이름이 없을 경우
-            
-    except Exception as e:
-        print(f"데이터 로드 오류: {e}")
-        return None
+    # JSON 구조가 "LG": [{정보}] 형태이므로 리스트의 첫 번째 요소([0]) 반환
+    if data.get(team_name):
+        return dict(data[team_name][0])
+    return None # 해당 팀 이름이 없을 경우
 
 # 팀페이지 - 팀 강점/약점 분석 (WAA 레이더 차트-오각형 그래프)
 def get_all_team_data():
     """
     모든 팀의 상세 데이터를 반환합니다. (레이더 차트 정규화용)
+    스냅샷은 공유되므로 호출한 쪽에서 수정해도 되도록 사본을 반환합니다.
     """
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    file_path = os.path.join(base_dir, 'static', 'data', 'kbo_team_data.json')
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data
-    except Exception as e:
-        print(f"데이터 로드 오류: {e}")
-        return {}
+    return {team_name: [dict(stat) for stat in stats_list]
+            for team_name, stats_list in get_snapshot().team_data.items()}
     
 # 팀페이지 - 팀별 대결 기록
 def get_comparison_data():
     """
-    kbo_team_comparison.json 파일을 읽어서 반환합니다.
+    kbo_team_comparison.json 데이터를 반환합니다.
+    스냅샷은 공유되므로 호출한 쪽에서 수정해도 되도록 사본을 반환합니다.
     """
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    file_path = os.path.join(base_dir, 'static', 'data', 'kbo_team_comparison.json')
+    # 각 행은 숫자/문자열 값만 가지므로 행 단위 사본이면 충분
+    return {team_name: [dict(row) for row in rows]
+            for team_name, rows in get_snapshot().comparison_data.items()}
     
+# --- 선수 인덱스 (스냅샷마다 1회 생성) ---
+
+def _war_key(player):
+    # 데이터가 없거나 문자열일 경우를 대비해 float 변환 및 기본값(-99) 처리
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"상대 전적 데이터 로드 실패: {e}")
-        return {}
-    
+        return float(player.get('WAR', -99))
+    except (TypeError, ValueError):
+        return -99.0
+
+class PlayerIndex:
+    """
+    선수 조회용 인덱스입니다.
+    - by_id: Id -> 선수 (O(1) 조회)
+    - by_team: 팀 -> WAR 내림차순으로 미리 정렬된 선수 목록
+    - by_pos / by_hand: 포지션('Pos.'), 투타('Hand')별 보조 인덱스 (WAR 내림차순)
+    """
+    def __init__(self, player_data):
+        self.by_id = {}
+        self.by_team = {}
+        self.by_pos = {}
+        self.by_hand = {}
+
+        for team_name, players in player_data.items():
+            roster = sorted(players, key=_war_key, reverse=True)
+            self.by_team[team_name] = tuple(roster)
+            for p in players:
+                self.by_id[p['Id']] = p
+
+        everyone = sorted(self.by_id.values(), key=_war_key, reverse=True)
+        for p in everyone:
+            self.by_pos.setdefault(p.get('Pos.'), []).append(p)
+            self.by_hand.setdefault(p.get('Hand'), []).append(p)
+        self.by_pos = {k: tuple(v) for k, v in self.by_pos.items()}
+        self.by_hand = {k: tuple(v) for k, v in self.by_hand.items()}
+
+def get_player_index():
+    """현재 스냅샷의 선수 인덱스를 반환합니다."""
+    return get_snapshot().derived('player_index', lambda snap: PlayerIndex(snap.player_data))
+
+def get_player_columns():
+    """
+    현재 스냅샷의 선수 데이터 열 표(compiled_data.ColumnTable)를 반환합니다.
+    행 순서는 player_data의 팀 순서 -> 팀 안의 순서와 같습니다.
+    """
+    return get_snapshot().columns.get('player_data')
+
 # 팀페이지 - 선수리스트
 def get_players_by_team(team_name):
     """
     kbo_player_data.json에서 특정 팀의 선수를 가져와 
     WAR(승리 기여도) 내림차순으로 정렬하여 반환
+    (선수 dict는 스냅샷과 공유되지 않는 사본)
     """
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    file_path = os.path.join(base_dir, 'static', 'data', 'kbo_player_data.json')
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        if team_name in data:
-            players = data[team_name]
-            
-            # ★ 수정된 부분: WAR 기준으로 내림차순 정렬
-            # 데이터가 없거나 문자열일 경우를 대비해 float 변환 및 기본값(-99) 처리
-            sorted_players = sorted(
-                players, 
-                key=lambda x: float(x.get('WAR', -99)), 
-                reverse=True
-            )
-            return sorted_players
-        else:
-            return []
-    except Exception as e:
-        print(f"선수 데이터 로드 오류: {e}")
-        return []
-    
+    return [dict(p) for p in get_player_index().by_team.get(team_name, ())]
+
+# 포지션별 선수 목록 (WAR 내림차순, 사본)
+def get_players_by_position(position):
+    return [dict(p) for p in get_player_index().by_pos.get(position, ())]
+
+# 투타별 선수 목록 (예: '우투좌타', WAR 내림차순, 사본)
+def get_players_by_hand(hand):
+    return [dict(p) for p in get_player_index().by_hand.get(hand, ())]
 
 # 선수 페이지
 def get_player_by_id(player_id):
     """
-    전체 팀 데이터를 뒤져서 player_id와 일치하는 선수 1명의 정보를 반환합니다.
+    player_id와 일치하는 선수 1명의 정보를 반환합니다.
+    스냅샷은 공유되므로 호출한 쪽에서 수정해도 되도록 사본을 반환합니다.
     """
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    file_path = os.path.join(base_dir, 'static', 'data', 'kbo_player_data.json')
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        # 모든 팀(key)을 순회하며 선수 리스트(value) 탐색
-        for team_name, players in data.items():
-            for p in players:
-                if p['Id'] == player_id:
-                    return p # 선수를 찾으면 바로 반환
-                    
-        return None # 끝까지 못 찾으면 None 반환
-            
-    except Exception as e:
-        print(f"선수 상세 정보 로드 실패: {e}")
-        return None
+    player = get_player_index().by_id.get(player_id)
+    return dict(player) if player is not None else None
     
 # 선수 페이지 - 팀 심볼 불러오기
 def get_team_symbol(team_name):
     """
     팀 이름(예: 'LG')을 입력받아 해당 팀의 심볼 이미지 경로를 반환합니다.
     """
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    file_path = os.path.join(base_dir, 'static', 'data', 'kbo_team_data.json')
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        if team_name in data:
-            # 팀 데이터의 첫 번째 요소에서 Symbol 키를 찾음
-            return data[team_name][0].get('Symbol', '')
-        return ''
-            
-    except Exception as e:
-        print(f"팀 심볼 로드 실패: {e}")
-        return ''
\ No newline at end of file
+    data = get_snapshot().team_data
+
+    # 팀 데이터의 첫 번째 요소에서 Symbol 키를 찾음
+    if data.get(team_name):
+        return data[team_name][0].get('Symbol', '')
+    return ''
@@ -0,0 +1,116 @@
+# [Model] 리그 전체 팀 지표 행렬 (NumPy, 데이터 스냅샷마다 1회 계산)
+
+import numpy as np
+
+from .static_data import get_snapshot
+
+# 행렬에 포함할 지표 (kbo_team_data.json 키)
+WAA_CATEGORIES = ['Batting', 'Baserunning', 'Defense', 'Starter', 'Reliever']
+TEAM_METRIC_COLUMNS = (
+    [f'{c}_WAA' for c in WAA_CATEGORIES] +
+    [f'{c}_Rank' for c in WAA_CATEGORIES] +
+    ['R/G', '-R/G', 'ERASP', 'ERARP']
+)
+
+NORMALIZATIONS = ('min_max', 'zscore', 'percentile')
+
+class TeamMetrics:
+    """
+    팀 x 지표 행렬과 정규화 결과를 담습니다.
+    - values: 원래 값 (팀 수 x 지표 수, 값이 없으면 nan)
+    - min_max: 지표별 0~100 정규화 (모든 팀 값이 같으면 50)
+    - zscore: 지표별 표준 점수 (표준편차가 0이면 0)
+    - percentile: 지표별 백분위 (0~100, 동률은 평균 순위)
+    """
+    def __init__(self, team_data, columns=TEAM_METRIC_COLUMNS):
+        self.teams = tuple(name for name, rows in team_data.items() if rows)
+        self.columns = tuple(columns)
+        self.team_index = {name: i for i, name in enumerate(self.teams)}
+        self.column_index = {col: j for j, col in enumerate(self.columns)}
+
+        values = np.full((len(self.teams), len(self.columns)), np.nan)
+        for i, name in enumerate(self.teams):
+            row = team_data[name][0]
+            for j, col in enumerate(self.columns):
+                val = row.get(col)
+                if isinstance(val, (int, float)):
+                    values[i, j] = val
+        self.values = values
+
+        self.min = np.nanmin(values, axis=0) if len(self.teams) else np.zeros(len(self.columns))
+        self.max = np.nanmax(values, axis=0) if len(self.teams) else np.zeros(len(self.columns))
+        self.mean = np.nanmean(values, axis=0) if len(self.teams) else np.zeros(len(self.columns))
+        self.std = np.nanstd(values, axis=0) if len(self.teams) else np.zeros(len(self.columns))
+
+        span = self.max - self.min
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.min_max = np.where(span == 0, 50.0, (values - self.min) / span * 100)
+            self.zscore = np.where(self.std == 0, 0.0, (values - self.mean) / self.std)
+        self.percentile = self._percentile(values)
+
+    @staticmethod
+    def _percentile(values):
+        # 지표별로 정렬해 두고 searchsorted로 (작은 값 개수 + 같은 값 개수/2) / n 계산
+        n = values.shape[0]
+        result = np.full(values.shape, np.nan)
+        if n == 0:
+            return result
+        for j in range(values.shape[1]):
+            col = values[:, j]
+            valid = ~np.isnan(col)
+            sorted_col = np.sort(col[valid])
+            if sorted_col.size == 0:
+                continue
+            left = np.searchsorted(sorted_col, col[valid], side='left')
+            right = np.searchsorted(sorted_col, col[valid], side='right')
+            result[valid, j] = (left + (right - left) / 2) / sorted_col.size * 100
+        return result
+
+    def column(self, col, method='values'):
+        """지표 하나의 팀별 값 (method: 'values', 'min_max', 'zscore', 'percentile')"""
+        return getattr(self, method)[:, self.column_index[col]]
+
+    def row(self, team_name, columns, method='values'):
+        """팀 한 개의 지정한 지표 값을 (파이썬 float) 리스트로 반환합니다. 팀이 없으면 None"""
+        i = self.team_index.get(team_name)
+        if i is None:
+            return None
+        idx = [self.column_index[col] for col in columns]
+        return getattr(self, method)[i, idx].tolist()
+
+    def team_values(self, team_name, columns=None, method='values'):
+        """팀 한 개의 지표 값을 dict로 반환합니다. 팀이 없으면 None"""
+        i = self.team_index.get(team_name)
+        if i is None:
+            return None
+        matrix = getattr(self, method)
+        columns = self.columns if columns is None else columns
+        return {col: _to_json_number(matrix[i, self.column_index[col]]) for col in columns}
+
+    def team_report(self, team_name):
+        """API용: 지표별 원래 값과 모든 정규화 값, 리그 최소/최대/평균"""
+        i = self.team_index.get(team_name)
+        if i is None:
+            return None
+        report = {}
+        for j, col in enumerate(self.columns):
+            report[col] = {
+                'value': _to_json_number(self.values[i, j]),
+                'min_max': _to_json_number(self.min_max[i, j]),
+                'zscore': _to_json_number(self.zscore[i, j]),
+                'percentile': _to_json_number(self.percentile[i, j]),
+                'league_min': _to_json_number(self.min[j]),
+                'league_max': _to_json_number(self.max[j]),
+                'league_mean': _to_json_number(self.mean[j]),
+            }
+        return report
+
+def _to_json_number(val):
+    val = float(val)
+    if np.isnan(val):
+        return None
+    return int(val) if val.is_integer() else round(val, 4)
+
+def get_team_metrics():
+    """현재 데이터 스냅샷의 팀 지표 행렬을 반환합니다."""
+    return get_snapshot().derived('team_metrics', lambda snap: TeamMetrics(snap.team_data))
@@ -3,63 +3,88 @@
 
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import pandas as pd
 import numpy as np
 import os
-import folium
-from .static_data import get_2025_season_data, get_all_team_data, get_comparison_data
+import config
+from . import render_cache
+from . import chart_output
+from . import metrics
+from .disk_cache import DiskCache
+from .file_utils import atomic_write_bytes
+from .single_flight import SingleFlight
+from .lru_cache import LRUCache
+from .fonts import apply_korean_font
+from .static_data import get_all_team_data
+from .head_to_head import get_head_to_head
+from . import chart_data
+
+# 모든 차트는 pyplot 전역 상태(현재 figure, rcParams 변경 등)를 쓰지 않고
+# 요청마다 독립적인 Figure + Agg 캔버스를 만들어 그립니다. (멀티 스레드 서버에서 동시 렌더링 가능)
+def _new_figure(figsize, **subplot_kw):
+    """
+    pyplot을 거치지 않고 Figure와 Agg 캔버스를 만들어 (fig, ax)를 반환합니다.
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    ax = fig.subplots(subplot_kw=subplot_kw or None)
+    return fig, ax
+
+# 같은 파일(+ 같은 입력 키)을 동시에 그리려는 요청은 한 번의 렌더링으로 합칩니다.
+_render_flight = SingleFlight()
+
+def _save_chart(chart, series, save_path, cache_key=None):
+    """
+    차트를 그려 save_path에 PNG + 기본 프로필(config.CHART_DEFAULT_PROFILE)로 저장합니다.
+    (static 차트 파일은 config.CHART_DEFAULT_FORMAT과 관계없이 항상 PNG)
+    cache_key가 있으면 PNG 메타데이터에 기록하고 render_cache에 등록합니다.
+    같은 파일/키를 그리는 중인 요청이 있으면 새로 그리지 않고 그 결과를 기다립니다.
+    """
+    def render():
+        # 기다리는 사이 다른 요청이 같은 키로 이미 그렸으면 건너뜀
+        if cache_key and render_cache.is_fresh(save_path, cache_key):
+            return
+        draw, savefig_kw = CHART_RENDERERS[chart]
+        metadata = render_cache.png_metadata(cache_key) if cache_key else None
+        with metrics.render_timer(chart):
+            data = chart_output.figure_bytes(draw(series), metadata=metadata, **savefig_kw)
+        chart_output.write_file(save_path, data)
+        if cache_key:
+            render_cache.remember(save_path, cache_key)
+
+    _render_flight.do(('file', save_path, cache_key), render)
 
 def create_ranking_graph():
-    # ... (폰트 설정 코드는 기존과 동일 유지) ...
-    font_path = None
-    font_candidates = fm.findSystemFonts(fontpaths=None, fontext='ttf')
-    for font in font_candidates:
-        if 'Nanum' in font or 'Gothic' in font or 'Malgun' in font:
-            font_path = font
-            break
-            
-    if font_path:
-        fe = fm.FontEntry(fname=font_path, name='KoreanFont')
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rcParams['font.family'] = 'KoreanFont'
-        plt.rcParams['axes.unicode_minus'] = False
-    else:
-        plt.rcParams['font.family'] = 'sans-serif'
-
-    # 데이터 로드
-    data = get_2025_season_data()
-    months = data["labels"]
-    teams = data["teams_data"]
-
-    # 팀별 고유 색상 정의 (HTML 범례와 맞추기 위함)
-    team_colors = {
-        'KIA': '#EA0029', 'KT': '#000000', 'LG': '#C30452', 'NC': '#315288',
-        'SSG': '#CE0E2D', '두산': '#1A1748', '롯데': '#041E42', '삼성': '#074CA1',
-        '키움': '#570514', '한화': '#FC4E00'
-    }
-
-    plt.figure(figsize=(10, 6))
-    
-    # 그래프 그리기 (팀별 지정 색상 사용)
-    for team_name, rankings in teams.items():
-        color = team_colors.get(team_name, '#333333') # 색상이 없으면 기본 회색
-        plt.plot(months, rankings, marker='o', label=team_name, linewidth=2, color=color)
-        
-    plt.ylim(10.5, 0.5)
-    plt.yticks(range(1, 11), [f'{i}위' for i in range(1, 11)])
-    
-    plt.grid(True, linestyle='--', alpha=0.6)
-    plt.tight_layout()
+    # 폰트 설정 (한글 폰트는 프로세스당 1회만 등록)
+    apply_korean_font()
+
+    # 데이터 로드 (팀별 색상 포함, /api/chart/ranking과 같은 데이터)
+    series = chart_data.ranking_series()
 
     save_dir = os.path.join('static', 'image')
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
-        
+
     save_path = os.path.join(save_dir, 'ranking_graph.png')
-    plt.savefig(save_path)
-    plt.close()
+    _save_chart('ranking', series, save_path)
+
+def _draw_ranking_graph(series):
+    months = series['labels']
+
+    fig, ax = _new_figure((10, 6))
+
+    # 그래프 그리기 (팀별 지정 색상 사용)
+    for team in series['teams']:
+        ax.plot(months, team['rankings'], marker='o', label=team['name'], linewidth=2, color=team['color'])
+
+    ax.set_ylim(10.5, 0.5)
+    ax.set_yticks(range(1, 11), [f'{i}위' for i in range(1, 11)])
+
+    ax.grid(True, linestyle='--', alpha=0.6)
+    fig.tight_layout()
+    return fig
 
 # 팀페이지 - 팀 강점/약점 분석 (WAA 레이더 차트-오각형 그래프)
 def create_team_radar_charts():
@@ -67,133 +92,101 @@ def create_team_radar_charts():
     모든 팀의 WAA 데이터를 0~100으로 정규화하여 레이더 차트를 생성합니다.
     (FIFA 스타일: 수치와 라벨을 그래프 바깥쪽에 고정하여 겹침 방지)
     """
-    # 1. 폰트 설정
-    font_path = None
-    import matplotlib.font_manager as fm
-    font_candidates = fm.findSystemFonts(fontpaths=None, fontext='ttf')
-    for font in font_candidates:
-        if 'Nanum' in font or 'Gothic' in font or 'Malgun' in font:
-            font_path = font
-            break
-            
-    if font_path:
-        fe = fm.FontEntry(fname=font_path, name='KoreanFont')
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rcParams['font.family'] = 'KoreanFont'
-    else:
-        plt.rcParams['font.family'] = 'sans-serif'
-
-    # 2. 데이터 로드
-    all_data = get_all_team_data()
-    if not all_data:
+    for team_name in get_all_team_data():
+        create_team_radar_chart(team_name)
+
+    print("팀 페이지 오각형 차트 생성 성공")
+
+def create_team_radar_chart(team_name):
+    """
+    한 팀의 WAA 레이더 차트를 생성합니다. (정규화 기준은 전체 팀의 최소/최대값)
+    파일명: radar_{team_name}.png
+    """
+    # 폰트 설정 (한글 폰트는 프로세스당 1회만 등록)
+    apply_korean_font()
+
+    # 1~2. 데이터 로드 (리그 전체 지표 행렬에서 이미 정규화된 값 사용)
+    series = chart_data.team_radar_series(team_name)
+    if series is None:
         return
 
-    # 분석할 5개 항목 정의
-    categories = ['Batting_WAA', 'Baserunning_WAA', 'Defense_WAA', 'Starter_WAA', 'Reliever_WAA']
-    labels = ['타격', '주루', '수비', '선발', '구원']
-    
-    # 각 항목별 최대/최소값 계산
-    min_max = {}
-    for cat in categories:
-        values = [team_list[0][cat] for team_list in all_data.values()]
-        min_max[cat] = {'min': min(values), 'max': max(values)}
-
-    # 3. 팀별 차트 생성
+    # 3. 차트 생성
     save_dir = os.path.join('static', 'image', 'radar')
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
 
-    for team_name, team_list in all_data.items():
-        data = team_list[0]
-        
-        values = []     # 그래프 그리기용 (0~100)
-        raw_values = [] # 텍스트 표시용 (실제 값)
-        
-        for cat in categories:
-            val = data[cat]
-            raw_values.append(val)
-            
-            min_val = min_max[cat]['min']
-            max_val = min_max[cat]['max']
-            
-            if max_val == min_val:
-                normalized_val = 50
-            else:
-                normalized_val = (val - min_val) / (max_val - min_val) * 100
-            values.append(normalized_val)
-        
-        # 리스트 닫기
-        values += values[:1]
-        raw_values += raw_values[:1]
-        
-        # 각 축의 각도 계산
-        N = len(categories)
-        angles = [n / float(N) * 2 * np.pi for n in range(N)]
-        angles += angles[:1]
-        
-        # 차트 그리기
-        fig, ax = plt.subplots(figsize=(6, 6), subplot_kw=dict(polar=True))
-        
-        # ★ 수정 1: 기존의 자동 라벨(xticks) 제거
-        plt.xticks([]) 
-        
-        # Y축 눈금 설정 (라벨 없음)
-        ax.set_rlabel_position(0)
-        plt.yticks([20, 40, 60, 80, 100], ["", "", "", "", ""], color="grey", size=7)
-        plt.ylim(0, 100) # 그래프는 100까지만 그림
-        
-        # 데이터 영역 칠하기
-        ax.plot(angles, values, linewidth=2, linestyle='solid', color='#002561')
-        ax.fill(angles, values, '#002561', alpha=0.2)
-        
-        # ★ 수정 2: 라벨과 점수를 바깥쪽에 직접 배치 (FIFA 스타일)
-        # 그래프 끝(100)보다 더 바깥쪽인 120, 135 위치에 텍스트를 고정시킵니다.
-        for angle, label, raw in zip(angles[:-1], labels, raw_values[:-1]):            
-            # 1. 실제 점수 (크고 진하게) - 위치: 120
-            ax.text(angle, 120, f"{raw}", 
-                    horizontalalignment='center', 
-                    verticalalignment='center', 
-                    size=13, weight='bold', color='#002561') # 팀 컬러
-            
-            # 2. 항목 이름 (작게 점수 아래에) - 위치: 138
-            ax.text(angle, 138, label, 
-                    horizontalalignment='center', 
-                    verticalalignment='center', 
-                    size=11, color='gray')
-
-        plt.tight_layout(pad=3)
-
-        # 이미지 저장
-        file_name = f"radar_{team_name}.png"
-        plt.savefig(os.path.join(save_dir, file_name), transparent=True)
-        plt.close()
-        
-    print("팀 페이지 오각형 차트 생성 성공")
-
-# 팀 - 팀 비교페이지 : 팀 분석 
+    # 이미지 저장
+    file_name = f"radar_{team_name}.png"
+    _save_chart('radar', series, os.path.join(save_dir, file_name))
+
+def _draw_team_radar_chart(series):
+    categories = series['categories']
+    labels = series['labels']
+
+    # 리스트 닫기 (시리즈 원본은 바꾸지 않음)
+    raw_values = series['raw'] + series['raw'][:1]                  # 텍스트 표시용 (실제 값)
+    values = series['normalized'] + series['normalized'][:1]       # 그래프 그리기용 (0~100)
+
+    # 각 축의 각도 계산
+    N = len(categories)
+    angles = [n / float(N) * 2 * np.pi for n in range(N)]
+    angles += angles[:1]
+
+    # 차트 그리기
+    fig, ax = _new_figure((6, 6), polar=True)
+
+    # ★ 수정 1: 기존의 자동 라벨(xticks) 제거
+    ax.set_xticks([])
+
+    # Y축 눈금 설정 (라벨 없음)
+    ax.set_rlabel_position(0)
+    ax.set_yticks([20, 40, 60, 80, 100], ["", "", "", "", ""], color="grey", size=7)
+    ax.set_ylim(0, 100) # 그래프는 100까지만 그림
+
+    # 데이터 영역 칠하기
+    ax.plot(angles, values, linewidth=2, linestyle='solid', color='#002561')
+    ax.fill(angles, values, '#002561', alpha=0.2)
+
+    # ★ 수정 2: 라벨과 점수를 바깥쪽에 직접 배치 (FIFA 스타일)
+    # 그래프 끝(100)보다 더 바깥쪽인 120, 135 위치에 텍스트를 고정시킵니다.
+    for angle, label, raw in zip(angles[:-1], labels, raw_values[:-1]):
+        # 1. 실제 점수 (크고 진하게) - 위치: 120
+        ax.text(angle, 120, f"{raw}",
+                horizontalalignment='center',
+                verticalalignment='center',
+                size=13, weight='bold', color='#002561') # 팀 컬러
+
+        # 2. 항목 이름 (작게 점수 아래에) - 위치: 138
+        ax.text(angle, 138, label,
+                horizontalalignment='center',
+                verticalalignment='center',
+                size=11, color='gray')
+
+    fig.tight_layout(pad=3)
+    return fig
+
+# 팀 - 팀 비교페이지 : 팀 분석
 def create_waa_table_images():
     """
     Pandas와 Matplotlib을 사용하여 WAA 분석 표를 이미지로 생성하고 저장합니다.
     (HTML 테이블 대신 Python 라이브러리 활용 능력을 보여주기 위함)
     """
-    # 1. 폰트 설정 (기존 코드 재사용)
-    font_path = None
-    font_candidates = fm.findSystemFonts(fontpaths=None, fontext='ttf')
-    for font in font_candidates:
-        if 'Nanum' in font or 'Gothic' in font or 'Malgun' in font:
-            font_path = font
-            break
-            
-    if font_path:
-        fe = fm.FontEntry(fname=font_path, name='KoreanFont')
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rcParams['font.family'] = 'KoreanFont'
-    else:
-        plt.rcParams['font.family'] = 'sans-serif'
-
-    # 2. 데이터 로드
-    all_data = get_all_team_data()
-    if not all_data:
+    for team_name in get_all_team_data():
+        create_waa_table_image(team_name)
+
+    print("팀 분석 표(Matplotlib) 이미지 생성 성공")
+
+def create_waa_table_image(team_name):
+    """
+    한 팀의 WAA 분석 표 이미지를 생성합니다.
+    파일명: table_{team_name}.png
+    """
+    # 폰트 설정 (한글 폰트는 프로세스당 1회만 등록)
+    apply_korean_font()
+
+    # 2. 데이터 로드 (리그 전체 지표 행렬)
+    series = chart_data.waa_table_series(team_name)
+    if series is None:
         return
 
     # 저장 경로 설정
@@ -201,176 +194,192 @@ def create_waa_table_images():
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
 
-    # 분석할 항목 정의
-    metrics = [
-        {'key': 'Batting', 'label': '타격'},
-        {'key': 'Baserunning', 'label': '주루'},
-        {'key': 'Defense', 'label': '수비'},
-        {'key': 'Starter', 'label': '선발'},
-        {'key': 'Reliever', 'label': '구원'}
-    ]
-
-    for team_name, team_list in all_data.items():
-        data = team_list[0]
-        
-        # 3. Pandas DataFrame 생성 (데이터 구조화)
-        table_data = []
-        for m in metrics:
-            waa = data[f"{m['key']}_WAA"]
-            rank = data[f"{m['key']}_Rank"]
-            table_data.append([m['label'], waa, f"{rank}위"])
-            
-        df = pd.DataFrame(table_data, columns=['부문', '기록', '순위'])
-
-        # 4. Matplotlib으로 표 그리기
-        fig, ax = plt.subplots(figsize=(5, 4)) # 크기 조절
-        ax.axis('off') # 축 숨기기
-        ax.axis('tight')
-
-        # 테이블 생성
-        table = ax.table(cellText=df.values,
-                         colLabels=df.columns,
-                         loc='center',
-                         cellLoc='center',
-                         colColours=['#a50034']*3) # 헤더 색상 (자주색)
-
-        # 5. 스타일링 (글자 크기, 셀 높이, 색상 조건)
-        table.auto_set_font_size(False)
-        table.set_fontsize(13)
-        table.scale(1.2, 2) # (가로, 세로) 비율 조절
-
-        # 셀 스타일 디테일 설정
-        for (row, col), cell in table.get_celld().items():
-            cell.set_edgecolor('white') # 테두리 흰색 (깔끔하게)
-            
-            if row == 0: # 헤더 부분
-                cell.set_text_props(color='white', weight='bold')
-                cell.set_height(0.15)
-            else: # 데이터 부분
-                cell.set_height(0.12)
-                # '기록' 컬럼(인덱스 1)에 대해 색상 조건 적용 (뱃지 효과 흉내)
-                if col == 1: 
-                    val = df.iloc[row-1, 1] # 값 가져오기
-                    if val > 0.5:
-                        cell.set_facecolor('#e8f0fe') # 배경을 연하게
-                        cell.set_text_props(color='#d9534f', weight='bold') # 글자를 빨갛게
-                    elif val < -0.5:
-                        cell.set_facecolor('#e8f0fe')
-                        cell.set_text_props(color='#5b7ece', weight='bold') # 글자를 파랗게
-                    else:
-                        cell.set_text_props(color='#555')
-
-                # 교차 행 배경색 (가독성)
-                if row % 2 == 0:
-                     if col != 1: cell.set_facecolor('#f9f9f9')
-
-        # 이미지 저장
-        plt.tight_layout()
-        file_name = f"table_{team_name}.png"
-        plt.savefig(os.path.join(save_dir, file_name), bbox_inches='tight', dpi=100)
-        plt.close()
-
-    print("팀 분석 표(Matplotlib) 이미지 생성 성공")
-
-# 팀 - 팀 비교페이지 : 팀별 대결 기록 
+    # 이미지 저장
+    file_name = f"table_{team_name}.png"
+    _save_chart('waa_table', series, os.path.join(save_dir, file_name))
+
+def _draw_waa_table(series):
+    # 3. Pandas DataFrame 생성 (데이터 구조화)
+    table_data = [[label, waa, f"{rank}위"] for label, waa, rank in series['rows']]
+    df = pd.DataFrame(table_data, columns=series['columns'])
+
+    # 4. Matplotlib으로 표 그리기
+    fig, ax = _new_figure((5, 4)) # 크기 조절
+    ax.axis('off') # 축 숨기기
+    ax.axis('tight')
+
+    # 테이블 생성
+    table = ax.table(cellText=df.values,
+                     colLabels=df.columns,
+                     loc='center',
+                     cellLoc='center',
+                     colColours=['#a50034']*3) # 헤더 색상 (자주색)
+
+    # 5. 스타일링 (글자 크기, 셀 높이, 색상 조건)
+    table.auto_set_font_size(False)
+    table.set_fontsize(13)
+    table.scale(1.2, 2) # (가로, 세로) 비율 조절
+
+    # 셀 스타일 디테일 설정
+    for (row, col), cell in table.get_celld().items():
+        cell.set_edgecolor('white') # 테두리 흰색 (깔끔하게)
+
+        if row == 0: # 헤더 부분
+            cell.set_text_props(color='white', weight='bold')
+            cell.set_height(0.15)
+        else: # 데이터 부분
+            cell.set_height(0.12)
+            # '기록' 컬럼(인덱스 1)에 대해 색상 조건 적용 (뱃지 효과 흉내)
+            if col == 1:
+                val = df.iloc[row-1, 1] # 값 가져오기
+                if val > 0.5:
+                    cell.set_facecolor('#e8f0fe') # 배경을 연하게
+                    cell.set_text_props(color='#d9534f', weight='bold') # 글자를 빨갛게
+                elif val < -0.5:
+                    cell.set_facecolor('#e8f0fe')
+                    cell.set_text_props(color='#5b7ece', weight='bold') # 글자를 파랗게
+                else:
+                    cell.set_text_props(color='#555')
+
+            # 교차 행 배경색 (가독성)
+            if row % 2 == 0:
+                 if col != 1: cell.set_facecolor('#f9f9f9')
+
+    fig.tight_layout()
+    return fig
+
+# 팀 - 팀 비교페이지 : 팀별 대결 기록
 def create_match_record_images():
     """
     모든 팀 vs 상대팀의 1:1 전적 표를 이미지로 생성합니다.
     파일명 예시: record_LG_vs_한화.png
     """
+    for team_name, opp_name in get_match_record_pairs():
+        create_match_record_image(team_name, opp_name)
+
+    print("상대 전적 표(Record) 이미지 생성 성공")
+
+def get_match_record_pairs():
+    """
+    전적 표를 만들 (팀, 상대팀) 목록을 반환합니다. 자기 자신과의 기록('-')은 제외합니다.
+    """
+    h2h = get_head_to_head()
+    rows, cols = np.nonzero(h2h.played)
+    return [(h2h.teams[i], h2h.teams[j]) for i, j in zip(rows, cols)]
+
+def create_h2h_heatmap():
+    """
+    리그 전체 상대 전적(팀 x 상대팀 승률)을 히트맵 1장으로 생성합니다.
+    파일명: h2h_heatmap.png
+    """
+    # 폰트 설정 (한글 폰트는 프로세스당 1회만 등록)
+    apply_korean_font()
+
+    save_dir = os.path.join('static', 'image')
+    if not os.path.exists(save_dir):
+        os.makedirs(save_dir)
+
+    _save_chart('h2h', chart_data.h2h_series(), os.path.join(save_dir, 'h2h_heatmap.png'))
+
+def _draw_h2h_heatmap(series):
+    teams = series['teams']
+    n = len(teams)
+    pct = np.array([[np.nan if v is None else v for v in row] for row in series['PCT']], dtype=float)
+
+    fig, ax = _new_figure((9, 8))
+
+    # 승률 0.5를 기준으로 빨강(우세) / 파랑(열세), 기록 없는 칸(자기 자신)은 회색
+    cmap = matplotlib.colormaps['RdBu_r'].copy()
+    cmap.set_bad('#eeeeee')
+    im = ax.imshow(np.ma.masked_invalid(pct), cmap=cmap, vmin=0.2, vmax=0.8)
+
+    # 칸마다 "승-패-무"와 승률 표시
+    for i in range(n):
+        for j in range(n):
+            if series['W'][i][j] is None:
+                continue
+            label = f"{series['W'][i][j]}-{series['L'][i][j]}-{series['D'][i][j]}"
+            if not np.isnan(pct[i, j]):
+                label += f"\n{pct[i, j]:.3f}"
+            strong = not np.isnan(pct[i, j]) and abs(pct[i, j] - 0.5) > 0.2
+            ax.text(j, i, label, ha='center', va='center', fontsize=8,
+                    color='white' if strong else '#333')
+
+    ax.set_xticks(range(n), [f"vs {t}" for t in teams], fontsize=10)
+    ax.set_yticks(range(n), teams, fontsize=11, fontweight='bold')
+    ax.xaxis.tick_top()
+    ax.tick_params(length=0)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04, label='승률')
+
+    fig.tight_layout()
+    return fig
+
+def create_match_record_image(team_name, opp_name):
+    """
+    team_name vs opp_name 1:1 전적 표 이미지를 생성합니다.
+    """
     # 1. 데이터 로드
-    comp_data = get_comparison_data()
-    if not comp_data:
+    series = chart_data.match_record_series(team_name, opp_name)
+    if series is None:
         return
 
-    # 폰트 설정 (기존 코드 재사용 또는 확인)
-    font_path = None
-    font_candidates = fm.findSystemFonts(fontpaths=None, fontext='ttf')
-    for font in font_candidates:
-        if 'Nanum' in font or 'Gothic' in font or 'Malgun' in font:
-            font_path = font
-            break
-    if font_path:
-        fe = fm.FontEntry(fname=font_path, name='KoreanFont')
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rcParams['font.family'] = 'KoreanFont'
-    
+    # 폰트 설정 (한글 폰트는 프로세스당 1회만 등록)
+    apply_korean_font()
+
     # 저장 경로
     save_dir = os.path.join('static', 'image', 'record')
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
 
-    # 2. 모든 데이터 순회하며 이미지 생성
-    for team_name, records in comp_data.items():
-        for record in records:
-            opp_name = record['Opponent']
-            
-            # 자기 자신과의 기록('-')은 건너뜀
-            if opp_name == team_name:
-                continue
-
-            # 3. 데이터 프레임 생성 (1행)
-            # JSON 키: W, L, D, Winning_PCT
-            try:
-                # 승률이 문자열일 수 있으므로 float 변환 시도
-                pct = float(record['Winning_PCT'])
-                pct_str = f"{pct:.3f}"
-            except:
-                pct = 0.0
-                pct_str = "-"
-
-            row_data = [[
-                f"vs {opp_name}", 
-                record['W'], 
-                record['D'], 
-                record['L'], 
-                pct_str
-            ]]
-            
-            df = pd.DataFrame(row_data, columns=['대결', '승', '무', '패', '승률'])
-
-            # 4. 표 그리기
-            fig, ax = plt.subplots(figsize=(6, 1.2)) # 높이 아주 작게 (1행용)
-            ax.axis('off')
-            
-            # 테이블 생성
-            table = ax.table(cellText=df.values,
-                             colLabels=df.columns,
-                             loc='center',
-                             cellLoc='center',
-                             colColours=['#a50034']*5) # 헤더 자주색
-
-            # 5. 스타일링
-            table.auto_set_font_size(False)
-            table.set_fontsize(14)
-            table.scale(1, 1.8) # 셀 높이 조절
-
-            for (row, col), cell in table.get_celld().items():
-                cell.set_edgecolor('white') # 테두리 흰색
-                
-                if row == 0: # 헤더
+    # 이미지 저장
+    file_name = f"record_{team_name}_vs_{opp_name}.png"
+    _save_chart('record', series, os.path.join(save_dir, file_name))
+
+def _draw_match_record(series):
+    # 2. 데이터 프레임 생성 (1행)
+    # 승률을 숫자로 바꿀 수 없으면 PCT는 None ('-'로 표시)
+    pct = series['PCT'] if series['PCT'] is not None else 0.0
+    df = pd.DataFrame([series['row']], columns=series['columns'])
+
+    # 4. 표 그리기
+    fig, ax = _new_figure((6, 1.2)) # 높이 아주 작게 (1행용)
+    ax.axis('off')
+
+    # 테이블 생성
+    table = ax.table(cellText=df.values,
+                     colLabels=df.columns,
+                     loc='center',
+                     cellLoc='center',
+                     colColours=['#a50034']*5) # 헤더 자주색
+
+    # 5. 스타일링
+    table.auto_set_font_size(False)
+    table.set_fontsize(14)
+    table.scale(1, 1.8) # 셀 높이 조절
+
+    for (row, col), cell in table.get_celld().items():
+        cell.set_edgecolor('white') # 테두리 흰색
+
+        if row == 0: # 헤더
+            cell.set_text_props(color='white', weight='bold')
+            cell.set_height(0.4)
+        else: # 데이터 행
+            cell.set_height(0.5)
+            cell.set_facecolor('white') # 배경 흰색
+
+            # 승률 컬럼(인덱스 4) 뱃지 효과
+            if col == 4:
+                if pct >= 0.5:
+                    cell.set_text_props(color='white', weight='bold')
+                    cell.set_facecolor('#d9534f') # 빨강 배경
+                else:
                     cell.set_text_props(color='white', weight='bold')
-                    cell.set_height(0.4)
-                else: # 데이터 행
-                    cell.set_height(0.5)
-                    cell.set_facecolor('white') # 배경 흰색
-                    
-                    # 승률 컬럼(인덱스 4) 뱃지 효과
-                    if col == 4:
-                        if pct >= 0.5:
-                            cell.set_text_props(color='white', weight='bold') 
-                            cell.set_facecolor('#d9534f') # 빨강 배경
-                        else:
-                            cell.set_text_props(color='white', weight='bold')
-                            cell.set_facecolor('#5b7ece') # 파랑 배경
-
-            # 이미지 저장
-            plt.tight_layout()
-            file_name = f"record_{team_name}_vs_{opp_name}.png"
-            plt.savefig(os.path.join(save_dir, file_name), bbox_inches='tight', dpi=100)
-            plt.close()
+                    cell.set_facecolor('#5b7ece') # 파랑 배경
 
-    print("상대 전적 표(Record) 이미지 생성 성공")
+    fig.tight_layout()
+    return fig
 
 # 팀 페이지 - 핵심 능력치 요약(도넛그래프)
 def create_player_war_chart(player_data):
@@ -378,199 +387,156 @@ def create_player_war_chart(player_data):
     특정 선수의 oWAR, dWAR 비율을 파이 차트로 생성하여 저장합니다.
     파일명: war_chart_{PlayerID}.png
     """
-    # 폰트 설정 (기존 코드와 동일)
-    font_path = None
-    font_candidates = fm.findSystemFonts(fontpaths=None, fontext='ttf')
-    for font in font_candidates:
-        if 'Nanum' in font or 'Gothic' in font or 'Malgun' in font:
-            font_path = font
-            break
-    if font_path:
-        fe = fm.FontEntry(fname=font_path, name='KoreanFont')
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rcParams['font.family'] = 'KoreanFont'
-    else:
-        plt.rcParams['font.family'] = 'sans-serif'
-    
+    # 폰트 설정 (한글 폰트는 프로세스당 1회만 등록)
+    apply_korean_font()
+
     # 1. 데이터 준비
     player_id = player_data['Id']
-    war = player_data.get('WAR', 0)
-    owar = player_data.get('oWAR', 0)
-    dwar = player_data.get('dWAR', 0)
+    series = chart_data.player_war_series(player_data)
+    war, owar, dwar = series['WAR'], series['oWAR'], series['dWAR']
 
     # 2. 저장 경로 설정
     save_dir = os.path.join('static', 'image', 'player_chart')
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
-        
-    # 3. 데이터 전처리 (파이 차트용)
-    # 음수가 있을 경우 시각화를 위해 절대값 사용, 둘 다 0이면 빈 차트 생성
-    abs_owar = abs(owar)
-    abs_dwar = abs(dwar)
-    
-    if abs_owar + abs_dwar == 0:
-        # 데이터가 없거나 0일 경우 회색 원
-        sizes = [1]
-        colors = ['#e0e0e0']
-        labels = ['']
-    else:
-        sizes = [abs_owar, abs_dwar]
-        colors = ['#d9534f', '#5b7ece'] # 빨강(공격), 파랑(수비)
-        labels = ['공격', '수비']
+    save_path = os.path.join(save_dir, f"war_chart_{player_id}.png")
+
+    # 입력 값이 같으면 기존 이미지를 그대로 사용
+    cache_key = render_cache.make_key('war_chart', {'WAR': war, 'oWAR': owar, 'dWAR': dwar})
+    if render_cache.is_fresh(save_path, cache_key):
+        return
+
+    _save_chart('player_war', series, save_path, cache_key)
+
+def _draw_player_war_chart(series):
+    # 3. 데이터 전처리 (파이 차트용, 음수는 절대값 / 둘 다 0이면 회색 원)
+    sizes, colors, labels = series['sizes'], series['colors'], series['labels']
 
     # 4. 차트 그리기 (도넛 차트)
-    fig, ax = plt.subplots(figsize=(3, 3))
-    
-    wedges, texts, autotexts = ax.pie(sizes, 
-                                      labels=labels, 
-                                      colors=colors, 
+    fig, ax = _new_figure((3, 3))
+
+    wedges, texts, autotexts = ax.pie(sizes,
+                                      labels=labels,
+                                      colors=colors,
                                       autopct='', # 퍼센트 텍스트 제거 (직접 수치 입력)
-                                      startangle=90, 
+                                      startangle=90,
                                       pctdistance=0.85,
                                       wedgeprops=dict(width=0.4, edgecolor='w'))
 
     # 가운데 구멍에 총 WAR 표시
-    ax.text(0, 0, f"총 기여도\n(WAR)\n{war}", ha='center', va='center', fontsize=11, fontweight='bold', color='#333')
+    ax.text(0, 0, f"총 기여도\n(WAR)\n{series['WAR']}", ha='center', va='center', fontsize=11, fontweight='bold', color='#333')
 
     # 범례 및 수치 텍스트 추가 (그래프 밖이나 위에 표시)
     # 여기서는 간단하게 제목이나 캡션 대신 HTML에서 범례를 처리하도록 함
-    
-    # 레이아웃 정리 및 저장
-    plt.tight_layout()
-    file_name = f"war_chart_{player_id}.png"
-    plt.savefig(os.path.join(save_dir, file_name), transparent=True)
-    plt.close()
+
+    # 레이아웃 정리
+    fig.tight_layout()
+    return fig
 
 # 팀 페이지 - 공격 효율성(가로막대그래프)
 def create_player_offensive_chart(player_data):
     """
     선수의 공격 효율성(wRC+, OPS, AVG, OBP, SLG)을 가로 막대 그래프로 생성합니다.
-    단위가 다른 데이터를 시각화하기 위해 각 지표별 기준치 대비 비율로 막대 길이를 설정합니다.
-    """
-    # 폰트 설정 (기존 코드 사용)
-    font_path = None
-    font_candidates = fm.findSystemFonts(fontpaths=None, fontext='ttf')
-    for font in font_candidates:
-        if 'Nanum' in font or 'Gothic' in font or 'Malgun' in font:
-            font_path = font
-            break
-    if font_path:
-        fe = fm.FontEntry(fname=font_path, name='KoreanFont')
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rcParams['font.family'] = 'KoreanFont'
-    else:
-        plt.rcParams['font.family'] = 'sans-serif'
+    단위가 다른 데이터를 시각화하기 위해 각 지표의 리그 백분위(최소 타석 이상 선수 기준)로 막대 길이를 설정합니다.
+    """
+    # 폰트 설정 (한글 폰트는 프로세스당 1회만 등록)
+    apply_korean_font()
 
     # 1. 데이터 준비
     player_id = player_data['Id']
-    
-    # 시각화할 지표와 라벨 정의 (순서: 위에서부터)
-    metrics = ['wRC+', 'OPS', 'SLG', 'OBP', 'AVG']
-    labels = ['wRC+', 'OPS', '장타율', '출루율', '타율']
-    
-    # 각 지표의 "만점(그래프 꽉 차는 길이)" 기준 설정 (시각적 밸런스 조절용)
-    # 예: 타율 0.4면 그래프 80% 채움, wRC+ 200이면 그래프 100% 채움
-    max_limits = {
-        'wRC+': 200, 
-        'OPS': 1.2, 
-        'SLG': 0.8, 
-        'OBP': 0.6, 
-        'AVG': 0.5
-    }
-    
-    values = []
-    ratios = [] # 그래프 그리기용 비율 (0~1)
-    
-    for m in metrics:
-        val = player_data.get(m, 0)
-        values.append(val)
-        
-        # 비율 계산 (값이 기준보다 크면 1.0으로 고정)
-        limit = max_limits[m]
-        ratio = val / limit if limit > 0 else 0
-        ratios.append(min(ratio, 1.0))
+
+    # 시각화할 지표와 라벨 (순서: 위에서부터)
+    # ratios: 그래프 그리기용 비율 (0~1) = 리그 백분위 / 100
+    series = chart_data.player_offensive_series(player_data)
+    stat_keys, values, ratios = series['metrics'], series['values'], series['ratios']
 
     # 2. 저장 경로
     save_dir = os.path.join('static', 'image', 'player_chart')
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
+    save_path = os.path.join(save_dir, f"offensive_chart_{player_id}.png")
+
+    # 입력 값이 같으면 기존 이미지를 그대로 사용
+    cache_key = render_cache.make_key('offensive_chart', {'values': dict(zip(stat_keys, values)), 'ratios': ratios})
+    if render_cache.is_fresh(save_path, cache_key):
+        return
+
+    _save_chart('player_offensive', series, save_path, cache_key)
+
+def _draw_player_offensive_chart(series):
+    stat_keys, labels = series['metrics'], series['labels']
+    values, ratios = series['values'], series['ratios']
 
     # 3. 그래프 그리기 (가로 막대)
-    fig, ax = plt.subplots(figsize=(6, 4))
-    
+    fig, ax = _new_figure((6, 4))
+
     # y축 위치 설정 (위에서부터 그려지게 역순 정렬)
-    y_pos = range(len(metrics))
-    
+    y_pos = range(len(stat_keys))
+
     # 막대 그리기
-    bars = ax.barh(y_pos, ratios, height=0.8, color=['#5b7ece', '#d9534f', '#888', '#888', '#888'])
-    
+    bars = ax.barh(y_pos, ratios, height=0.8, color=series['colors'])
+
     # 4. 스타일링
     ax.set_yticks(y_pos)
     ax.set_yticklabels(labels, fontsize=14, fontweight='bold')
     ax.set_xlim(0, 1.1) # 텍스트 공간 확보를 위해 1.1까지
     ax.axis('off') # 테두리 및 눈금 제거 (깔끔하게)
-    
+
     # y축 라벨만 다시 켬 (axis='off'로 다 사라졌으므로 수동 텍스트 배치)
     for i, label in enumerate(labels):
         ax.text(-0.02, i, label, ha='right', va='center', fontsize=14, fontweight='bold', color='#333')
 
-    # 5. 막대 옆에 실제 수치 표시
+    # 5. 막대 옆에 실제 수치와 리그 백분위 표시
     for i, (ratio, val) in enumerate(zip(ratios, values)):
         # wRC+는 정수, 나머지는 소수점 3자리
-        if metrics[i] == 'wRC+':
+        if stat_keys[i] == 'wRC+':
             text_val = f"{val}"
         else:
             text_val = f"{val:.3f}"
-            
+        text_val += f" ({ratio * 100:.0f}%)"
+
         ax.text(ratio + 0.02, i, text_val, va='center', fontsize=12, fontweight='bold', color='#002561')
 
-    # 6. 저장
-    plt.tight_layout()
-    file_name = f"offensive_chart_{player_id}.png"
-    plt.savefig(os.path.join(save_dir, file_name), bbox_inches='tight', transparent=True)
-    plt.close()
+    fig.tight_layout()
+    return fig
 
 # 선수 페이지 - 타격 세부 기록
 def create_player_detail_chart(player_data):
     """
     선수의 타격 세부 기록(H, R, RBI, HR, 2B, 3B, BB, SO)을 선 그래프로 생성합니다.
     """
-    # 폰트 설정 (기존 코드 사용)
-    font_path = None
-    font_candidates = fm.findSystemFonts(fontpaths=None, fontext='ttf')
-    for font in font_candidates:
-        if 'Nanum' in font or 'Gothic' in font or 'Malgun' in font:
-            font_path = font
-            break
-    if font_path:
-        fe = fm.FontEntry(fname=font_path, name='KoreanFont')
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rcParams['font.family'] = 'KoreanFont'
-    else:
-        plt.rcParams['font.family'] = 'sans-serif'
+    # 폰트 설정 (한글 폰트는 프로세스당 1회만 등록)
+    apply_korean_font()
 
     # 1. 데이터 준비
     player_id = player_data['Id']
-    
+
     # 시각화할 지표와 라벨
-    metrics = ['H', 'R', 'RBI', 'BB', 'SO', '2B', 'HR', '3B'] # 수치 크기순 정렬 추천
-    labels = ['안타', '득점', '타점', '볼넷', '삼진', '2루타', '홈런', '3루타']
-    
-    values = []
-    for m in metrics:
-        values.append(player_data.get(m, 0))
+    series = chart_data.player_detail_series(player_data)
+    stat_keys, values = series['metrics'], series['values']
 
     # 2. 저장 경로
     save_dir = os.path.join('static', 'image', 'player_chart')
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
+    save_path = os.path.join(save_dir, f"detail_chart_{player_id}.png")
+
+    # 입력 값이 같으면 기존 이미지를 그대로 사용
+    cache_key = render_cache.make_key('detail_chart', dict(zip(stat_keys, values)))
+    if render_cache.is_fresh(save_path, cache_key):
+        return
+
+    _save_chart('player_detail', series, save_path, cache_key)
+
+def _draw_player_detail_chart(series):
+    labels, values = series['labels'], series['values']
 
     # 3. 그래프 그리기 (선 그래프)
-    fig, ax = plt.subplots(figsize=(10, 4)) # 가로로 긴 형태
-    
+    fig, ax = _new_figure((10, 4)) # 가로로 긴 형태
+
     # 선 그래프와 마커 그리기
     ax.plot(labels, values, marker='o', linestyle='-', linewidth=2, color='#002561', markersize=8)
-    
+
     # 영역 채우기 (선 아래쪽을 연하게 채움)
     ax.fill_between(labels, values, color='#002561', alpha=0.1)
 
@@ -578,171 +544,162 @@ def create_player_detail_chart(player_data):
     ax.grid(True, linestyle='--', alpha=0.5, axis='y') # Y축 그리드만 표시
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
-    
+
     # 데이터 값 표시 (텍스트)
     for i, v in enumerate(values):
         ax.text(i, v + (max(values)*0.05), str(v), ha='center', va='bottom', fontsize=11, fontweight='bold')
 
     # Y축 범위 여유 있게 설정 (텍스트 잘림 방지)
-    plt.ylim(0, max(values) * 1.2)
+    ax.set_ylim(0, max(values) * 1.2)
 
-    # 5. 저장
-    plt.tight_layout()
-    file_name = f"detail_chart_{player_id}.png"
-    plt.savefig(os.path.join(save_dir, file_name), bbox_inches='tight', transparent=True)
-    plt.close()
+    fig.tight_layout()
+    return fig
 
 # 팀 페이지 - 홈구장 지도 생성
-import folium # 상단에 추가
-
-# ... (기존 코드들) ...
-
+# (팀 페이지는 templates/stadium_map.html 지도 페이지(/map/<team_name>)를 사용하고,
+#  이 함수는 정적 HTML 파일이 필요할 때만 사용합니다.)
 def create_stadium_map(team_name, lat, lon, stadium_name):
     """
     위도, 경도 정보를 받아 Folium 지도를 생성하고 HTML 파일로 저장합니다.
     저장 경로: static/maps/map_{team_name}.html
     """
+    import folium # 무거운 모듈이므로 실제로 지도를 만들 때만 import
     # 1. 저장 경로 확인
     save_dir = os.path.join('static', 'maps')
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
-        
-    # 2. 지도 생성 (초기 위치 및 줌 레벨 설정)
-    m = folium.Map(location=[lat, lon], zoom_start=16)
-
-    # 3. 마커 추가 (클릭 시 구장 이름 표시)
-    folium.Marker(
-        location=[lat, lon],
-        popup=stadium_name,
-        tooltip=team_name,
-        icon=folium.Icon(color='blue', icon='info-sign')
-    ).add_to(m)
-
-    # 4. HTML 파일로 저장
+
     save_path = os.path.join(save_dir, f'map_{team_name}.html')
-    m.save(save_path)
-    # print(f"{team_name} 홈구장 지도 생성 완료")
 
-# 팀 페이지 - 득/실점 그래프
-# modules/visualizer.py 하단 추가
+    # 좌표/구장 이름이 같으면 기존 지도를 그대로 사용
+    cache_key = render_cache.make_key('stadium_map', {'team': team_name, 'lat': lat, 'lon': lon, 'stadium': stadium_name})
+    if render_cache.is_fresh(save_path, cache_key):
+        return
+
+    def render():
+        if render_cache.is_fresh(save_path, cache_key):
+            return
+        with metrics.render_timer('stadium_map'):
+            # 2. 지도 생성 (초기 위치 및 줌 레벨 설정)
+            m = folium.Map(location=[lat, lon], zoom_start=16)
+
+            # 3. 마커 추가 (클릭 시 구장 이름 표시)
+            folium.Marker(
+                location=[lat, lon],
+                popup=stadium_name,
+                tooltip=team_name,
+                icon=folium.Icon(color='blue', icon='info-sign')
+            ).add_to(m)
+            html = m.get_root().render()
+
+        # 4. HTML 파일로 저장 (임시 파일에 쓴 뒤 교체)
+        with metrics.phase('file_io'):
+            atomic_write_bytes(save_path, html.encode('utf-8'))
+        render_cache.remember(save_path, cache_key)
+
+    _render_flight.do(('file', save_path, cache_key), render)
 
+# 팀 페이지 - 득/실점 그래프
 def create_team_runs_chart(team_name, team_data):
     """
     팀의 경기당 득점(R/G)과 실점(-R/G)을 비교하는 세로 막대 그래프를 생성합니다.
     (토스 스타일: 두 개의 막대 비교)
     """
-    # 폰트 설정 (기존 코드 사용)
-    font_path = None
-    font_candidates = fm.findSystemFonts(fontpaths=None, fontext='ttf')
-    for font in font_candidates:
-        if 'Nanum' in font or 'Gothic' in font or 'Malgun' in font:
-            font_path = font
-            break
-    if font_path:
-        fe = fm.FontEntry(fname=font_path, name='KoreanFont')
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rcParams['font.family'] = 'KoreanFont'
-    else:
-        plt.rcParams['font.family'] = 'sans-serif'
+    # 폰트 설정 (한글 폰트는 프로세스당 1회만 등록)
+    apply_korean_font()
 
     # 1. 데이터 준비
-    # team_data는 리스트 안에 딕셔너리가 있는 형태이므로 첫 번째 요소 사용
-    data = team_data if isinstance(team_data, dict) else team_data[0]
-    
-    runs_scored = data.get('R/G', 0)
-    runs_allowed = data.get('-R/G', 0)
-    
-    values = [runs_scored, runs_allowed]
-    labels = ['평균 득점', '평균 실점']
-    colors = ['#5b7ece', '#ccc'] # 득점: 파랑(강조), 실점: 회색(비교)
+    series = chart_data.team_runs_series(team_data)
+    runs_scored, runs_allowed = series['values']
 
     # 2. 저장 경로
     save_dir = os.path.join('static', 'image', 'team_chart') # 팀별 차트 폴더
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
+    save_path = os.path.join(save_dir, f"runs_chart_{team_name}.png")
+
+    # 입력 값이 같으면 기존 이미지를 그대로 사용
+    cache_key = render_cache.make_key('runs_chart', {'R/G': runs_scored, '-R/G': runs_allowed})
+    if render_cache.is_fresh(save_path, cache_key):
+        return
+
+    _save_chart('runs', series, save_path, cache_key)
+
+def _draw_team_runs_chart(series):
+    values, labels, colors = series['values'], series['labels'], series['colors']
+    runs_scored, runs_allowed = values
 
     # 3. 그래프 그리기 (세로 막대)
-    fig, ax = plt.subplots(figsize=(5, 6)) # 세로로 긴 형태
-    
+    fig, ax = _new_figure((5, 6)) # 세로로 긴 형태
+
     bars = ax.bar(labels, values, color=colors, width=0.5)
-    
+
     # 4. 스타일링 (토스 스타일)
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
     ax.spines['left'].set_visible(False) # 왼쪽 축도 숨김
     ax.get_yaxis().set_visible(False)    # Y축 눈금 숨김
-    
+
     # X축 라벨 스타일
     ax.tick_params(axis='x', length=0, labelsize=12, labelcolor='#333', pad=10)
 
     # 막대 위에 값 표시 (크고 진하게)
     for bar, v in zip(bars, values):
         height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2, height + 0.1, 
-                f"{v}", 
-                ha='center', va='bottom', 
-                fontsize=16, fontweight='bold', 
+        ax.text(bar.get_x() + bar.get_width()/2, height + 0.1,
+                f"{v}",
+                ha='center', va='bottom',
+                fontsize=16, fontweight='bold',
                 color=bar.get_facecolor())
 
     # 득실 마진 표시 (가운데)
     margin = runs_scored - runs_allowed
     margin_text = f"+{margin:.2f}" if margin > 0 else f"{margin:.2f}"
     margin_color = '#d9534f' if margin < 0 else '#5b7ece' # 마이너스면 빨강, 플러스면 파랑
-    
+
     # 제목 대신 그래프 상단에 마진 표시
-    plt.title(f"득실 마진: {margin_text}", fontsize=14, color=margin_color, fontweight='bold', pad=20)
+    ax.set_title(f"득실 마진: {margin_text}", fontsize=14, color=margin_color, fontweight='bold', pad=20)
 
-    # 5. 저장
-    plt.tight_layout()
-    file_name = f"runs_chart_{team_name}.png"
-    plt.savefig(os.path.join(save_dir, file_name), bbox_inches='tight', transparent=True)
-    plt.close()
+    fig.tight_layout()
+    return fig
 
 # 팀 페이지 - 기대 승률
 def create_pythagorean_chart(team_name, team_data):
     """
     팀의 기대 승률(피타고리안 승률)과 실제 승률을 비교하는 그래프를 생성합니다.
-    공식: R^1.83 / (R^1.83 + RA^1.83)
-    """
-    # 폰트 설정 (기존 코드 사용)
-    font_path = None
-    font_candidates = fm.findSystemFonts(fontpaths=None, fontext='ttf')
-    for font in font_candidates:
-        if 'Nanum' in font or 'Gothic' in font or 'Malgun' in font:
-            font_path = font
-            break
-    if font_path:
-        fe = fm.FontEntry(fname=font_path, name='KoreanFont')
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rcParams['font.family'] = 'KoreanFont'
-    else:
-        plt.rcParams['font.family'] = 'sans-serif'
+    공식: R^x / (R^x + RA^x), 지수 x는 config.PYTHAGOREAN_EXPONENT (기본 1.83)
+    계산은 modules/pythagorean.py의 리그 일괄 계산 결과를 사용합니다.
+    """
+    # 폰트 설정 (한글 폰트는 프로세스당 1회만 등록)
+    apply_korean_font()
 
-    # 1. 데이터 준비
-    data = team_data if isinstance(team_data, dict) else team_data[0]
-    
-    R = data.get('R', 0)      # 총 득점
-    RA = data.get('-R', 0)    # 총 실점 (Runs Allowed)
-    actual_pct = data.get('PCT', 0) # 실제 승률
-
-    # 피타고리안 승률 계산 (지수 1.83 사용)
-    if (R + RA) == 0:
-        expected_pct = 0
-    else:
-        expected_pct = (R ** 1.83) / ((R ** 1.83) + (RA ** 1.83))
+    # 1. 데이터 준비 (피타고리안 승률 + 운/불운 분석)
+    series = chart_data.pythagorean_series(team_name, team_data)
+    expected_pct, actual_pct = series['values']
+
+    # 운/불운 분석 결과 (HTML에서 쓰기 위해 반환)
+    result = (expected_pct, series['analysis'], series['desc'])
 
     # 2. 저장 경로
     save_dir = os.path.join('static', 'image', 'team_chart')
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
+    save_path = os.path.join(save_dir, f"pythagorean_{team_name}.png")
+
+    # 입력 값이 같으면 기존 이미지를 그대로 사용
+    cache_key = render_cache.make_key('pythagorean', {'expected': expected_pct, 'PCT': actual_pct})
+    if render_cache.is_fresh(save_path, cache_key):
+        return result
 
+    _save_chart('pythagorean', series, save_path, cache_key)
+    return result
+
+def _draw_pythagorean_chart(series):
     # 3. 그래프 그리기 (가로 막대 비교)
-    fig, ax = plt.subplots(figsize=(6, 3)) # 높이를 낮게 설정
-    
+    fig, ax = _new_figure((6, 3)) # 높이를 낮게 설정
+
     # 데이터
-    labels = ['기대 승률', '실제 승률']
-    values = [expected_pct, actual_pct]
-    colors = ['#aaa', '#a50034'] # 기대(회색), 실제(팀컬러/붉은색)
+    labels, values, colors = series['labels'], series['values'], series['colors']
 
     y_pos = range(len(labels))
     bars = ax.barh(y_pos, values, height=0.5, color=colors)
@@ -759,69 +716,107 @@ def create_pythagorean_chart(team_name, team_data):
     # 수치 텍스트 표시
     for bar, v in zip(bars, values):
         width = bar.get_width()
-        ax.text(width + 0.02, bar.get_y() + bar.get_height()/2, 
-                f"{v:.3f}", 
+        ax.text(width + 0.02, bar.get_y() + bar.get_height()/2,
+                f"{v:.3f}",
                 va='center', fontsize=12, fontweight='bold', color='#333')
 
-    # 운/불운 분석 텍스트 추가 (그래프 제목 대신 하단 코멘트용 데이터 반환 고려)
-    diff = actual_pct - expected_pct
-    
-    # 5. 저장
-    plt.tight_layout()
-    file_name = f"pythagorean_{team_name}.png"
-    plt.savefig(os.path.join(save_dir, file_name), bbox_inches='tight', transparent=True)
-    plt.close()
-
-    # 분석 결과 텍스트 반환 (HTML에서 쓰기 위해)
-    if diff > 0.02:
-        analysis = "운이 매우 좋음 (접전 승리 다수)"
-        desc = "실력보다 더 좋은 성적을 거뒀습니다. 불펜이 강하거나 운이 따랐을 가능성이 높습니다."
-    elif diff > 0:
-        analysis = "약간의 행운"
-        desc = "기대치보다 조금 더 많이 이겼습니다."
-    elif diff > -0.02:
-        analysis = "정직한 성적"
-        desc = "득실점 능력만큼 딱 그만큼의 성적을 거뒀습니다."
-    else:
-        analysis = "불운 (성적 반등 가능성)"
-        desc = "전력에 비해 승리를 챙기지 못했습니다. 다음 시즌엔 성적이 오를 가능성이 큽니다."
-
-    return expected_pct, analysis, desc
+    fig.tight_layout()
+    return fig
 
 # 선수-선수 페이지
 # 이중 막대그래프
+COMPARISON_METRICS = chart_data.COMPARISON_METRICS
+
+# 최근 요청된 선수 쌍의 비교 그래프 PNG (1차: 메모리 LRU, 2차: 크기 제한 디스크 캐시)
+_comparison_png_cache = LRUCache(config.COMPARISON_MEMORY_CACHE_ITEMS, config.COMPARISON_MEMORY_CACHE_BYTES)
+_comparison_disk_cache = DiskCache(config.COMPARISON_DISK_CACHE_DIR,
+                                   prefix='compare_', suffix='.png',
+                                   max_files=config.COMPARISON_DISK_CACHE_MAX_FILES,
+                                   max_bytes=config.COMPARISON_DISK_CACHE_MAX_BYTES,
+                                   policy=config.COMPARISON_DISK_CACHE_POLICY)
+metrics.register_cache('comparison_memory', _comparison_png_cache.stats)
+metrics.register_cache('comparison_disk', _comparison_disk_cache.stats)
+
+_canonical_pair = chart_data.canonical_pair
+
 def create_player_comparison_chart(p1_data, p2_data):
     """
     두 선수의 주요 스탯(AVG, HR, RBI, SB, H)을 비교하는 이중 막대 그래프 생성
+    static/image/comparison/ 디스크 캐시에 저장하고 파일 이름(compare_<키>.png)을 반환합니다.
+    """
+    get_player_comparison_png(p1_data, p2_data)
+    return _comparison_disk_cache.file_name(comparison_cache_key(p1_data, p2_data))
+
+def render_player_comparison_png(p1_data, p2_data):
+    """
+    선수 비교 그래프를 파일로 저장하지 않고 PNG bytes로 반환합니다.
     """
-    # 폰트 설정 (기존 코드 사용)
-    font_path = None
-    font_candidates = fm.findSystemFonts(fontpaths=None, fontext='ttf')
-    for font in font_candidates:
-        if 'Nanum' in font or 'Gothic' in font or 'Malgun' in font:
-            font_path = font
-            break
-    if font_path:
-        fe = fm.FontEntry(fname=font_path, name='KoreanFont')
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rcParams['font.family'] = 'KoreanFont'
-    else:
-        plt.rcParams['font.family'] = 'sans-serif'
-
-    # 데이터 준비
-    metrics = ['AVG', 'HR', 'RBI', 'SB', 'H']
-    labels = ['타율', '홈런', '타점', '도루', '안타']
-    
-    p1_vals = [p1_data.get(m, 0) for m in metrics]
-    p2_vals = [p2_data.get(m, 0) for m in metrics]
-    
-    
+    draw, savefig_kw = CHART_RENDERERS['compare']
+    with metrics.render_timer('compare'):
+        fig = draw(chart_data.player_comparison_series(p1_data, p2_data))
+        return chart_output.figure_bytes(fig, 'png', **savefig_kw)
+
+def get_player_comparison_png(p1_data, p2_data):
+    """
+    선수 비교 그래프 PNG bytes를 반환합니다.
+    같은 선수 쌍/같은 스탯이면 메모리 LRU -> 디스크 캐시 순으로 찾고, 없을 때만 그립니다.
+    """
+    p1_data, p2_data = _canonical_pair(p1_data, p2_data)
+    key = comparison_cache_key(p1_data, p2_data)
+
+    png = _comparison_png_cache.get(key)
+    if png is not None:
+        return png
+
+    def load():
+        png = _comparison_disk_cache.get(key)
+        if png is None:
+            png = render_player_comparison_png(p1_data, p2_data)
+            # 디스크 저장에 실패해도 이미 그린 PNG로 응답 (다음 요청은 캐시 미스로 다시 시도)
+            try:
+                _comparison_disk_cache.put(key, png)
+            except OSError as e:
+                print(f"비교 그래프 디스크 캐시 저장 실패: {e}")
+        _comparison_png_cache.put(key, png)
+        return png
+
+    # 같은 쌍을 동시에 요청하면 한 번만 그림
+    return _render_flight.do(('compare', key), load)
+
+def comparison_cache_key(p1_data, p2_data):
+    """
+    비교 그래프가 사용하는 입력 값(이름, 스탯)으로 만든 키. 같은 키면 같은 이미지입니다.
+    두 선수의 순서와 관계없이 같은 키가 나옵니다.
+    """
+    p1_data, p2_data = _canonical_pair(p1_data, p2_data)
+    fields = [{'Id': p['Id'], 'Name': p['Name'], **{m: p.get(m, 0) for m in COMPARISON_METRICS}}
+              for p in (p1_data, p2_data)]
+    return render_cache.make_key('comparison', fields)
+
+def get_comparison_cache_stats():
+    """비교 그래프 캐시(메모리, 디스크)의 적중/미스 및 사용량 통계"""
+    return {'memory': _comparison_png_cache.stats(), 'disk': _comparison_disk_cache.stats()}
+
+def sweep_comparison_cache():
+    """
+    시작 시 비교 그래프 디스크 캐시 폴더를 정리합니다. (임시 파일/예전 형식 파일 삭제, 용량 제한 적용)
+    """
+    removed = _comparison_disk_cache.sweep()
+    stats = _comparison_disk_cache.stats()
+    print(f"비교 그래프 캐시 정리: {removed}개 삭제, {stats['files']}개 / {stats['bytes'] / 1024:.0f}KB 유지")
+
+def _draw_player_comparison_chart(series):
+    # 데이터 준비 (Id 순서로 정렬된 두 선수)
+    labels = series['labels']
+    p1, p2 = series['players']
+    p1_vals, p2_vals = p1['values'], p2['values']
+
     x = np.arange(len(labels))
     width = 0.35
 
-    fig, ax = plt.subplots(figsize=(8, 5))
-    rects1 = ax.bar(x - width/2, p1_vals, width, label=p1_data['Name'], color='#002561')
-    rects2 = ax.bar(x + width/2, p2_vals, width, label=p2_data['Name'], color='#a50034')
+    fig, ax = _new_figure((8, 5))
+    rects1 = ax.bar(x - width/2, p1_vals, width, label=p1['Name'], color=p1['color'])
+    rects2 = ax.bar(x + width/2, p2_vals, width, label=p2['Name'], color=p2['color'])
 
     def autolabel(rects, is_float=False):
         for i, rect in enumerate(rects):
@@ -833,7 +828,7 @@ def create_player_comparison_chart(p1_data, p2_data):
                 txt = f"{int(val)}"
             ax.annotate(txt,
                         xy=(rect.get_x() + rect.get_width() / 2, height),
-                        xytext=(0, 3), 
+                        xytext=(0, 3),
                         textcoords="offset points",
                         ha='center', va='bottom', fontsize=10, fontweight='bold')
 
@@ -843,20 +838,86 @@ def create_player_comparison_chart(p1_data, p2_data):
     ax.set_xticks(x)
     ax.set_xticklabels(labels, fontsize=12, fontweight='bold')
     ax.legend()
-    
+
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
     ax.spines['left'].set_visible(False)
     ax.get_yaxis().set_visible(False)
 
-    plt.tight_layout()
-    
-    save_dir = os.path.join('static', 'image', 'comparison')
-    if not os.path.exists(save_dir):
-        os.makedirs(save_dir)
-        
-    file_name = f"compare_{p1_data['Id']}_vs_{p2_data['Id']}.png"
-    plt.savefig(os.path.join(save_dir, file_name), transparent=True)
-    plt.close()
-    
-    return file_name
\ No newline at end of file
+    fig.tight_layout()
+    return fig
+
+# 차트 이름(/api/chart/<이름>과 같음) -> (그리기 함수, savefig 옵션)
+# DPI는 여기서 정하지 않고 크기 프로필(config.CHART_PROFILES)을 따릅니다.
+CHART_RENDERERS = {
+    'ranking': (_draw_ranking_graph, {}),
+    'radar': (_draw_team_radar_chart, {'transparent': True}),
+    'waa_table': (_draw_waa_table, {'bbox_inches': 'tight'}),
+    'record': (_draw_match_record, {'bbox_inches': 'tight'}),
+    'h2h': (_draw_h2h_heatmap, {'bbox_inches': 'tight'}),
+    'runs': (_draw_team_runs_chart, {'bbox_inches': 'tight', 'transparent': True}),
+    'pythagorean': (_draw_pythagorean_chart, {'bbox_inches': 'tight', 'transparent': True}),
+    'player_war': (_draw_player_war_chart, {'transparent': True}),
+    'player_offensive': (_draw_player_offensive_chart, {'bbox_inches': 'tight', 'transparent': True}),
+    'player_detail': (_draw_player_detail_chart, {'bbox_inches': 'tight', 'transparent': True}),
+    'compare': (_draw_player_comparison_chart, {'transparent': True}),
+}
+
+# 형식/프로필을 지정한 차트 이미지 (1차: 메모리 LRU, 2차: 형식별 디스크 캐시)
+# sweep()은 자기 형식이 아닌 파일을 지우므로 형식마다 하위 폴더를 따로 씁니다.
+_variant_memory_cache = LRUCache(config.CHART_VARIANT_MEMORY_CACHE_ITEMS, config.CHART_VARIANT_MEMORY_CACHE_BYTES)
+_variant_disk_caches = {
+    fmt: DiskCache(os.path.join(config.CHART_VARIANT_CACHE_DIR, fmt), prefix='chart_', suffix=f'.{fmt}',
+                   max_files=config.CHART_VARIANT_CACHE_MAX_FILES,
+                   max_bytes=config.CHART_VARIANT_CACHE_MAX_BYTES)
+    for fmt in chart_output.FORMATS
+}
+metrics.register_cache('variant_memory', _variant_memory_cache.stats)
+for _fmt, _cache in _variant_disk_caches.items():
+    metrics.register_cache(f'variant_disk_{_fmt}', _cache.stats)
+
+def chart_variant_key(chart, series, fmt, profile):
+    """차트 입력 값 + 형식 + 프로필로 만든 키 (ETag로도 사용)"""
+    return render_cache.make_key('variant', [chart, series, fmt, profile])
+
+def get_chart_variant(chart, series, fmt=None, profile=None):
+    """
+    차트를 지정한 형식/프로필로 그린 (bytes, 키)를 반환합니다.
+    같은 입력이면 메모리 LRU -> 디스크 캐시 순으로 찾고, 없을 때만 그립니다.
+    """
+    fmt = chart_output.resolve_format(fmt)
+    profile = chart_output.resolve_profile(profile)
+    key = chart_variant_key(chart, series, fmt, profile)
+
+    data = _variant_memory_cache.get(key)
+    if data is not None:
+        return data, key
+
+    def load():
+        disk = _variant_disk_caches[fmt]
+        data = disk.get(key)
+        if data is None:
+            apply_korean_font()
+            draw, savefig_kw = CHART_RENDERERS[chart]
+            with metrics.render_timer(chart):
+                data = chart_output.figure_bytes(draw(series), fmt, profile, **savefig_kw)
+            # 디스크 저장에 실패해도 이미 그린 이미지로 응답
+            try:
+                disk.put(key, data)
+            except OSError as e:
+                print(f"차트 형식별 디스크 캐시 저장 실패: {e}")
+        _variant_memory_cache.put(key, data)
+        return data
+
+    # 같은 차트/형식/프로필을 동시에 요청하면 한 번만 그림
+    return _render_flight.do(('variant', key), load), key
+
+def get_chart_variant_cache_stats():
+    """형식/프로필 차트 캐시(메모리, 형식별 디스크)의 통계"""
+    return {'memory': _variant_memory_cache.stats(),
+            'disk': {fmt: cache.stats() for fmt, cache in _variant_disk_caches.items()}}
+
+def sweep_chart_variant_cache():
+    """시작 시 형식/프로필 차트 디스크 캐시 폴더를 정리합니다."""
+    removed = sum(cache.sweep() for cache in _variant_disk_caches.values())
+    print(f"차트 형식별 캐시 정리: {removed}개 삭제")
@@ -0,0 +1,179 @@
+// [View] 브라우저 차트 렌더링 (config.CLIENT_SIDE_CHARTS = True일 때 사용)
+// 서버 PNG 차트와 같은 데이터(/api/chart/...)를 받아 Chart.js로 그립니다.
+// 사용법: <canvas data-chart="종류" data-src="/api/chart/..."></canvas>
+//         표(waa_table, record)는 <div data-chart=...>에 HTML 표로 그립니다.
+
+(function () {
+  const NAVY = "#002561";
+
+  function formatOffensive(metric, value) {
+    // wRC+는 정수, 나머지는 소수점 3자리
+    return metric === "wRC+" ? `${value}` : Number(value).toFixed(3);
+  }
+
+  const builders = {
+    // 메인페이지 - 순위 변동 그래프
+    ranking: (d) => ({
+      type: "line",
+      data: {
+        labels: d.labels,
+        datasets: d.teams.map((t) => ({
+          label: t.name,
+          data: t.rankings,
+          borderColor: t.color,
+          backgroundColor: t.color,
+          borderWidth: 2,
+        })),
+      },
+      options: {
+        scales: {
+          y: { reverse: true, min: 0.5, max: 10.5, ticks: { stepSize: 1, callback: (v) => (Number.isInteger(v) ? `${v}위` : "") } },
+        },
+      },
+    }),
+
+    // 팀페이지 - WAA 레이더 차트 (0~100 정규화 값, 라벨에 실제 값 표시)
+    radar: (d) => ({
+      type: "radar",
+      data: {
+        labels: d.labels.map((l, i) => [`${d.raw[i]}`, l]),
+        datasets: [{ data: d.normalized, borderColor: NAVY, backgroundColor: "rgba(0, 37, 97, 0.2)", borderWidth: 2 }],
+      },
+      options: {
+        plugins: { legend: { display: false } },
+        scales: { r: { min: 0, max: 100, ticks: { display: false, stepSize: 20 } } },
+      },
+    }),
+
+    // 팀페이지 - 득/실점 그래프
+    runs: (d) => ({
+      type: "bar",
+      data: { labels: d.labels, datasets: [{ data: d.values, backgroundColor: d.colors }] },
+      options: {
+        plugins: {
+          legend: { display: false },
+          title: {
+            display: true,
+            text: `득실 마진: ${d.margin > 0 ? "+" : ""}${d.margin.toFixed(2)}`,
+            color: d.margin < 0 ? "#d9534f" : "#5b7ece",
+          },
+        },
+        scales: { y: { display: false, beginAtZero: true } },
+      },
+    }),
+
+    // 팀페이지 - 기대 승률
+    pythagorean: (d) => ({
+      type: "bar",
+      data: { labels: d.labels, datasets: [{ data: d.values, backgroundColor: d.colors }] },
+      options: {
+        indexAxis: "y",
+        plugins: { legend: { display: false }, tooltip: { callbacks: { label: (c) => c.raw.toFixed(3) } } },
+        scales: { x: { display: false, min: 0, max: 1 } },
+      },
+    }),
+
+    // 선수 페이지 - WAR 도넛 그래프
+    player_war: (d) => ({
+      type: "doughnut",
+      data: { labels: d.labels, datasets: [{ data: d.sizes, backgroundColor: d.colors }] },
+      options: {
+        cutout: "60%",
+        plugins: { legend: { display: false }, title: { display: true, text: `총 기여도 (WAR) ${d.WAR}` } },
+      },
+    }),
+
+    // 선수 페이지 - 공격 효율성 (막대 길이 = 리그 백분위)
+    player_offensive: (d) => ({
+      type: "bar",
+      data: {
+        labels: d.labels.map((l, i) => `${l}  ${formatOffensive(d.metrics[i], d.values[i])} (${Math.round(d.ratios[i] * 100)}%)`),
+        datasets: [{ data: d.ratios, backgroundColor: d.colors }],
+      },
+      options: {
+        indexAxis: "y",
+        plugins: { legend: { display: false } },
+        scales: { x: { display: false, min: 0, max: 1 } },
+      },
+    }),
+
+    // 선수 페이지 - 타격 세부 기록
+    player_detail: (d) => ({
+      type: "line",
+      data: {
+        labels: d.labels,
+        datasets: [{ data: d.values, borderColor: NAVY, backgroundColor: "rgba(0, 37, 97, 0.1)", fill: true, borderWidth: 2 }],
+      },
+      options: { plugins: { legend: { display: false } }, scales: { y: { beginAtZero: true } } },
+    }),
+
+    // 선수-선수 페이지 - 이중 막대 그래프
+    compare: (d) => ({
+      type: "bar",
+      data: {
+        labels: d.labels,
+        datasets: d.players.map((p) => ({ label: p.Name, data: p.values, backgroundColor: p.color })),
+      },
+      options: { scales: { y: { display: false, beginAtZero: true } } },
+    }),
+  };
+
+  // 표 형태 데이터 (WAA 분석 표, 상대 전적 표)
+  function tableHtml(columns, rows) {
+    const head = columns.map((c) => `<th>${c}</th>`).join("");
+    const body = rows.map((r) => `<tr>${r.map((v) => `<td>${v}</td>`).join("")}</tr>`).join("");
+    return `<table class="chart-table"><thead><tr>${head}</tr></thead><tbody>${body}</tbody></table>`;
+  }
+
+  // 리그 전체 상대 전적: 칸 배경색 = 승률 (0.5 기준 빨강 우세 / 파랑 열세)
+  function h2hHtml(d) {
+    const head = `<th></th>${d.teams.map((t) => `<th>vs ${t}</th>`).join("")}`;
+    const body = d.teams
+      .map((team, i) => {
+        const cells = d.teams.map((_, j) => {
+          if (d.W[i][j] === null) return '<td style="background:#eee"></td>';
+          const pct = d.PCT[i][j];
+          const alpha = pct === null ? 0 : Math.min(Math.abs(pct - 0.5) * 2.5, 1);
+          const rgb = pct !== null && pct >= 0.5 ? "217, 83, 79" : "91, 126, 206";
+          const pctText = pct === null ? "" : `<br>${pct.toFixed(3)}`;
+          return `<td style="background: rgba(${rgb}, ${alpha})">${d.W[i][j]}-${d.L[i][j]}-${d.D[i][j]}${pctText}</td>`;
+        });
+        return `<tr><th>${team}</th>${cells.join("")}</tr>`;
+      })
+      .join("");
+    return `<table class="chart-table"><thead><tr>${head}</tr></thead><tbody>${body}</tbody></table>`;
+  }
+
+  const tables = {
+    waa_table: (d) => tableHtml(d.columns, d.rows.map(([label, waa, rank]) => [label, waa, `${rank}위`])),
+    record: (d) => tableHtml(d.columns, [d.row]),
+    h2h: h2hHtml,
+  };
+
+  const charts = new WeakMap(); // 같은 canvas에 다시 그릴 때 기존 차트 정리
+
+  async function render(el, type, src) {
+    type = type || el.dataset.chart;
+    src = src || el.dataset.src;
+    const res = await fetch(src);
+    if (!res.ok) {
+      el.replaceWith(document.createTextNode("차트 데이터를 불러오지 못했습니다."));
+      return;
+    }
+    const data = await res.json();
+
+    if (tables[type]) {
+      el.innerHTML = tables[type](data);
+      return;
+    }
+    if (charts.has(el)) charts.get(el).destroy();
+    charts.set(el, new Chart(el, builders[type](data)));
+  }
+
+  function renderAll(root) {
+    (root || document).querySelectorAll("[data-chart][data-src]").forEach((el) => render(el));
+  }
+
+  window.KBOCharts = { render, renderAll };
+  document.addEventListener("DOMContentLoaded", () => renderAll());
+})();
@@ -0,0 +1,33 @@
+// [View] 백그라운드 렌더링 중인 차트 이미지 교체
+// 사용법: <img src="자리 표시 이미지" data-render-src="실제 이미지" data-render-status="/api/render/status?file=...">
+// 상태가 ready가 될 때까지 주기적으로 확인하고, 준비되면 실제 이미지로 바꿉니다.
+
+(function () {
+  const INTERVAL_MS = 500;
+  const MAX_INTERVAL_MS = 4000;
+  const MAX_TRIES = 30;
+
+  function poll(img, tries, interval) {
+    fetch(img.dataset.renderStatus, { cache: "no-store" })
+      .then((res) => res.json())
+      .then((data) => {
+        if (data.status === "ready") {
+          // 이전에 캐시된 같은 주소의 이미지를 쓰지 않도록
+          img.src = `${img.dataset.renderSrc}?v=${Date.now()}`;
+        } else if (data.status === "pending" && tries < MAX_TRIES) {
+          setTimeout(() => poll(img, tries + 1, Math.min(interval * 1.5, MAX_INTERVAL_MS)), interval);
+        } else {
+          img.alt = `${img.alt} (차트를 불러오지 못했습니다)`;
+        }
+      })
+      .catch(() => {
+        if (tries < MAX_TRIES) {
+          setTimeout(() => poll(img, tries + 1, MAX_INTERVAL_MS), MAX_INTERVAL_MS);
+        }
+      });
+  }
+
+  document.addEventListener("DOMContentLoaded", () => {
+    document.querySelectorAll("img[data-render-status]").forEach((img) => poll(img, 0, INTERVAL_MS));
+  });
+})();